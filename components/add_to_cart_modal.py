@@ -1,16 +1,20 @@
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 
 
-class AddToCartModal:
+class AddToCartModalBase:
+    """Selectors shared by ``AddToCartModal`` and its async twin."""
+
     _MODAL = ".modal-content"
     _VIEW_CART_BTN = 'a[href="/view_cart"]'
     _CONTINUE_SHOPPING_BTN = (
         'button.btn.btn-success.close-modal.btn-block[data-dismiss="modal"]'
     )
 
-    def __init__(self, page: Page):
+    def __init__(self, page):
         self.page = page
 
+
+class AddToCartModal(AddToCartModalBase):
     def wait_until_visible(self, timeout=5000):
         """Wait for modal to be visible."""
         expect(self.page.locator(self._MODAL)).to_be_visible(timeout=timeout)
@@ -0,0 +1,61 @@
+"""``playwright.async_api`` twins of the components.
+
+Each class inherits its selectors from the base its sync counterpart uses, so
+the two cannot drift apart; only the methods that talk to the browser are
+written again, with ``await``.
+"""
+
+from playwright.async_api import TimeoutError, expect
+
+from components.add_to_cart_modal import AddToCartModalBase
+from components.consent_popup import ConsentPopupBase, get_consent_stats
+
+
+class AddToCartModal(AddToCartModalBase):
+    async def wait_until_visible(self, timeout=5000):
+        """Wait for modal to be visible."""
+        await expect(self.page.locator(self._MODAL)).to_be_visible(timeout=timeout)
+
+    async def click_continue_shopping(self):
+        """Click 'Continue Shopping' button on modal."""
+        await (
+            self.page.locator(self._MODAL).locator(self._CONTINUE_SHOPPING_BTN).click()
+        )
+
+    async def click_view_cart(self):
+        """Click 'View Cart' link in modal."""
+        await self.page.locator(self._MODAL).locator(self._VIEW_CART_BTN).click()
+
+    async def wait_until_invisible(self, timeout=5000):
+        """Wait for modal to be invisible."""
+        await expect(self.page.locator(self._MODAL)).to_be_hidden(timeout=timeout)
+
+
+class ConsentPopup(ConsentPopupBase):
+    async def accept(self, timeout=None):
+        """Click consent if present; waits up to ``timeout`` ms (default: only
+        if it is on the page right now)."""
+        stats = get_consent_stats()
+        stats.checks += 1
+        button = self.page.locator(self._CONSENT_BTN)
+        if timeout is None:
+            if not await button.is_visible():
+                return
+            await button.click()
+        else:
+            try:
+                await button.click(timeout=timeout)
+            except TimeoutError:
+                return
+        stats.clicked += 1
+
+    async def dismiss_when_shown(self):
+        """Click consent whenever the popup blocks an action on this page."""
+        await self.page.add_locator_handler(
+            self.page.locator(self._CONSENT_BTN), self._on_popup
+        )
+
+    @staticmethod
+    async def _on_popup(button):
+        await button.click()
+        get_consent_stats().handled += 1
@@ -1,15 +1,104 @@
-from playwright.sync_api import Page, TimeoutError
+from dataclasses import dataclass
+from pathlib import Path
 
+from playwright.sync_api import Browser, TimeoutError
+
+from utils.stats import SummedStats
+
+# How long tests used to block on every accept() when no popup showed up
+CONSENT_TIMEOUT_MS = 5000
+
+
+@dataclass
+class ConsentStats(SummedStats):
+    TITLE = "Consent"
+
+    checks: int = 0  # accept() calls
+    clicked: int = 0  # accept() found the popup and clicked it
+    handled: int = 0  # the locator handler dismissed a late popup
+    captured: int = 0  # storage states captured (one per run)
+
+    @property
+    def saved_seconds(self) -> float:
+        """Wall time the old blocking accept() would have spent waiting."""
+        return (self.checks - self.clicked) * CONSENT_TIMEOUT_MS / 1000
+
+    def summary(self) -> str | None:
+        if not self.checks and not self.handled:
+            return None
+        return (
+            f"state captured {self.captured}x; popup clicked {self.clicked}x on "
+            f"load, {self.handled}x by the handler; {self.checks - self.clicked} "
+            f"blocking waits skipped (~{self.saved_seconds:.0f}s saved)"
+        )
+
+
+_stats = ConsentStats()
+
+
+def get_consent_stats() -> ConsentStats:
+    return _stats
+
+
+class ConsentPopupBase:
+    """Selector shared by ``ConsentPopup`` and its async twin."""
 
-class ConsentPopup:
     _CONSENT_BTN = 'button[class*="fc-primary-button"][aria-label="Consent"]'
 
-    def __init__(self, page: Page):
+    def __init__(self, page):
         self.page = page
 
-    def accept(self, timeout=5000):
-        """Click consent if present; ignore if not found."""
+
+class ConsentPopup(ConsentPopupBase):
+    def accept(self, timeout=None):
+        """Click consent if present; ignore if not found.
+
+        Waits up to ``timeout`` ms for the popup; by default only a popup that
+        is on the page right now is clicked. Contexts start with the consent
+        already given (``capture_consent_state``) and a popup that shows up
+        later is dismissed by ``dismiss_when_shown``.
+        """
+        _stats.checks += 1
+        button = self.page.locator(self._CONSENT_BTN)
+        if timeout is None:
+            if not button.is_visible():
+                return
+            button.click()
+        else:
+            try:
+                button.click(timeout=timeout)
+            except TimeoutError:
+                return
+        _stats.clicked += 1
+
+    def dismiss_when_shown(self):
+        """Click consent whenever the popup blocks an action on this page."""
+        self.page.add_locator_handler(
+            self.page.locator(self._CONSENT_BTN), self._on_popup
+        )
+
+    @staticmethod
+    def _on_popup(button):
+        button.click()
+        _stats.handled += 1
+
+
+def capture_consent_state(browser: Browser, address: str, path: Path) -> Path:
+    """Accept consent once in a fresh context and save its cookies and
+    localStorage to ``path`` for ``browser.new_context(storage_state=...)``.
+    """
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(address)
+        button = page.locator(ConsentPopup._CONSENT_BTN)
         try:
-            self.page.locator(self._CONSENT_BTN).click(timeout=timeout)
+            button.click(timeout=CONSENT_TIMEOUT_MS)
+            button.wait_for(state="hidden")
         except TimeoutError:
-            pass
+            pass  # No popup for this site/region: save the state anyway
+        context.storage_state(path=path)
+        _stats.captured += 1
+    finally:
+        context.close()
+    return path
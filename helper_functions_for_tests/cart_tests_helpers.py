@@ -3,9 +3,10 @@ from dataclasses import dataclass
 
 from playwright.sync_api import Page
 
-from pages.cart import CartPage
+from pages.cart import CartPage, CartSnapshot
 from pages.main_page import FeaturesItems, NavMenu
 from pages.product_details_page import ProductDetailsPage
+from utils.readiness import navigate
 
 
 @dataclass
@@ -41,10 +42,44 @@ def add_from_details(
     price = details.get_price()
     details.add_to_cart(close_modal=close_modal)
     if back_to_main:
-        page.goto(os.environ.get("ADDRESS"))
+        navigate(page, os.environ.get("ADDRESS"), ready=FeaturesItems.READY)
     return ProductInfo(name=prod_name, price=price, idx=idx, qty=qty)
 
 
+# Same requests the site's addToCart() sends, one after another: concurrent
+# adds to one session would overwrite each other's cart
+_SEED_JS = """async (urls) => {
+    const statuses = [];
+    for (const url of urls) {
+        statuses.push((await fetch(url, {credentials: "same-origin"})).status);
+    }
+    return statuses;
+}"""
+
+
+def seed_cart(page: Page, items) -> list[ProductInfo]:
+    """
+    Put products in the cart without going through the UI add path.
+
+    items: list of (idx, qty) of main page cards; the page must show them.
+    The add-to-cart requests run inside the page, so they share its session
+    cookie and go through the context's routes (HAR replay, blocking profiles).
+    Returns the same ProductInfo objects add_from_main/add_from_details do.
+    """
+    catalog = FeaturesItems(page).catalog()
+    products, urls = [], []
+    for idx, qty in items:
+        card = catalog.by_index(idx)
+        products.append(ProductInfo(name=card.name, price=card.price, idx=idx, qty=qty))
+        urls.append(f"/add_to_cart/{card.id}?quantity={qty}")
+    statuses = page.evaluate(_SEED_JS, urls)
+    failed = [
+        f"{url} -> {status}" for url, status in zip(urls, statuses) if status >= 400
+    ]
+    assert not failed, "Seeding the cart failed:\n" + "\n".join(failed)
+    return products
+
+
 def open_cart(page: Page) -> CartPage:
     NavMenu(page).click_nav_btn(NavMenu.CART_BTN)
     return CartPage(page)
@@ -53,61 +88,84 @@ def open_cart(page: Page) -> CartPage:
 # Assertions
 
 
-def norm(string):
-    """Normalize whitespaces for better name comparison."""
-    return " ".join(str(string).split())
+@dataclass(frozen=True)
+class CartMismatch:
+    check: str  # "missing", "quantity", "price", "line_total" or "total"
+    name: str
+    expected: object
+    actual: object
+
+    def __str__(self) -> str:
+        if self.check == "missing":
+            return f"Product {self.name} not found in cart"
+        return (
+            f"{self.check} of {self.name}: expected {self.expected}, got {self.actual}"
+        )
+
+
+def verify_cart(cart: CartPage | CartSnapshot, products) -> list[CartMismatch]:
+    """
+    Check names, quantities, prices, line totals and the cart total in one pass
+    over a single cart snapshot.
+
+    products: list of (name, qty, price)
+    Returns every mismatch (empty list when the cart is as expected).
+    """
+    snapshot = cart.snapshot() if isinstance(cart, CartPage) else cart
+    mismatches = []
+    for name, qty, price in products:
+        row = snapshot.by_name(name)
+        if row is None:
+            mismatches.append(CartMismatch("missing", name, name, None))
+            continue
+        if row.quantity != qty:
+            mismatches.append(CartMismatch("quantity", name, qty, row.quantity))
+        if row.price != price:
+            mismatches.append(CartMismatch("price", name, price, row.price))
+        if row.total != qty * price:
+            mismatches.append(CartMismatch("line_total", name, qty * price, row.total))
+    expected_total = sum(qty * price for (_, qty, price) in products)
+    if snapshot.total != expected_total:
+        mismatches.append(CartMismatch("total", "cart", expected_total, snapshot.total))
+    return mismatches
+
+
+def _assert_no_mismatch(mismatches, checks):
+    failed = [m for m in mismatches if m.check in checks]
+    assert not failed, "Cart mismatch:\n" + "\n".join(str(m) for m in failed)
 
 
 def assert_cart_row_names(cart: CartPage, expected_names):
-    rows = cart.get_all_rows()
-    cart_names = {norm(r.name) for r in rows}
-    for name in expected_names:
-        assert norm(name) in cart_names, f"Product {name} not found in cart"
+    products = [(name, 0, 0) for name in expected_names]
+    _assert_no_mismatch(verify_cart(cart, products), {"missing"})
 
 
 def assert_cart_row_quantities(cart: CartPage, products):
-    rows = cart.get_all_rows()
-    for name, qty in products:
-        row = next((r for r in rows if norm(r.name) == norm(name)), None)
-        assert row, f"Product {name} not found in cart"
-        assert (
-            row.quantity == qty
-        ), f"Expected quantity {qty} for {name}, got {row.quantity}"
+    snapshot = cart.snapshot()
+    # Prices are not checked here, so expect whatever the row shows
+    expected = [
+        (name, qty, getattr(snapshot.by_name(name), "price", 0))
+        for name, qty in products
+    ]
+    _assert_no_mismatch(verify_cart(snapshot, expected), {"missing", "quantity"})
 
 
 def assert_cart_row_prices(cart: CartPage, products):
-    rows = cart.get_all_rows()
-    for name, _, price in products:
-        row = next((r for r in rows if norm(r.name) == norm(name)), None)
-        assert row, f"Product {name} not found in cart"
-        assert row.price == price, f"Expected price {price} for {name}, got {row.price}"
+    _assert_no_mismatch(verify_cart(cart, products), {"missing", "price"})
 
 
 def assert_cart_row_line_totals(cart: CartPage, products):
-    rows = cart.get_all_rows()
-    for name, qty, price in products:
-        row = next((r for r in rows if norm(r.name) == norm(name)), None)
-        assert row, f"Product {name} not found in cart"
-        expected_line_total = qty * price
-        assert (
-            row.total == expected_line_total
-        ), f"Line total mismatch for {name}: {row.total} != {price} * {qty}"
+    _assert_no_mismatch(verify_cart(cart, products), {"missing", "line_total"})
 
 
 def assert_cart_total(cart: CartPage, products):
-    expected_total = sum(qty * price for (_, qty, price) in products)
-    actual_total = cart.get_total_cart_value()
-    assert (
-        actual_total == expected_total
-    ), f"Cart total mismatch: {actual_total} != {expected_total}"
+    _assert_no_mismatch(verify_cart(cart, products), {"total"})
 
 
 def assert_cart_all(cart: CartPage, products):
     """
     products: list of (name, qty, price)
+    Reports every mismatch at once instead of stopping at the first one.
     """
-    assert_cart_row_names(cart, [name for name, _, _ in products])
-    assert_cart_row_quantities(cart, [(name, qty) for name, qty, _ in products])
-    assert_cart_row_prices(cart, products)
-    assert_cart_row_line_totals(cart, products)
-    assert_cart_total(cart, products)
+    mismatches = verify_cart(cart, products)
+    assert not mismatches, "Cart mismatch:\n" + "\n".join(str(m) for m in mismatches)
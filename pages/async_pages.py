@@ -0,0 +1,235 @@
+"""``playwright.async_api`` twins of the page objects.
+
+Each class inherits selectors, locator builders and result parsing from the
+base its sync counterpart uses (``NavMenuBase``, ``FeaturesItemsBase``, ...),
+so a selector is defined once for both APIs. Only the methods that talk to
+the browser are written again, with ``await``. The ``async_ui`` fixture runs
+them on an event loop of their own, several pages at a time.
+"""
+
+import os
+from dataclasses import dataclass
+
+from playwright.async_api import Locator, Page, expect
+
+from components.async_components import AddToCartModal, ConsentPopup
+from pages.cart import CartLine, CartPageBase, CartSnapshot, ProductRowBase
+from pages.delete_account_page import DeleteAccountPageBase
+from pages.login_page import LoginPageBase
+from pages.main_page import Catalog, FeaturesItemsBase, NavMenuBase
+from pages.product_details_page import ProductDetails, ProductDetailsPageBase
+from utils.readiness import navigate_async
+
+
+class NavMenu(NavMenuBase):
+    async def click_nav_btn(self, btn_selector: str):
+        await self.page.locator(btn_selector).click()
+
+    async def is_logged_in(self):
+        await expect(self.page.locator(self.LOGOUT_BTN)).to_be_visible(timeout=5000)
+        await expect(self.page.locator(self.DELETE_ACCOUNT_BTN)).to_be_visible(
+            timeout=5000
+        )
+
+    async def is_logged_out(self):
+        await expect(self.page.locator(self.LOGOUT_BTN)).not_to_be_visible()
+        await expect(self.page.locator(self.DELETE_ACCOUNT_BTN)).not_to_be_visible()
+
+
+class FeaturesItems(FeaturesItemsBase):
+    async def load(self):
+        """Open the home page (``ADDRESS``) and handle consent."""
+        await navigate_async(self.page, os.environ["ADDRESS"], ready=self.READY)
+        await ConsentPopup(self.page).accept()
+
+    async def catalog(self) -> Catalog:
+        """Every card in one evaluation, cached until the page navigates."""
+        catalog = self._cached_catalog()
+        if catalog is None:
+            cards = self.page.locator(self._COMPONENT).locator(self._PRODUCT_CARDS)
+            await self.page.wait_for_load_state("domcontentloaded")
+            await expect(cards.first).to_be_attached()
+            raw_cards = await cards.evaluate_all(
+                self._CATALOG_JS, self._catalog_selectors()
+            )
+            catalog = self._store_catalog(raw_cards)
+        return catalog
+
+    async def cards(self) -> list[Locator]:
+        return (
+            await self.page.locator(self._COMPONENT).locator(self._PRODUCT_CARDS).all()
+        )
+
+    async def view_product(self, index=0):
+        await self.card(index).locator(self._VIEW_PRODUCT_BTN).click()
+
+    async def add_to_cart_by_hover(self, index, close_modal=True):
+        card = self.card(index)
+        await card.hover()
+        await expect(card.locator(self._PRODUCT_OVERLAY)).to_be_visible()
+        await card.locator(self._ADD_TO_CART_BTN).click()
+
+        modal = AddToCartModal(self.page)
+        await modal.wait_until_visible()
+        if close_modal:
+            await modal.click_continue_shopping()
+            await modal.wait_until_invisible()
+
+    async def add_to_cart_and_view_cart(self, index=0):
+        card = self.card(index)
+        await card.hover()
+        await expect(card.locator(self._PRODUCT_OVERLAY)).to_be_visible()
+        await card.locator(self._ADD_TO_CART_BTN).click()
+
+        modal = AddToCartModal(self.page)
+        await modal.wait_until_visible()
+        await modal.click_view_cart()
+
+    async def get_product_name(self, index=0) -> str:
+        return (await self.catalog()).by_index(index).name
+
+    async def get_product_detail_url(self, index=0) -> str:
+        return (await self.catalog()).by_index(index).detail_url
+
+    async def get_product_price(self, index=0) -> int:
+        return (await self.catalog()).by_index(index).price
+
+
+@dataclass
+class ProductRow(ProductRowBase):
+    row_locator: Locator
+    line: CartLine = None  # snapshot values, see pages.cart.ProductRow
+
+    async def name(self) -> str:
+        if self.line is not None:
+            return self.line.name
+        return (await self.row_locator.locator(self._NAME).inner_text()).strip()
+
+    async def price(self) -> int:
+        if self.line is not None:
+            return self.line.price
+        return self._parse_price(
+            await self.row_locator.locator(self._PRICE).inner_text()
+        )
+
+    async def quantity(self) -> int:
+        if self.line is not None:
+            return self.line.quantity
+        return int(await self.row_locator.locator(self._QUANTITY).inner_text())
+
+    async def total(self) -> int:
+        if self.line is not None:
+            return self.line.total
+        return self._parse_price(
+            await self.row_locator.locator(self._TOTAL).inner_text()
+        )
+
+    async def delete(self) -> None:
+        await self.row_locator.locator(self._DELETE_BTN).click()
+        self.line = None
+
+
+@dataclass
+class CartPage(CartPageBase):
+    page: Page
+
+    async def load(self):
+        await navigate_async(
+            self.page, f"{os.environ['ADDRESS']}/view_cart", ready=self.READY
+        )
+
+    async def snapshot(self) -> CartSnapshot:
+        """Read all rows with a single ``evaluate``."""
+        return self._parse_snapshot(
+            await self._rows().evaluate_all(self._SNAPSHOT_JS, self._SNAPSHOT_SELECTORS)
+        )
+
+    def get_product_row(
+        self, product_id: int, snapshot: CartSnapshot = None
+    ) -> ProductRow:
+        line = snapshot.by_id(product_id) if snapshot is not None else None
+        return ProductRow(self._row(product_id), line)
+
+    async def get_all_rows(self, snapshot: CartSnapshot = None) -> list[ProductRow]:
+        if snapshot is not None:
+            return [ProductRow(self._row(line.id), line) for line in snapshot]
+        return [ProductRow(row) for row in await self._rows().all()]
+
+    async def get_product_ids(self, snapshot: CartSnapshot = None) -> list[int]:
+        return (snapshot if snapshot is not None else await self.snapshot()).ids
+
+    async def get_total_cart_value(self, snapshot: CartSnapshot = None) -> int:
+        return (snapshot if snapshot is not None else await self.snapshot()).total
+
+
+class ProductDetailsPage(ProductDetailsPageBase):
+    async def info(self) -> ProductDetails:
+        """Name, price, quantity and every labelled field in one evaluation."""
+        return self._parse_info(await self.component.evaluate(self._INFO_JS))
+
+    async def set_quantity(self, qty: int) -> int:
+        await self.quantity_input.fill(str(qty))
+        return int(await self.quantity_input.input_value())
+
+    async def fill_input_with_characters(self, qty):
+        await self.quantity_input.clear()
+        await self.quantity_input.press_sequentially(str(qty))
+        return await self.quantity_input.input_value()
+
+    async def get_quantity(self) -> int:
+        return int(await self.quantity_input.input_value())
+
+    async def add_to_cart(self, close_modal=True):
+        await self.add_to_cart_btn.click()
+        modal = AddToCartModal(self.page)
+        await modal.wait_until_visible()
+        if close_modal:
+            await modal.click_continue_shopping()
+
+    async def add_to_cart_and_view_cart(self):
+        await self.add_to_cart_btn.click()
+        modal = AddToCartModal(self.page)
+        await modal.wait_until_visible()
+        await modal.click_view_cart()
+
+
+class LoginPage(LoginPageBase):
+    async def load(self):
+        await navigate_async(self.page, self.URL, ready=self.READY)
+        await ConsentPopup(self.page).accept()
+        await expect(self.page.locator(self._EMAIL_INPUT)).to_be_visible()
+
+    async def login(self, email, password):
+        await self.page.locator(self._EMAIL_INPUT).fill(email)
+        await self.page.locator(self._PASSWORD_INPUT).fill(password)
+        await self.page.locator(self._LOGIN_BUTTON).click()
+        await self.is_logged_in()
+
+    async def signup(self, name, email):
+        await self.page.locator(self._SIGNUP_NAME_INPUT).fill(name)
+        await self.page.locator(self._SIGNUP_EMAIL_INPUT).fill(email)
+        await self.page.locator(self._SIGNUP_BUTTON).click()
+
+    async def is_logged_in(self):
+        await NavMenu(self.page).is_logged_in()
+        await expect(self.page).to_have_url(f"{os.environ.get('ADDRESS')}/")
+
+    async def not_logged_in(self):
+        await NavMenu(self.page).is_logged_out()
+
+    async def logout(self):
+        await NavMenu(self.page).click_nav_btn(NavMenu.LOGOUT_BTN)
+        await expect(self.page).to_have_url(self.URL)
+
+
+class DeleteAccountPage(DeleteAccountPageBase):
+    async def delete_account_and_continue(self, click=True):
+        address = os.environ.get("ADDRESS")
+        await NavMenu(self.page).click_nav_btn(NavMenu.DELETE_ACCOUNT_BTN)
+        await expect(self.page).to_have_url(f"{address}/delete_account")
+        header = self.page.locator(self._ACCOUNT_DELETED_HEADER)
+        await expect(header).to_be_visible()
+        await expect(header).to_have_text("Account Deleted!")
+        if click:
+            await self.page.locator(self._CONTINUE_BTN).click()
+            await expect(self.page).to_have_url(f"{address}/")
@@ -3,9 +3,70 @@ from dataclasses import dataclass
 from playwright.sync_api import Locator, Page
 
 
-@dataclass
-class ProductRow:
-    row_locator: Locator
+def normalize_name(name) -> str:
+    """Collapse whitespace so names compare equal however the page wraps them."""
+    return " ".join(str(name).split())
+
+
+class CartLine:
+    """One cart row as read by ``CartPage.snapshot()``; immutable."""
+
+    __slots__ = ("id", "name", "category", "price", "quantity", "total")
+
+    def __init__(self, id, name, category, price, quantity, total):
+        for slot, value in zip(
+            self.__slots__, (id, name, category, price, quantity, total)
+        ):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return (
+            f"CartLine(id={self.id}, name={self.name!r}, price={self.price}, "
+            f"quantity={self.quantity}, total={self.total})"
+        )
+
+
+class CartSnapshot:
+    """All cart rows at one moment, indexed by product id and normalized name."""
+
+    __slots__ = ("lines", "_by_id", "_by_name")
+
+    def __init__(self, lines):
+        object.__setattr__(self, "lines", tuple(lines))
+        object.__setattr__(self, "_by_id", {line.id: line for line in self.lines})
+        object.__setattr__(
+            self, "_by_name", {normalize_name(line.name): line for line in self.lines}
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def by_id(self, product_id: int) -> CartLine | None:
+        return self._by_id.get(product_id)
+
+    def by_name(self, name: str) -> CartLine | None:
+        return self._by_name.get(normalize_name(name))
+
+    @property
+    def ids(self) -> list[int]:
+        return [line.id for line in self.lines]
+
+    @property
+    def total(self) -> int:
+        return sum(line.total for line in self.lines)
+
+
+class ProductRowBase:
+    """Selectors shared by ``ProductRow`` and its async twin."""
 
     # Class-level constants for selectors
     _NAME = ".cart_description h4 a"
@@ -16,43 +77,72 @@ class ProductRow:
     _DELETE_BTN = ".cart_quantity_delete"
     _INPUT = "input[type='number'], input"
 
+    @staticmethod
+    def _parse_price(text: str) -> int:
+        """Parse price text like 'Rs. 1,234' into integer 1234."""
+        return int(text.replace("Rs. ", "").replace(",", "").strip())
+
+
+@dataclass
+class ProductRow(ProductRowBase):
+    """One cart row. With ``line`` (from ``CartPage.snapshot()``) the getters
+    return the snapshot's values without a browser round-trip; changing the
+    row drops it, so later reads go to the page again.
+    """
+
+    row_locator: Locator
+    line: CartLine = None
+
     @property
     def name(self) -> str:
         """Get product name."""
+        if self.line is not None:
+            return self.line.name
         return self.row_locator.locator(self._NAME).inner_text().strip()
 
     @property
     def category(self) -> str:
         """Get product category."""
+        if self.line is not None:
+            return self.line.category
         return self.row_locator.locator(self._CATEGORY).inner_text().strip()
 
     @property
     def price(self) -> int:
         """Get product price in Rs."""
+        if self.line is not None:
+            return self.line.price
         txt = self.row_locator.locator(self._PRICE).inner_text()
         return self._parse_price(txt)
 
     @property
     def quantity(self) -> int:
         """Get product quantity."""
+        if self.line is not None:
+            return self.line.quantity
         txt = self.row_locator.locator(self._QUANTITY).inner_text().strip()
         return int(txt)
 
     @property
     def total(self) -> int:
         """Get total price (price × quantity) in Rs."""
+        if self.line is not None:
+            return self.line.total
         txt = self.row_locator.locator(self._TOTAL).inner_text()
         return self._parse_price(txt)
 
     @property
     def id(self) -> int:
         """Get product ID from the row element."""
+        if self.line is not None:
+            return self.line.id
         product_id = self.row_locator.get_attribute("id")
         return int(product_id.replace("product-", ""))
 
     def delete(self) -> None:
         """Click the delete button to remove this product from cart."""
         self.row_locator.locator(self._DELETE_BTN).click()
+        self.line = None
 
     def set_quantity(self, value: int) -> None:
         """
@@ -63,38 +153,95 @@ class ProductRow:
         """
         input_elem = self.row_locator.locator(self._INPUT)
         input_elem.fill(str(value))
+        self.line = None
 
-    @staticmethod
-    def _parse_price(text: str) -> int:
-        """Parse price text like 'Rs. 1,234' into integer 1234."""
-        return int(text.replace("Rs. ", "").replace(",", "").strip())
 
-
-@dataclass
-class CartPage:
-    page: Page
+class CartPageBase:
+    """Selectors and snapshot parsing shared by ``CartPage`` and its async twin."""
 
     _TABLE = "table.table.table-condensed"
     _ROWS = "tr[id^='product-']"
+    READY = _TABLE
+
+    _SNAPSHOT_SELECTORS = {
+        "name": ProductRowBase._NAME,
+        "category": ProductRowBase._CATEGORY,
+        "price": ProductRowBase._PRICE,
+        "quantity": ProductRowBase._QUANTITY,
+        "total": ProductRowBase._TOTAL,
+    }
+
+    # Reads every row in one browser round-trip; selectors come from ProductRow
+    _SNAPSHOT_JS = """(rows, sel) => rows.map(row => {
+        const text = (selector) => {
+            const el = row.querySelector(selector);
+            return el ? el.innerText : "";
+        };
+        return {
+            id: row.id,
+            name: text(sel.name),
+            category: text(sel.category),
+            price: text(sel.price),
+            quantity: text(sel.quantity),
+            total: text(sel.total),
+        };
+    })"""
+
+    def _rows(self):
+        return self.page.locator(self._TABLE).locator(self._ROWS)
+
+    def _row(self, product_id: int):
+        return self.page.locator(self._TABLE).locator(f"tr#product-{product_id}")
 
-    def get_product_row(self, product_id: int) -> ProductRow:
-        row_locator = self.page.locator(self._TABLE).locator(f"tr#product-{product_id}")
-        return ProductRow(row_locator)
+    @staticmethod
+    def _parse_snapshot(raw_rows: list[dict]) -> CartSnapshot:
+        return CartSnapshot(
+            CartLine(
+                id=int(raw["id"].replace("product-", "")),
+                name=raw["name"].strip(),
+                category=raw["category"].strip(),
+                price=ProductRowBase._parse_price(raw["price"]),
+                quantity=int(raw["quantity"].strip()),
+                total=ProductRowBase._parse_price(raw["total"]),
+            )
+            for raw in raw_rows
+        )
 
-    def get_all_rows(self) -> list[ProductRow]:
-        return [
-            ProductRow(row)
-            for row in self.page.locator(self._TABLE).locator(self._ROWS).all()
-        ]
 
-    def get_product_ids(self) -> list[int]:
-        return [row.id for row in self.get_all_rows()]
+@dataclass
+class CartPage(CartPageBase):
+    page: Page
 
-    def assert_all_line_totals(self):
-        for row in self.get_all_rows():
+    def snapshot(self) -> CartSnapshot:
+        """Read all rows with a single ``evaluate`` instead of one call per cell."""
+        return self._parse_snapshot(
+            self._rows().evaluate_all(self._SNAPSHOT_JS, self._SNAPSHOT_SELECTORS)
+        )
+
+    def get_product_row(
+        self, product_id: int, snapshot: CartSnapshot = None
+    ) -> ProductRow:
+        """Row of ``product_id``; read from ``snapshot`` when one is given."""
+        line = snapshot.by_id(product_id) if snapshot is not None else None
+        return ProductRow(self._row(product_id), line)
+
+    def get_all_rows(self, snapshot: CartSnapshot = None) -> list[ProductRow]:
+        if snapshot is not None:
+            return [ProductRow(self._row(line.id), line) for line in snapshot]
+        return [ProductRow(row) for row in self._rows().all()]
+
+    def get_product_ids(self, snapshot: CartSnapshot = None) -> list[int]:
+        return self._current(snapshot).ids
+
+    def assert_all_line_totals(self, snapshot: CartSnapshot = None):
+        for row in self._current(snapshot):
             assert (
                 row.total == row.price * row.quantity
             ), f"Line total mismatch for id={row.id}: {row.total} != {row.price} * {row.quantity}"
 
-    def get_total_cart_value(self) -> int:
-        return sum(row.total for row in self.get_all_rows())
+    def get_total_cart_value(self, snapshot: CartSnapshot = None) -> int:
+        return self._current(snapshot).total
+
+    def _current(self, snapshot: CartSnapshot | None) -> CartSnapshot:
+        # An empty snapshot is falsy, so compare with None explicitly
+        return self.snapshot() if snapshot is None else snapshot
@@ -1,17 +1,21 @@
 import os
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 
 from pages.main_page import NavMenu
 
 
-class DeleteAccountPage:
+class DeleteAccountPageBase:
+    """Selectors shared by ``DeleteAccountPage`` and its async twin."""
+
     _ACCOUNT_DELETED_HEADER = 'h2[data-qa="account-deleted"]'
     _CONTINUE_BTN = 'a[data-qa="continue-button"]'
 
-    def __init__(self, page: Page):
+    def __init__(self, page):
         self.page = page
 
+
+class DeleteAccountPage(DeleteAccountPageBase):
     def delete_account_and_continue(self, click=True):
         # Click 'Delete Account' in nav
         NavMenu(self.page).click_nav_btn(NavMenu.DELETE_ACCOUNT_BTN)
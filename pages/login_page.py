@@ -1,12 +1,15 @@
 import os
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 
 from components.consent_popup import ConsentPopup
 from pages.main_page import NavMenu
+from utils.readiness import navigate
 
 
-class LoginPage:
+class LoginPageBase:
+    """URL and selectors shared by ``LoginPage`` and its async twin."""
+
     URL = f"{os.environ.get('ADDRESS')}/login"
 
     # Selectors for login form (left)
@@ -19,11 +22,15 @@ class LoginPage:
     _SIGNUP_EMAIL_INPUT = 'input[data-qa="signup-email"]'
     _SIGNUP_BUTTON = 'button[data-qa="signup-button"]'
 
-    def __init__(self, page: Page):
+    READY = _EMAIL_INPUT
+
+    def __init__(self, page):
         self.page = page
 
+
+class LoginPage(LoginPageBase):
     def load(self):
-        self.page.goto(self.URL)
+        navigate(self.page, self.URL, ready=self.READY)
         ConsentPopup(self.page).accept()  # Handles the popup if present
         expect(self.page.locator(self._EMAIL_INPUT)).to_be_visible()
 
@@ -1,8 +1,11 @@
+import re
 from typing import List
+from weakref import WeakKeyDictionary, WeakSet
 
 from playwright.sync_api import Locator, Page, expect
 
 from components.add_to_cart_modal import AddToCartModal
+from pages.cart import normalize_name
 
 
 class MainPage:
@@ -21,7 +24,9 @@ class MainPage:
         return self.page.locator('[name="search"]').is_visible()
 
 
-class NavMenu:
+class NavMenuBase:
+    """Selectors shared by ``NavMenu`` and its async twin in pages/async_pages.py."""
+
     HOME_BTN = '[class*="shop-menu"] a[href="/"]'
     PRODUCTS_BTN = '[class*="shop-menu"] a[href="/products"]'
     CART_BTN = '[class*="shop-menu"] a[href="/view_cart"]'
@@ -34,9 +39,11 @@ class NavMenu:
     DOWNLOAD_APP_BTN = '[class*="shop-menu"] a[href="/download_app"]'
     DELETE_ACCOUNT_BTN = '[class*="shop-menu"] a[href="/delete_account"]'
 
-    def __init__(self, page: Page):
+    def __init__(self, page):
         self.page = page
 
+
+class NavMenu(NavMenuBase):
     def click_nav_btn(self, btn_selector: str):
         """
         Click any navigation menu button.
@@ -53,7 +60,63 @@ class NavMenu:
         expect(self.page.locator(self.DELETE_ACCOUNT_BTN)).not_to_be_visible()
 
 
-class FeaturesItems:
+class CatalogCard:
+    """One product card as read by ``FeaturesItems.catalog()``; immutable."""
+
+    __slots__ = ("index", "id", "name", "price", "detail_url")
+
+    def __init__(self, index, id, name, price, detail_url):
+        for slot, value in zip(self.__slots__, (index, id, name, price, detail_url)):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return (
+            f"CatalogCard(index={self.index}, id={self.id}, name={self.name!r}, "
+            f"price={self.price})"
+        )
+
+
+class Catalog:
+    """All product cards of a page, indexed by position, product id and name."""
+
+    def __init__(self, cards):
+        self.cards = tuple(cards)
+        self._by_id = {card.id: card for card in self.cards}
+        # First card wins when the page lists a product twice
+        self._by_name = {}
+        for card in self.cards:
+            self._by_name.setdefault(normalize_name(card.name), card)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def by_index(self, index: int) -> CatalogCard:
+        return self.cards[index]
+
+    def by_id(self, product_id: int) -> CatalogCard | None:
+        return self._by_id.get(product_id)
+
+    def by_name(self, name: str) -> CatalogCard | None:
+        return self._by_name.get(normalize_name(name))
+
+
+# Catalog per page, dropped whenever its main frame navigates
+_CATALOGS: "WeakKeyDictionary[Page, Catalog]" = WeakKeyDictionary()
+_WATCHED_PAGES: "WeakSet[Page]" = WeakSet()
+_PRODUCT_ID = re.compile(r"/product_details/(\d+)")
+
+
+class FeaturesItemsBase:
+    """Selectors, locators and catalog parsing shared by ``FeaturesItems`` and
+    its async twin; building locators never waits, so it works for both APIs.
+    """
+
     _COMPONENT = ".features_items"
     _PRODUCT_CARDS = ".product-image-wrapper"
     _VIEW_PRODUCT_BTN = ".choose a[href*='product_details']"
@@ -61,20 +124,103 @@ class FeaturesItems:
     _PRODUCT_NAME = ".productinfo p"
     _PRODUCT_PRICE = ".productinfo h2"
     _PRODUCT_OVERLAY = ".overlay-content"
+    # Home page is usable once the product cards are in the DOM
+    READY = f"{_COMPONENT} {_PRODUCT_CARDS}"
 
-    def __init__(self, page: Page):
-        self.page = page
+    _CATALOG_JS = """(cards, sel) => cards.map(card => {
+        const name = card.querySelector(sel.name);
+        const price = card.querySelector(sel.price);
+        const link = card.querySelector(sel.link);
+        return {
+            name: name ? name.innerText : "",
+            price: price ? price.innerText : "",
+            href: link ? link.getAttribute("href") : "",
+        };
+    })"""
 
-    def cards(self) -> List[Locator]:
-        """Return all product cards as a list of locators."""
-        return self.page.locator(self._COMPONENT).locator(self._PRODUCT_CARDS).all()
+    def __init__(self, page):
+        self.page = page
 
-    def card(self, index=0) -> Locator:
+    def card(self, index=0):
         """Return a specific product card by index."""
         return (
             self.page.locator(self._COMPONENT).locator(self._PRODUCT_CARDS).nth(index)
         )
 
+    def _catalog_selectors(self) -> dict:
+        return {
+            "name": self._PRODUCT_NAME,
+            "price": self._PRODUCT_PRICE,
+            "link": self._VIEW_PRODUCT_BTN,
+        }
+
+    def _cached_catalog(self) -> Catalog | None:
+        return _CATALOGS.get(self.page)
+
+    def _store_catalog(self, raw_cards: list[dict]) -> Catalog:
+        """Parse ``_CATALOG_JS`` output and cache it until the page navigates;
+        an empty read (cards not rendered) is never cached."""
+        catalog = self._parse_catalog(raw_cards)
+        if catalog:
+            self._watch_navigation()
+            _CATALOGS[self.page] = catalog
+        return catalog
+
+    def _parse_catalog(self, raw_cards: list[dict]) -> Catalog:
+        cards = []
+        for index, raw in enumerate(raw_cards):
+            match = _PRODUCT_ID.search(raw["href"] or "")
+            cards.append(
+                CatalogCard(
+                    index=index,
+                    id=int(match.group(1)) if match else None,
+                    name=raw["name"].strip(),
+                    price=self._parse_price(raw["price"]),
+                    detail_url=raw["href"],
+                )
+            )
+        return Catalog(cards)
+
+    def _watch_navigation(self) -> None:
+        if self.page in _WATCHED_PAGES:
+            return
+        page = self.page
+
+        def invalidate(frame):
+            if frame == page.main_frame:
+                _CATALOGS.pop(page, None)
+
+        page.on("framenavigated", invalidate)
+        _WATCHED_PAGES.add(page)
+
+    @staticmethod
+    def _parse_price(text: str) -> int:
+        return int(text.replace("Rs. ", "").replace(",", "").strip())
+
+
+class FeaturesItems(FeaturesItemsBase):
+    def catalog(self) -> Catalog:
+        """
+        Name, price, detail URL and id of every card, read in one evaluation
+        and cached until the page navigates.
+        """
+        catalog = self._cached_catalog()
+        if catalog is None:
+            catalog = self._store_catalog(self._read_catalog())
+        return catalog
+
+    def _read_catalog(self) -> list[dict]:
+        cards = self.page.locator(self._COMPONENT).locator(self._PRODUCT_CARDS)
+        # evaluate_all does not wait: read once the server-rendered list is
+        # parsed, not the part of it that was in the DOM so far
+        self.page.wait_for_load_state("domcontentloaded")
+        expect(cards.first).to_be_attached()
+        return cards.evaluate_all(self._CATALOG_JS, self._catalog_selectors())
+
+    def cards(self) -> List[Locator]:
+        """Return all product cards as a list of locators."""
+        return self.page.locator(self._COMPONENT).locator(self._PRODUCT_CARDS).all()
+
     def view_product(self, index=0):
         self.card(index).locator(self._VIEW_PRODUCT_BTN).click()
 
@@ -101,15 +247,10 @@ class FeaturesItems:
         modal.click_view_cart()
 
     def get_product_name(self, index=0) -> str:
-        return self.card(index).locator(self._PRODUCT_NAME).inner_text().strip()
+        return self.catalog().by_index(index).name
 
     def get_product_detail_url(self, index=0) -> str:
-        return self.card(index).locator(self._VIEW_PRODUCT_BTN).get_attribute("href")
+        return self.catalog().by_index(index).detail_url
 
     def get_product_price(self, index=0) -> int:
-        price_text = self.card(index).locator(self._PRODUCT_PRICE).inner_text()
-        return self._parse_price(price_text)
-
-    @staticmethod
-    def _parse_price(text: str) -> int:
-        return int(text.replace("Rs. ", "").replace(",", "").strip())
+        return self.catalog().by_index(index).price
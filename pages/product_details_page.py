@@ -1,26 +1,85 @@
-from playwright.sync_api import Page
+from dataclasses import dataclass, field
 
 from components.add_to_cart_modal import AddToCartModal
 
 
-class ProductDetailsPage:
-    def __init__(self, page: Page):
+@dataclass(frozen=True)
+class ProductDetails:
+    name: str
+    price: int
+    quantity: int | None  # None when the input holds no integer
+    # Labelled <p> lines, e.g. {"Category": "Women > Tops", "Brand": "Polo"}
+    fields: dict = field(default_factory=dict)
+
+    def get(self, label: str) -> str:
+        return self.fields.get(label, "")
+
+
+class ProductDetailsPageBase:
+    """Locators and parsing shared by ``ProductDetailsPage`` and its async twin."""
+
+    _COMPONENT = ".product-information"
+    READY = _COMPONENT
+
+    # Reads the whole .product-information block in one round-trip
+    _INFO_JS = """(root) => {
+        const name = root.querySelector("h2");
+        const price = root.querySelector("span span");
+        const quantity = root.querySelector("input#quantity");
+        return {
+            name: name ? name.innerText : "",
+            price: price ? price.innerText : "",
+            quantity: quantity ? quantity.value : "",
+            paragraphs: Array.from(root.querySelectorAll("p"), p => p.innerText),
+        };
+    }"""
+
+    def __init__(self, page):
         self.page = page
-        self.component = page.locator(".product-information")
+        self.component = page.locator(self._COMPONENT)
         self.name_locator = self.component.locator("h2")
         self.price_locator = self.component.locator("span span")
         self.quantity_input = self.component.locator("input#quantity")
         self.add_to_cart_btn = self.component.locator("button.cart")
 
+    @classmethod
+    def _parse_info(cls, raw: dict) -> ProductDetails:
+        fields = {}
+        for text in raw["paragraphs"]:
+            label, sep, value = text.partition(":")
+            if sep:
+                fields.setdefault(label.strip(), value.strip())
+        quantity = raw["quantity"].strip()
+        return ProductDetails(
+            name=raw["name"].strip(),
+            price=cls._parse_price(raw["price"]),
+            quantity=int(quantity) if quantity.lstrip("-").isdigit() else None,
+            fields=fields,
+        )
+
+    @staticmethod
+    def _parse_price(text: str) -> int:
+        return int(text.replace("Rs.", "").replace(",", "").strip())
+
+
+class ProductDetailsPage(ProductDetailsPageBase):
+    def info(self) -> ProductDetails:
+        """Name, price, quantity and every labelled field in one evaluation."""
+        return self._parse_info(self.component.evaluate(self._INFO_JS))
+
     def get_name(self) -> str:
-        return self.name_locator.inner_text().strip()
+        return self.info().name
 
     def get_price(self) -> int:
-        price_text = self.price_locator.inner_text().strip()
-        return int(price_text.replace("Rs.", "").replace(",", "").strip())
+        return self.info().price
 
     def _get_info_field(self, label: str) -> str:
-        """Return info value from <p> like 'Availability', 'Condition', 'Brand', 'Category'."""
+        """Return info value from <p> like 'Availability', 'Condition', 'Brand', 'Category'.
+
+        Scans every <p> with separate round-trips. Kept as the per-field
+        baseline that test_info_matches_per_field_reads
+        (tests/ui/test_product_details.py) checks and times info() against.
+        """
         p_tags = self.component.locator("p").all()
         for p in p_tags:
             if label in p.inner_text():
@@ -29,16 +88,16 @@ class ProductDetailsPage:
         return ""
 
     def get_category(self) -> str:
-        return self._get_info_field("Category")
+        return self.info().get("Category")
 
     def get_availability(self) -> str:
-        return self._get_info_field("Availability")
+        return self.info().get("Availability")
 
     def get_condition(self) -> str:
-        return self._get_info_field("Condition")
+        return self.info().get("Condition")
 
     def get_brand(self) -> str:
-        return self._get_info_field("Brand")
+        return self.info().get("Brand")
 
     def set_quantity(self, qty: int) -> int:
         self.quantity_input.fill(str(qty))
@@ -85,7 +85,7 @@ PYTEST_ARGS=(-v --color=yes)
 [ "$HEADED" = true ] && PYTEST_ARGS+=( --headed )
 [ "$TRACING" = true ] && PYTEST_ARGS+=( --tracing=retain-on-failure --output=tests/artifacts )
 PYTEST_ARGS+=( --browser "$BROWSER" )
-PYTEST_ARGS+=( -n "$WORKERS" --reruns "$RERUNS" )
+PYTEST_ARGS+=( -n "$WORKERS" --reruns "$RERUNS" --dist-by-duration )
 PYTEST_ARGS+=( --html=tests/artifacts/report.html --self-contained-html )
 
 echo "🧪 Running pytest ($BROWSER, headed=false, workers=$WORKERS, debug=$DEBUG, tracing=$TRACING, env=$ENV_TYPE)…"
@@ -0,0 +1,301 @@
+# src/playwright_qa_tools/load.py
+
+"""Load runner that drives scenarios built from the ``utils/endpoints.py`` calls.
+
+Usage (from the repository root):
+    poetry run load --standin --scenario login --rps 50 --duration 30
+    poetry run load -e staging --scenario catalog --concurrency 8
+
+A pool of ``--concurrency`` threads runs the scenario in a loop until
+``--duration`` is over. With ``--rps`` every request first takes a slot from a
+shared pacer, so the pool never exceeds that rate (open workload); without it
+each thread sends as fast as the server answers (closed workload). Retries are
+disabled so failures show up as errors instead of as latency. Every call is
+``checked`` against its endpoint's schema, so an HTML error page answered with
+the expected status still counts as an error.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from itertools import count
+from pathlib import Path
+
+from dotenv import find_dotenv, load_dotenv
+
+from utils.api_metrics import (
+    ApiMetrics,
+    format_table,
+    percentile,
+    response_code,
+    summarize,
+)
+from utils.endpoints import API, ResponseSchemaError
+from utils.payloads import user_create_payload, user_from_payload
+from utils.retry import NO_RETRY, set_default_retry_policy
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    call: object  # (user) -> Response
+    expected: int = HTTPStatus.OK
+
+
+# Each scenario is one user journey; the runner loops over it
+SCENARIOS = {
+    "login": (
+        Step(
+            "POST /api/verifyLogin",
+            lambda u: API["verify_login_valid"].checked(u.email, u.password),
+        ),
+        Step(
+            "GET /api/getUserDetailByEmail",
+            lambda u: API["get_user_detail_by_email"].checked(u.email),
+        ),
+        Step(
+            "POST /api/searchProduct",
+            lambda u: API["search_product"].checked("top"),
+        ),
+    ),
+    "catalog": (
+        Step("GET /api/productsList", lambda u: API["get_all_products"].checked()),
+        Step("GET /api/brandsList", lambda u: API["get_all_brands"].checked()),
+    ),
+    "search": (
+        Step(
+            "POST /api/searchProduct",
+            lambda u: API["search_product"].checked("dress"),
+        ),
+    ),
+}
+
+# Scenarios that need an existing account per worker
+NEEDS_ACCOUNTS = {"login"}
+
+
+@dataclass(frozen=True)
+class Sample:
+    at: float  # seconds since the start of the run
+    step: str
+    status: int  # JSON responseCode, HTTP status, or 0 on connection errors
+    latency: float
+    error: bool  # status other than the step's ``expected``
+    ttfb: float = 0.0  # ``Response.elapsed``: request sent -> headers parsed
+    size: int = 0
+
+
+class Pacer:
+    """Hands out evenly spaced send slots shared by all worker threads."""
+
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            # Do not burst to catch up after the server stalled
+            slot = max(self._next, now)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LoadRun:
+    def __init__(self, steps, users, concurrency: int, duration: float, rps=None):
+        self._steps = steps
+        self._users = users
+        self._concurrency = concurrency
+        self._duration = duration
+        self._pacer = Pacer(rps) if rps else None
+        self._samples: list[Sample] = []
+        self._started = None
+
+    def samples(self) -> list[Sample]:
+        return list(self._samples)
+
+    def run(self, interval: float, report) -> None:
+        self._started = time.monotonic()
+        deadline = self._started + self._duration
+        with ThreadPoolExecutor(self._concurrency, "load") as pool:
+            workers = [
+                pool.submit(self._worker, worker, deadline)
+                for worker in range(self._concurrency)
+            ]
+            reported = 0
+            for tick in count(1):
+                time.sleep(max(self._started + tick * interval - time.monotonic(), 0))
+                samples = self._samples[reported:]
+                reported += len(samples)
+                report(tick * interval, interval, samples)
+                if all(worker.done() for worker in workers):
+                    break
+            for worker in workers:
+                worker.result()
+
+    def _worker(self, worker: int, deadline: float) -> None:
+        user = self._users[worker % len(self._users)] if self._users else None
+        while time.monotonic() < deadline:
+            for step in self._steps:
+                if self._pacer:
+                    self._pacer.wait()
+                self._samples.append(self._send(step, user))
+
+    def _send(self, step: Step, user) -> Sample:
+        started = time.monotonic()
+        try:
+            response = step.call(user)
+        # requests' connection errors and timeouts are OSErrors
+        except (OSError, ResponseSchemaError):
+            latency = time.monotonic() - started
+            return Sample(started - self._started, step.name, 0, latency, True)
+        latency = time.monotonic() - started
+        status = response_code(response)
+        return Sample(
+            started - self._started,
+            step.name,
+            status,
+            latency,
+            status != step.expected,
+            response.elapsed.total_seconds(),
+            len(response.content),
+        )
+
+
+def interval_line(elapsed: float, interval: float, samples: list[Sample]) -> str:
+    latencies = sorted(s.latency for s in samples)
+    errors = sum(s.error for s in samples)
+    error_rate = errors / len(samples) * 100 if samples else 0.0
+    return (
+        f"{elapsed:>6.1f}s  {len(samples) / interval:>8.1f} req/s  "
+        f"{error_rate:>5.1f}% err  "
+        f"p50 {percentile(latencies, 50) * 1000:>7.1f}  "
+        f"p90 {percentile(latencies, 90) * 1000:>7.1f}  "
+        f"p99 {percentile(latencies, 99) * 1000:>7.1f} ms"
+    )
+
+
+def summary(samples: list[Sample]) -> dict:
+    """Totals of a run; throughput is over the measured time from the first
+    request sent to the last answer, not the nominal ``--duration``."""
+    metrics = ApiMetrics()
+    for s in samples:
+        metrics.add(s.step, s.status, s.latency, s.ttfb, s.size, error=s.error)
+    rows = summarize(metrics.endpoints())
+    latencies = sorted(s.latency for s in samples)
+    errors = sum(s.error for s in samples)
+    duration = (
+        max(s.at + s.latency for s in samples) - min(s.at for s in samples)
+        if samples
+        else 0.0
+    )
+    return {
+        "requests": len(samples),
+        "duration_s": duration,
+        "throughput_rps": len(samples) / duration if duration else 0.0,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "latency_ms": {
+            f"p{pct}": percentile(latencies, pct) * 1000 for pct in (50, 90, 99)
+        },
+        "endpoints": rows,
+    }
+
+
+def create_users(size: int) -> list:
+    payloads = [user_create_payload() for _ in range(size)]
+    responses = API["create_account"].batch((p,) for p in payloads)
+    for payload, resp in zip(payloads, responses):
+        if resp.json().get("responseCode") != HTTPStatus.CREATED:
+            raise RuntimeError(f"Load: creating {payload['email']} failed: {resp.text}")
+    return [user_from_payload(p) for p in payloads]
+
+
+def delete_users(users: list) -> None:
+    API["delete_account"].batch(
+        [(u.email, u.password) for u in users], return_exceptions=True
+    )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="load", description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="login")
+    parser.add_argument("--concurrency", type=int, default=4, help="worker threads")
+    parser.add_argument("--rps", type=float, help="target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument(
+        "--interval", type=float, default=5.0, help="seconds between report lines"
+    )
+    parser.add_argument(
+        "-e",
+        "--env",
+        default="local",
+        help="load ADDRESS from localconf_<env>.env (default: local)",
+    )
+    parser.add_argument(
+        "--standin",
+        action="store_true",
+        help="run against an in-process stand-in server instead of ADDRESS",
+    )
+    parser.add_argument("--json", type=Path, help="also write the summary here")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = None
+    if args.standin:
+        from utils.standin_server import StandinServer
+
+        server = StandinServer().start()
+        os.environ["ADDRESS"] = server.address
+    else:
+        load_dotenv(find_dotenv(f"localconf_{args.env}.env"), override=True)
+    set_default_retry_policy(NO_RETRY)
+
+    users = []
+    try:
+        if args.scenario in NEEDS_ACCOUNTS:
+            users = create_users(args.concurrency)
+        print(
+            f"\033[96m▶ {args.scenario} against {os.environ.get('ADDRESS')}: "
+            f"{args.concurrency} workers, "
+            f"{f'{args.rps:g} req/s' if args.rps else 'unpaced'}, "
+            f"{args.duration:g}s\033[0m"
+        )
+        run = LoadRun(
+            SCENARIOS[args.scenario], users, args.concurrency, args.duration, args.rps
+        )
+        run.run(
+            args.interval,
+            lambda elapsed, interval, samples: print(
+                interval_line(elapsed, interval, samples)
+            ),
+        )
+    finally:
+        if users:
+            delete_users(users)
+        if server is not None:
+            server.stop()
+
+    result = summary(run.samples())
+    print("-" * 48)
+    print("\n".join(format_table(result["endpoints"])))
+    print(
+        f"{result['requests']} requests, {result['throughput_rps']:.1f} req/s, "
+        f"{result['error_rate'] * 100:.2f}% errors"
+    )
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2))
+    sys.exit(1 if result["error_rate"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import pytest
+
+from utils.account_pool import AccountPool
+from utils.endpoints import API
+from utils.markers import api
+
+
+@pytest.fixture
+def pool(standin_server, tmp_path, monkeypatch):
+    """A pool of its own, creating accounts on the stand-in server."""
+    monkeypatch.setenv("ADDRESS", standin_server)
+    pool = AccountPool(tmp_path, batch_size=2)
+    yield pool
+    pool.sweep()
+
+
+def logs_in(user) -> bool:
+    resp = API["verify_login_valid"].call(user.email, user.password)
+    return resp.json()["responseCode"] == 200
+
+
+def failing_for(monkeypatch, name, email):
+    """Make ``API[name]`` raise for one account, as a timeout would."""
+    compiled = API[name]
+    call_async = compiled.call_async
+
+    async def call(*args):
+        if args[0] == email:
+            raise TimeoutError(f"{name} {email}")
+        return await call_async(*args)
+
+    monkeypatch.setattr(compiled, "call_async", call)
+
+
+@api
+def test_lease_release_consume(pool):
+    """Leasing provisions a batch, released accounts are leased again and
+    consumed ones never are."""
+
+    first = pool.lease("gw0")
+    assert logs_in(first)
+    assert pool.stats() == {
+        "provisioned": 2,
+        "leases": 1,
+        "free": 1,
+        "leased": 1,
+        "consumed": 0,
+    }
+
+    pool.release(first)
+    assert pool.lease("gw1").email == first.email
+
+    pool.consume(first)
+    second = pool.lease("gw0")
+    third = pool.lease("gw1")  # the batch is used up: a new one is created
+    assert first.email not in (second.email, third.email)
+    assert pool.stats()["provisioned"] == 4
+    assert pool.stats()["consumed"] == 1
+
+
+@api
+def test_sweep_deletes_every_account(pool):
+    """Free, leased and consumed accounts are all deleted and verified."""
+
+    users = [pool.lease("gw0"), pool.lease("gw0"), pool.lease("gw1")]
+    pool.release(users[0])
+    pool.consume(users[1])
+
+    result = pool.sweep()
+    assert (result.deleted, result.failed) == (4, [])
+    assert not any(logs_in(user) for user in users)
+    assert pool.stats()["provisioned"] == 4  # the table itself is emptied
+    assert pool.sweep().deleted == 0
+
+
+@api
+def test_sweep_survives_failed_calls(pool, monkeypatch):
+    """A delete or verify that raises marks that account as failed instead of
+    stopping the sweep; the others are still deleted."""
+
+    kept, unchecked, deleted = pool.lease("gw0"), pool.lease("gw0"), pool.lease("gw0")
+    with monkeypatch.context() as patched:
+        failing_for(patched, "delete_account", kept.email)
+        failing_for(patched, "verify_login_valid", unchecked.email)
+        result = pool.sweep()
+    assert result.deleted == 4
+    assert sorted(result.failed) == sorted([kept.email, unchecked.email])
+    assert logs_in(kept)
+    assert not logs_in(unchecked) and not logs_in(deleted)
+    API["delete_account"].call(kept.email, kept.password)
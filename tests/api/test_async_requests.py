@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import pytest
+
+from utils.async_request_builder import AsyncRequest, gather_limited, run_batch
+from utils.endpoints import API
+from utils.markers import api
+from utils.request_builder import Request, RequestMethod
+
+
+def brands(site) -> AsyncRequest:
+    return AsyncRequest(RequestMethod.GET, site).path("/api/brandsList")
+
+
+class InFlight:
+    """Wraps awaitables to count how many of them run at the same time."""
+
+    def __init__(self):
+        self.now = self.peak = 0
+
+    async def track(self, aw):
+        self.now += 1
+        self.peak = max(self.peak, self.now)
+        try:
+            return await aw
+        finally:
+            self.now -= 1
+
+
+@api
+def test_send_does_not_block_the_loop(standin_server, monkeypatch):
+    """The blocking send runs on the request executor while the loop goes on."""
+
+    threads = []
+    blocking_send = Request.send
+
+    def send(self):
+        threads.append(threading.current_thread().name)
+        return blocking_send(self)
+
+    monkeypatch.setattr(Request, "send", send)
+
+    async def main():
+        response, _ = await asyncio.gather(
+            brands(standin_server).send(), asyncio.sleep(0)
+        )
+        return response
+
+    assert asyncio.run(main()).json()["responseCode"] == 200
+    assert len(threads) == 1 and threads[0].startswith("async-request")
+
+
+@api
+def test_gather_limited_caps_requests_in_flight(standin_server):
+    in_flight = InFlight()
+
+    async def main():
+        return await gather_limited(
+            *(in_flight.track(brands(standin_server).send()) for _ in range(12)),
+            limit=3,
+        )
+
+    responses = asyncio.run(main())
+    assert len(responses) == 12
+    assert all(r.json()["responseCode"] == 200 for r in responses)
+    assert in_flight.peak == 3
+
+
+@api
+def test_run_batch_keeps_order_and_exceptions(standin_server, monkeypatch):
+    """Results come back in call order; with return_exceptions a failed call
+    is returned in its place instead of failing the batch."""
+
+    monkeypatch.setenv("ADDRESS", standin_server)
+    search = API["search_product"]
+
+    async def broken():
+        raise ConnectionError("reset by peer")
+
+    def calls():
+        return (
+            search.call_async("top"),
+            broken(),
+            search.call_async("dress"),
+        )
+
+    top, error, dress = run_batch(*calls(), limit=2, return_exceptions=True)
+    assert isinstance(error, ConnectionError)
+    for response, term in ((top, "top"), (dress, "dress")):
+        names = [p["name"].lower() for p in response.json()["products"]]
+        assert names and all(term in name for name in names)
+
+    with pytest.raises(ConnectionError):
+        run_batch(*calls())
@@ -0,0 +1,58 @@
+from http import HTTPStatus
+
+from playwright_qa_tools.load import (
+    SCENARIOS,
+    LoadRun,
+    Step,
+    create_users,
+    delete_users,
+    summary,
+)
+from utils.endpoints import API
+from utils.markers import api
+
+
+def run_load(steps, users=(), concurrency=2, duration=0.5):
+    """Run a short load test; return the summary and the reported samples."""
+    reported = []
+    run = LoadRun(steps, list(users), concurrency, duration)
+    run.run(0.1, lambda elapsed, interval, samples: reported.extend(samples))
+    return summary(run.samples()), reported
+
+
+@api
+def test_login_scenario_counts(standin_server, monkeypatch):
+    """Every journey sends each step once; the interval reports add up to the
+    summary and the stand-in answers without errors."""
+
+    monkeypatch.setenv("ADDRESS", standin_server)
+    users = create_users(2)
+    try:
+        result, reported = run_load(SCENARIOS["login"], users)
+    finally:
+        delete_users(users)
+
+    steps = [step.name for step in SCENARIOS["login"]]
+    rows = {row["endpoint"]: row for row in result["endpoints"]}
+    assert set(rows) == set(steps)
+    calls = {rows[name]["calls"] for name in steps}
+    assert len(calls) == 1  # whole journeys only
+    assert result["requests"] == len(reported) == len(steps) * calls.pop() > 0
+    assert result["error_rate"] == 0.0
+    assert all(rows[name]["statuses"] == {"200": rows[name]["calls"]} for name in steps)
+    assert result["throughput_rps"] > 0 and result["duration_s"] > 0
+
+
+@api
+def test_unexpected_status_counts_as_error(standin_server, monkeypatch):
+    monkeypatch.setenv("ADDRESS", standin_server)
+    created = Step(
+        "GET /api/brandsList",
+        lambda u: API["get_all_brands"].checked(),
+        expected=HTTPStatus.CREATED,
+    )
+    result, _ = run_load((created,), concurrency=1, duration=0.2)
+
+    (row,) = result["endpoints"]
+    assert row["errors"] == row["calls"] == result["requests"] > 0
+    assert result["error_rate"] == 1.0
@@ -0,0 +1,56 @@
+from utils.http_session import SessionPool
+from utils.markers import api
+from utils.request_builder import Request, RequestMethod
+
+
+def get(pool, site, path="/api/brandsList"):
+    return Request(RequestMethod.GET, site, pool).path(path).send()
+
+
+@api
+def test_one_session_per_scheme_and_host(standin_server):
+    """Requests to one scheme + host share a session and its keep-alive
+    connection; another host name gets a session of its own."""
+
+    pool = SessionPool()
+    for _ in range(3):
+        assert get(pool, standin_server).json()["responseCode"] == 200
+    other = standin_server.replace("127.0.0.1", "localhost")
+    assert get(pool, other).json()["responseCode"] == 200
+
+    stats = pool.stats()
+    assert (stats.session_misses, stats.session_hits) == (2, 2)
+    assert (stats.requests, stats.new_connections) == (4, 2)
+    assert stats.reused_connections == 2
+    assert pool.session_for(f"{standin_server}/x") is pool.session_for(standin_server)
+    assert pool.session_for(other) is not pool.session_for(standin_server)
+    pool.close()
+
+
+@api
+def test_cookies_are_not_carried_over(standin_server):
+    """The site sets a session cookie on page requests; a pooled session
+    never sends it back, like the fresh Session each call used to get."""
+
+    pool = SessionPool()
+    first = get(pool, standin_server, "/")
+    second = get(pool, standin_server, "/")
+    assert "sessionid=" in first.headers["Set-Cookie"]
+    assert second.headers["Set-Cookie"] != first.headers["Set-Cookie"]
+    assert not pool.session_for(standin_server).cookies
+    pool.close()
+
+
+@api
+def test_stats_survive_close(standin_server):
+    pool = SessionPool()
+    get(pool, standin_server)
+    get(pool, standin_server)
+    pool.close()
+
+    stats = pool.stats()
+    assert (stats.requests, stats.new_connections) == (2, 1)
+    get(pool, standin_server)  # a new session after close
+    assert pool.stats().session_misses == 2
+    assert pool.stats().new_connections == 2
+    pool.close()
@@ -0,0 +1,225 @@
+import re
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+import requests
+
+from utils.markers import api
+from utils.payloads import user_create_payload
+from utils.standin_data import BRANDS, PRODUCTS
+
+
+@pytest.fixture
+def site(standin_server):
+    """Browser-like session (cookies kept) against the stand-in server."""
+    with requests.Session() as session:
+        session.address = standin_server
+        yield session
+
+
+def call(site, method, path, **kwargs) -> dict:
+    resp = site.request(method, f"{site.address}{path}", **kwargs)
+    # Like the real API: always 200, the status is in the body
+    assert resp.status_code == HTTPStatus.OK
+    return resp.json()
+
+
+@api
+def test_catalog_endpoints(site):
+    """productsList and brandsList serve the whole catalog; other methods are
+    rejected with 405 in the body."""
+
+    products = call(site, "GET", "/api/productsList")
+    assert products["responseCode"] == HTTPStatus.OK
+    assert [p["id"] for p in products["products"]] == [p.id for p in PRODUCTS]
+    assert products["products"][0]["price"] == PRODUCTS[0].price_text
+
+    brands = call(site, "GET", "/api/brandsList")
+    assert [b["brand"] for b in brands["brands"]] == list(BRANDS)
+
+    for path in ("/api/productsList", "/api/brandsList"):
+        body = call(site, "POST", path)
+        assert body["responseCode"] == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@api
+def test_search_product(site):
+    """Search matches names and categories; the parameter is required."""
+
+    body = call(site, "POST", "/api/searchProduct", data={"search_product": "top"})
+    assert body["responseCode"] == HTTPStatus.OK
+    names = {p["name"] for p in body["products"]}
+    assert "Blue Top" in names and "Men Tshirt" not in names
+
+    body = call(site, "POST", "/api/searchProduct")
+    assert body["responseCode"] == HTTPStatus.BAD_REQUEST
+
+
+@api
+@pytest.mark.parametrize("content", ["form", "json"])
+def test_account_lifecycle(site, content):
+    """Create, verify, read, update and delete one account; form and JSON bodies
+    are both accepted."""
+
+    user = user_create_payload()
+    creds = {"email": user["email"], "password": user["password"]}
+
+    def body(data):
+        return {"json": data} if content == "json" else {"data": data}
+
+    assert (
+        call(site, "POST", "/api/createAccount", **body(user))["responseCode"]
+        == HTTPStatus.CREATED
+    )
+    assert (
+        call(site, "POST", "/api/createAccount", **body(user))["message"]
+        == "Email already exists!"
+    )
+    assert (
+        call(site, "POST", "/api/verifyLogin", **body(creds))["responseCode"]
+        == HTTPStatus.OK
+    )
+    wrong = {**creds, "password": "wrong"}
+    assert (
+        call(site, "POST", "/api/verifyLogin", **body(wrong))["responseCode"]
+        == HTTPStatus.NOT_FOUND
+    )
+
+    detail = call(site, "GET", "/api/getUserDetailByEmail", params=creds)
+    assert detail["user"]["email"] == user["email"]
+    assert detail["user"]["city"] == user["city"]
+
+    updated = {**user, "city": "Sopot"}
+    assert (
+        call(site, "PUT", "/api/updateAccount", **body(updated))["responseCode"]
+        == HTTPStatus.OK
+    )
+    detail = call(site, "GET", "/api/getUserDetailByEmail", params=creds)
+    assert detail["user"]["city"] == "Sopot"
+
+    assert (
+        call(site, "DELETE", "/api/deleteAccount", **body(creds))["responseCode"]
+        == HTTPStatus.OK
+    )
+    assert (
+        call(site, "POST", "/api/verifyLogin", **body(creds))["responseCode"]
+        == HTTPStatus.NOT_FOUND
+    )
+    assert (
+        call(site, "DELETE", "/api/deleteAccount", **body(creds))["responseCode"]
+        == HTTPStatus.NOT_FOUND
+    )
+
+
+@api
+def test_account_requests_are_validated(site):
+    """Missing parameters answer 400, unknown users 404."""
+
+    user = user_create_payload()
+    del user["mobile_number"]
+    body = call(site, "POST", "/api/createAccount", data=user)
+    assert body["responseCode"] == HTTPStatus.BAD_REQUEST
+    assert "mobile_number" in body["message"]
+
+    body = call(site, "POST", "/api/verifyLogin", data={"password": "x"})
+    assert body["responseCode"] == HTTPStatus.BAD_REQUEST
+    body = call(site, "GET", "/api/getUserDetailByEmail")
+    assert body["responseCode"] == HTTPStatus.BAD_REQUEST
+    body = call(site, "GET", "/api/getUserDetailByEmail", params={"email": "a@b.c"})
+    assert body["responseCode"] == HTTPStatus.NOT_FOUND
+    body = call(site, "GET", "/api/verifyLogin")
+    assert body["responseCode"] == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@api
+def test_concurrent_batch(standin_server):
+    """Many keep-alive connections at once, as a batch of API calls makes."""
+
+    users = [user_create_payload() for _ in range(12)]
+
+    def create_and_verify(user):
+        with requests.Session() as session:
+            session.address = standin_server
+            created = call(session, "POST", "/api/createAccount", data=user)
+            creds = {"email": user["email"], "password": user["password"]}
+            verified = call(session, "POST", "/api/verifyLogin", data=creds)
+            call(session, "DELETE", "/api/deleteAccount", data=creds)
+            return created["responseCode"], verified["responseCode"]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(create_and_verify, users))
+    assert results == [(HTTPStatus.CREATED, HTTPStatus.OK)] * len(users)
+
+
+@api
+def test_cart_is_kept_per_session(site, standin_server):
+    """add_to_cart/delete_cart change only the cart of the session cookie."""
+
+    site.get(f"{standin_server}/add_to_cart/1", params={"quantity": 3})
+    site.get(f"{standin_server}/add_to_cart/2")
+    site.get(f"{standin_server}/add_to_cart/2")
+    site.get(f"{standin_server}/delete_cart/1")
+    cart = site.get(f"{standin_server}/view_cart").text
+    assert 'id="product-2"' in cart and 'id="product-1"' not in cart
+
+    other = requests.get(f"{standin_server}/view_cart").text
+    assert 'id="product-2"' not in other
+
+    resp = site.get(f"{standin_server}/add_to_cart/99999")
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+
+
+@api
+def test_pages_and_login(site, standin_server):
+    """Pages render, unknown ones are 404, login needs the form's CSRF token."""
+
+    home = site.get(f"{standin_server}/")
+    assert home.status_code == HTTPStatus.OK
+    assert PRODUCTS[0].name in home.text
+    details = site.get(f"{standin_server}/product_details/{PRODUCTS[0].id}")
+    assert PRODUCTS[0].price_text in details.text
+    assert site.get(f"{standin_server}/nope").status_code == HTTPStatus.NOT_FOUND
+
+    user = user_create_payload()
+    call(site, "POST", "/api/createAccount", data=user)
+    form = {"email": user["email"], "password": user["password"]}
+    login_url = f"{standin_server}/login"
+
+    resp = site.post(login_url, data=form, allow_redirects=False)
+    assert resp.status_code == HTTPStatus.OK  # no token: the form again
+
+    token = re.search(r'name="csrfmiddlewaretoken" value="(\w+)"', resp.text)[1]
+    resp = site.post(
+        login_url, data={**form, "csrfmiddlewaretoken": token}, allow_redirects=False
+    )
+    assert resp.status_code == HTTPStatus.FOUND
+    assert user["name"] in site.get(f"{standin_server}/").text
+
+    site.get(f"{standin_server}/delete_account")
+    body = call(site, "POST", "/api/verifyLogin", data=form)
+    assert body["responseCode"] == HTTPStatus.NOT_FOUND
+
+
+@api
+def test_errors_answer_500(site, standin_server):
+    """A request the server cannot handle gets a 500 instead of a dropped
+    connection; a bad body keeps the connection, a bad request line closes it."""
+
+    resp = site.post(
+        f"{standin_server}/api/verifyLogin",
+        data="{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert resp.text.startswith("JSONDecodeError")
+    assert resp.headers["Connection"] == "keep-alive"
+    assert call(site, "GET", "/api/brandsList")["responseCode"] == HTTPStatus.OK
+
+    host, port = standin_server.removeprefix("http://").split(":")
+    with socket.create_connection((host, int(port)), timeout=5) as conn:
+        conn.sendall(b"GARBAGE\r\n\r\n")
+        answer = conn.makefile("rb").read()  # until the server closes
+    assert answer.startswith(b"HTTP/1.1 500 Internal Server Error\r\n")
+    assert b"Connection: close" in answer
@@ -1,20 +1,80 @@
 import logging
 import os
-from http import HTTPStatus
+import zlib
 
 import pytest
 from faker import Faker
 from pytest_html import extras
 
 from components.consent_popup import ConsentPopup
+from helper_functions_for_tests.cart_tests_helpers import seed_cart
+from pages.main_page import FeaturesItems
 from tests.conftest_helpers import (
+    UI_VIEWPORT,
+    close_concurrent_tests,
+    collect_worker_output,
+    concurrent_batches,
+    configure_api_retries,
+    configure_cassette,
+    configure_concurrent_tests,
+    configure_duration_history,
     configure_print_logging,
+    configure_readiness,
+    configure_response_cache,
+    configure_standin,
+    configure_ui_har,
+    configure_user_factory,
+    consent_storage_state,
+    har_session,
+    init_run_dir,
+    is_xdist_worker,
+    item_failed,
     load_selected_env,
+    make_duration_scheduler,
     make_screenshot_path,
+    network_profile,
+    open_context_pool,
+    publish_har_rows,
+    publish_network_rows,
+    publish_stats,
+    record_test_outcome,
+    remove_run_dir,
     restore_print_logging,
+    run_dir,
+    save_api_latency_report,
+    save_duration_history,
+    save_recorded_cassette,
+    save_recorded_har,
+    save_test_markers,
+    standin_address,
+    stop_standin,
+    store_account_pool_report,
+    worker_id,
+    write_account_pool_summary,
+    write_api_latency_summary,
+    write_cassette_summary,
+    write_duration_schedule_summary,
+    write_har_summary,
+    write_network_profile_summary,
+    write_stats_summaries,
 )
-from utils.api_requests import create_account, delete_account, verify_login_valid
-from utils.payloads import User, user_create_payload
+from utils.account_pool import AccountPool
+from utils.async_browser import AsyncBrowser, AsyncPages, LoopThread
+from utils.auth_state import AuthStateCache
+from utils.cassette import DEFAULT_CASSETTE, REPLAY, active_cassette
+from utils.concurrent_tests import DEFAULT_LIMIT
+from utils.concurrent_tests import MARKER as CONCURRENT_MARKER
+from utils.concurrent_tests import SCREENSHOT as CONCURRENT_SCREENSHOT
+from utils.concurrent_tests import is_concurrent
+from utils.context_pool import DEFAULT_MAX_USES
+from utils.duration_schedule import DEFAULT_HISTORY
+from utils.har_replay import DEFAULT_HAR_DIR
+from utils.http_session import get_session_pool
+from utils.network_profiles import OFF, PROFILES
+from utils.payloads import seed_payloads
+from utils.readiness import LOAD, STRATEGIES, navigate, settle
+from utils.response_cache import DEFAULT_TTL
+from utils.standin_server import StandinServer
 
 fake = Faker("pl_PL")
 logging.basicConfig(
@@ -31,17 +91,248 @@ def pytest_report_header(config):
     return _env_msg
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--account-pool-size",
+        type=int,
+        default=0,
+        help="Pre-provision this many API accounts at session start "
+        "(default: provision lazily, in batches, on first lease).",
+    )
+    parser.addoption(
+        "--standin",
+        action="store_true",
+        help="Run against a local stand-in of the site (API and pages) "
+        "instead of ADDRESS; one server is shared by all xdist workers.",
+    )
+    parser.addoption(
+        "--api-retries",
+        type=int,
+        default=None,
+        help="Max retries of a transient API failure (connection error, 429, "
+        "5xx) for GET/PUT/DELETE; 0 disables retrying. Default: 3.",
+    )
+    parser.addoption(
+        "--network-profile",
+        choices=sorted(PROFILES),
+        default=OFF,
+        help="Block requests in browser contexts: ads+analytics, no-images "
+        "(also fonts/media), first-party-only. A network_profile marker on a "
+        "test wins.",
+    )
+    parser.addoption(
+        "--readiness",
+        choices=STRATEGIES,
+        default=LOAD,
+        help="When a navigation of a fixture or page object is done: commit, "
+        "domcontentloaded, load (default) or ready (the page object's own "
+        "selector, e.g. the home page's product cards).",
+    )
+    parser.addoption(
+        "--concurrent-tests",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help="@concurrent async UI tests run at the same time in one worker, "
+        f"each in its own browser context (default: {DEFAULT_LIMIT}).",
+    )
+    parser.addoption(
+        "--dist-by-duration",
+        action="store_true",
+        help="Record test durations and, with xdist (-n), send the longest "
+        "tests first according to earlier runs; the default order is kept "
+        "until there is history for this browser and ENV_TYPE.",
+    )
+    parser.addoption(
+        "--duration-history",
+        default=str(DEFAULT_HISTORY),
+        help="File of the test durations used by --dist-by-duration.",
+    )
+    parser.addoption(
+        "--context-pool",
+        type=int,
+        default=0,
+        help="Serve page_on_address from this many warm browser contexts per "
+        "worker, reset between tests instead of closed (default: 0, off).",
+    )
+    parser.addoption(
+        "--context-max-uses",
+        type=int,
+        default=DEFAULT_MAX_USES,
+        help="Tests a pooled context serves before it is replaced.",
+    )
+    parser.addoption(
+        "--ui-record",
+        action="store_true",
+        help="Record the browser traffic of UI tests into one HAR archive per "
+        "test module (see --har-dir).",
+    )
+    parser.addoption(
+        "--ui-replay",
+        action="store_true",
+        help="Serve UI tests from the HAR archives only; requests that were "
+        "never recorded are aborted.",
+    )
+    parser.addoption(
+        "--har-dir",
+        default=str(DEFAULT_HAR_DIR),
+        help="Directory of the HAR archives used by --ui-record/--ui-replay.",
+    )
+    parser.addoption(
+        "--api-cache",
+        choices=("off", "memory", "shared"),
+        default="off",
+        help="Cache read-only catalog GETs: per worker in memory, or also on "
+        "disk shared by all xdist workers (default: off).",
+    )
+    parser.addoption(
+        "--api-cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds a cached response is used before it is revalidated.",
+    )
+    parser.addoption(
+        "--api-record",
+        action="store_true",
+        help="Record every API request/response to the cassette file.",
+    )
+    parser.addoption(
+        "--api-replay",
+        action="store_true",
+        help="Serve API requests from the cassette file; unknown requests "
+        "still go to the network.",
+    )
+    parser.addoption(
+        "--api-replay-strict",
+        action="store_true",
+        help="Like --api-replay, but fail on any request missing from the cassette.",
+    )
+    parser.addoption(
+        "--api-cassette",
+        default=str(DEFAULT_CASSETTE),
+        help="Cassette file used by --api-record/--api-replay.",
+    )
+
+
 def pytest_configure(config):
     configure_print_logging()
+    init_run_dir(config)
+    configure_user_factory(config)
+    configure_standin(config)
+    configure_cassette(config)
+    configure_ui_har(config)
+    configure_api_retries(config)
+    configure_response_cache(config)
+    configure_readiness(config)
+    configure_concurrent_tests(config)
+    configure_duration_history(config)
 
 
 def pytest_unconfigure(config):
     restore_print_logging()
+    stop_standin(config)
+    remove_run_dir(config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["run_dir"] = str(run_dir(node.config))
+    node.workerinput["standin_address"] = standin_address(node.config)
+    node.workerinput["concurrent_batches"] = concurrent_batches(node.config)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Before xdist reads the groups: concurrent tests form one group for --dist loadgroup
+    for item in items:
+        if is_concurrent(item):
+            item.add_marker(pytest.mark.xdist_group(CONCURRENT_MARKER))
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    # Before xdist's own implementation, which always returns a scheduler
+    return make_duration_scheduler(config, log)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_finish(session):
+    # Before an xdist worker reports its collection to the controller, and after
+    # every plugin reordered the tests (--ff, ...): concurrent tests run last,
+    # next to each other, so they can run in batches
+    session.items.sort(key=is_concurrent)
+    save_test_markers(session)
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    size = config.getoption("--account-pool-size")
+    if size and not is_xdist_worker(config):
+        cassette = active_cassette()
+        if cassette is not None:
+            # Like pytest_runtest_setup does per test: the same accounts on
+            # record and replay, so the recorded create requests match again
+            seed_payloads(zlib.crc32(b"account_pool"), cassette.mode == REPLAY)
+        AccountPool(run_dir(config)).provision(size)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    cassette = active_cassette()
+    if cassette is not None:
+        # Runs before any fixture of the test: same nodeid -> same payloads,
+        # so recorded request bodies match again on replay
+        seed_payloads(zlib.crc32(item.nodeid.encode()), cassette.mode == REPLAY)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not is_xdist_worker(config):
+        # Runs after every worker finished: one bulk delete for the whole run
+        account_pool = AccountPool(run_dir(config))
+        stats = account_pool.stats()
+        sweep = account_pool.sweep()
+        store_account_pool_report(config, stats, sweep)
+        if sweep.failed:
+            # An account that survived its deletion fails the run, as the
+            # per-test NOT_FOUND check did before the pool
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    save_recorded_cassette(config)
+    save_duration_history(config)
+    save_recorded_har(config)
+    publish_har_rows(config)
+    save_api_latency_report(config)
+    publish_network_rows(config)
+    close_concurrent_tests(config)
+    get_session_pool().close()
+    publish_stats(config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # xdist controller: gather what each worker published in sessionfinish
+    collect_worker_output(node.config, getattr(node, "workeroutput", {}))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if is_xdist_worker(config):
+        return
+    write_account_pool_summary(terminalreporter, config)
+    write_cassette_summary(terminalreporter, config)
+    write_network_profile_summary(terminalreporter, config)
+    write_duration_schedule_summary(terminalreporter, config)
+    write_har_summary(terminalreporter, config)
+    write_api_latency_summary(terminalreporter, config)
+    write_stats_summaries(terminalreporter, config)
+
+
+# Fixtures that may hold the test's page; pooled pages are only in page_on_address
+_PAGE_FIXTURES = ("page", "page_on_address", "logged_in_page")
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     report = (yield).get_result()
+    record_test_outcome(item, report)
     if report.when != "call":
         return
 
@@ -52,13 +343,21 @@ def pytest_runtest_makereport(item, call):
     if report.outcome == "passed":
         return
 
-    page = item.funcargs.get("page")
-    if not page:
-        return
+    pages = (item.funcargs.get(name) for name in _PAGE_FIXTURES)
+    page = next((page for page in pages if page), None)
+    async_ui = item.funcargs.get("async_ui")
 
-    # Save screenshot
-    p = make_screenshot_path(item)
-    page.screenshot(path=p)
+    # Save screenshot (concurrent tests took theirs before closing the page)
+    p = item.stash.get(CONCURRENT_SCREENSHOT, None)
+    if p is None:
+        if page:
+            p = make_screenshot_path(item)
+            page.screenshot(path=p)
+        elif async_ui and async_ui.pages:
+            p = make_screenshot_path(item)
+            async_ui.run(async_ui.pages[0].screenshot(path=p))
+        else:
+            return
 
     # Relative path to HTML file
     html_report_path = item.config.option.htmlpath
@@ -77,39 +376,155 @@ def pytest_runtest_makereport(item, call):
 
 
 @pytest.fixture(scope="function")
-def page_on_address(page):
+def context(context, request):
+    with har_session(context, request), network_profile(context, request):
+        yield context
+
+
+@pytest.fixture(scope="function")
+def page(page):
+    # Contexts already carry the accepted consent; this only fires if the
+    # popup still shows up (e.g. the consent expired mid-run)
+    ConsentPopup(page).dismiss_when_shown()
+    yield page
+
+
+@pytest.fixture(scope="session")
+def context_pool(request, browser, browser_context_args):
+    pool = open_context_pool(request.config, browser, browser_context_args)
+    yield pool
+    if pool is not None:
+        pool.close()
+
+
+@pytest.fixture(scope="function")
+def page_on_address(request, context_pool):
     address = os.environ.get("ADDRESS")
     if not address:
         raise RuntimeError("ADDRESS env var not set!")
-    page.goto(address)
+    if context_pool is not None:
+        # Already on ADDRESS with consent handled; reset or replaced afterwards
+        pooled = context_pool.acquire()
+        try:
+            with network_profile(pooled.context, request):
+                yield pooled.page
+        finally:
+            settle(pooled.page)
+            context_pool.release(pooled, failed=item_failed(request.node))
+        return
+    page = request.getfixturevalue("page")
+    navigate(page, address, ready=FeaturesItems.READY)
     ConsentPopup(page).accept()  # Handles the popup if present
 
     yield page
+    settle(page)
+
+
+@pytest.fixture(scope="function")
+def seeded_cart(page_on_address):
+    """Callable that fills the cart via requests, for tests not about adding.
+
+    ``seeded_cart([(0, 1), (2, 3)])`` adds card 0 once and card 2 three times
+    and returns their ``ProductInfo``.
+    """
+
+    def seed(items):
+        return seed_cart(page_on_address, items)
+
+    return seed
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    """Event loop on a background thread for ``playwright.async_api`` code."""
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop, browser_name, browser_type_launch_args):
+    browser = AsyncBrowser(
+        async_loop, browser_name or "chromium", browser_type_launch_args
+    )
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="function")
+def async_ui(async_browser, browser_context_args):
+    """Opens pages for the async page objects (pages/async_pages.py) and runs
+    coroutines that drive them concurrently: ``async_ui.run(flow())``.
+    """
+    pages = AsyncPages(async_browser, browser_context_args)
+    yield pages
+    pages.run(pages.close())
+
+
+@pytest.fixture(scope="session")
+def standin_server(request):
+    """Base URL of a local stand-in of the site (utils/standin_server.py).
+
+    Under ``--standin`` this is the server the whole run targets; otherwise a
+    private instance is started on an ephemeral port for this worker.
+    """
+    address = standin_address(request.config)
+    if address:
+        yield address
+        return
+    server = StandinServer().start()
+    yield server.address
+    server.stop()
 
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
-    return {
+def browser_context_args(browser_context_args, browser, request):
+    args = {
         **browser_context_args,
-        "viewport": {
-            "width": 2560,
-            "height": 1440,
-        },
+        "viewport": UI_VIEWPORT,
     }
+    # Capturing consent needs the live site; in replay the handler clicks it
+    if not request.config.getoption("--ui-replay"):
+        args["storage_state"] = consent_storage_state(request.config, browser)
+    return args
 
 
 @pytest.fixture(scope="session")
-def user_api(request):
-    user_data = user_create_payload()
-    other = {
-        k: v for k, v in user_data.items() if k not in ("name", "email", "password")
-    }
-    user = User(user_data["name"], user_data["email"], user_data["password"], other)
-    create_account(user_data)
+def account_pool(request):
+    return AccountPool(run_dir(request.config))
+
+
+@pytest.fixture(scope="session")
+def auth_states(request):
+    return AuthStateCache(run_dir(request.config) / "auth_state")
+
+
+@pytest.fixture(scope="session")
+def user_api(request, account_pool, auth_states):
+    user = account_pool.lease(worker_id())
     yield user
-    # Default: delete unless param==False
+    # Default: the account is kept for reuse and deleted (and verified) in the
+    # final sweep; param==False means the test deletes it on its own
     delete = getattr(request, "param", True)
     if delete:
-        delete_account(user.email, user.password)
-        resp = verify_login_valid(user.email, user.password)
-        assert resp.json().get("responseCode") == HTTPStatus.NOT_FOUND
+        account_pool.release(user)
+    else:
+        account_pool.consume(user)
+        auth_states.invalidate(user)
+
+
+@pytest.fixture(scope="function")
+def logged_in_page(request, browser, browser_context_args, user_api, auth_states):
+    """A page whose context starts logged in as ``user_api``; nothing is
+    loaded yet. The login happens once per user and run (see utils/auth_state.py).
+    """
+    state = auth_states.state_for(browser, user_api, browser_context_args)
+    # pytest-playwright's new_context keeps tracing/video/screenshots working
+    # and already applies the test's browser_context_args marker
+    context = request.getfixturevalue("new_context")(storage_state=state)
+    with har_session(context, request), network_profile(context, request):
+        page = context.new_page()
+        ConsentPopup(page).dismiss_when_shown()
+        yield page
+        settle(page)
+    context.close()
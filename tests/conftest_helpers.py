@@ -5,12 +5,60 @@ contains only hooks and fixtures.
 """
 
 import builtins
+import fcntl
+import json
 import logging
 import os
+import re
+import shutil
+import tempfile
 import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
 
 from dotenv import find_dotenv, load_dotenv
+from pytest import StashKey, UsageError
+
+from components.consent_popup import capture_consent_state, get_consent_stats
+from pages.main_page import FeaturesItems
+from utils import response_cache
+from utils.api_metrics import format_table, get_api_metrics, summarize
+from utils.cassette import (
+    RECORD,
+    REPLAY,
+    Cassette,
+    activate,
+    active_cassette,
+    save_interactions,
+)
+from utils.concurrent_tests import ConcurrencyStats, ConcurrentScheduler
+from utils.context_pool import ContextPool, get_context_pool_stats
+from utils.data_factory import set_user_namespace
+from utils.duration_schedule import (
+    DurationHistory,
+    DurationRecorder,
+    DurationScheduling,
+    marker_names,
+    read_test_markers,
+    write_test_markers,
+)
+from utils.har_replay import (
+    HarIndex,
+    HarReplay,
+    har_path,
+    load_catalog,
+    merge_har_files,
+    products_from_har,
+    save_catalog,
+)
+from utils.http_session import get_session_pool
+from utils.network_profiles import NetworkRecorder
+from utils.readiness import get_navigation_stats, set_readiness
+from utils.response_cache import CacheStats, ResponseCache
+from utils.retry import get_default_retry_policy, set_default_retry_policy
+from utils.standin_server import StandinServer
 
 # ---- environment helpers ---------------------------------------------------
 
@@ -66,3 +114,667 @@ def make_screenshot_path(item) -> Path:
     path = Path(item.config.rootpath, "tests", "artifacts", f"{ts}_{safe}.png")
     path.parent.mkdir(parents=True, exist_ok=True)
     return path
+
+
+# ---- xdist worker output ---------------------------------------------------
+
+_WORKER_OUTPUTS = StashKey[list]()
+
+
+def is_xdist_worker(config) -> bool:
+    """Return True when running inside a pytest-xdist worker process."""
+
+    return hasattr(config, "workerinput")
+
+
+def publish_worker_output(config, key: str, value) -> None:
+    """Hand ``value`` over to the xdist controller (no-op outside a worker)."""
+
+    if is_xdist_worker(config):
+        config.workeroutput[key] = value
+
+
+def collect_worker_output(config, workeroutput: dict) -> None:
+    """Store what a finished worker published, on the controller side."""
+
+    config.stash.setdefault(_WORKER_OUTPUTS, []).append(dict(workeroutput))
+
+
+def worker_outputs(config, key: str) -> list:
+    """Return every value published under ``key`` by finished workers."""
+
+    return [out[key] for out in config.stash.get(_WORKER_OUTPUTS, []) if key in out]
+
+
+# ---- shared run directory --------------------------------------------------
+
+_RUN_DIR = StashKey[Path]()
+
+
+def init_run_dir(config) -> Path:
+    """Create (controller) or adopt (xdist worker) the directory shared by all
+    processes of this run. Workers receive its path through ``workerinput``.
+    """
+
+    if is_xdist_worker(config):
+        path = Path(config.workerinput["run_dir"])
+    else:
+        path = Path(tempfile.mkdtemp(prefix="qa-run-"))
+    config.stash[_RUN_DIR] = path
+    return path
+
+
+def run_dir(config) -> Path:
+    """Return the directory shared by the controller and all workers."""
+
+    return config.stash[_RUN_DIR]
+
+
+def remove_run_dir(config) -> None:
+    """Delete the shared directory once the controller is done with it."""
+
+    if not is_xdist_worker(config) and _RUN_DIR in config.stash:
+        shutil.rmtree(config.stash[_RUN_DIR], ignore_errors=True)
+
+
+def worker_id() -> str:
+    """Return the xdist worker id (``gw0``...) or ``main`` without xdist."""
+
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def configure_user_factory(config) -> None:
+    """Namespace generated emails by run and worker so they never collide."""
+
+    run_id = run_dir(config).name.removeprefix("qa-run-").lower()
+    set_user_namespace(f"{run_id}.{worker_id()}")
+
+
+# ---- duration-based xdist scheduling --------------------------------------
+
+_DURATIONS = StashKey[DurationRecorder]()
+_DURATION_SCHEDULER = StashKey[DurationScheduling]()
+_TEST_MARKERS = "test_markers.json"
+
+
+def _duration_history(config) -> DurationHistory:
+    browser = (config.getoption("--browser", None) or ["chromium"])[0]
+    profile = f"{browser}/{os.environ.get('ENV_TYPE', 'local')}"
+    return DurationHistory(config.getoption("--duration-history"), profile)
+
+
+def make_duration_scheduler(config, log) -> DurationScheduling | None:
+    """Longest-first scheduler for ``--dist-by-duration`` with xdist's ``load``
+    distribution (the one ``-n`` uses); None leaves the choice to xdist.
+    """
+
+    if not config.getoption("--dist-by-duration"):
+        return None
+    if config.getoption("dist", "no") != "load":
+        return None
+    scheduler = DurationScheduling(
+        config, log, _duration_history(config), run_dir(config) / _TEST_MARKERS
+    )
+    config.stash[_DURATION_SCHEDULER] = scheduler
+    return scheduler
+
+
+def save_test_markers(session) -> None:
+    """Write the markers of the collected tests for the controller; one
+    worker is enough, they all collect the same tests.
+    """
+
+    config = session.config
+    if not config.getoption("--dist-by-duration") or worker_id() not in ("main", "gw0"):
+        return
+    write_test_markers(
+        run_dir(config) / _TEST_MARKERS,
+        {item.nodeid: marker_names(item) for item in session.items},
+    )
+
+
+def configure_duration_history(config) -> None:
+    """Record test durations on the controller, which sees every report."""
+
+    if config.getoption("--dist-by-duration") and not is_xdist_worker(config):
+        recorder = DurationRecorder()
+        config.pluginmanager.register(recorder, "duration_recorder")
+        config.stash[_DURATIONS] = recorder
+
+
+def save_duration_history(config) -> None:
+    """Fold this run's durations into ``--duration-history``."""
+
+    recorder = config.stash.get(_DURATIONS, None)
+    if recorder is None or not recorder.durations:
+        return
+    history = _duration_history(config)
+    history.record(
+        recorder.durations, read_test_markers(run_dir(config) / _TEST_MARKERS)
+    )
+    history.save()
+
+
+# ---- browser state ---------------------------------------------------------
+
+UI_VIEWPORT = {"width": 2560, "height": 1440}
+
+
+def consent_storage_state(config, browser) -> str:
+    """Path of the run's pre-accepted consent state; the first worker to ask
+    captures it while the others wait on the lock.
+    """
+
+    path = run_dir(config) / "consent_state.json"
+    with open(run_dir(config) / "consent_state.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if not path.exists():
+                capture_consent_state(browser, os.environ["ADDRESS"], path)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+    return str(path)
+
+
+def configure_readiness(config) -> None:
+    """Apply ``--readiness`` to every ``navigate()`` of this process."""
+
+    set_readiness(config.getoption("--readiness"))
+
+
+_CONCURRENT = StashKey[ConcurrentScheduler]()
+
+
+def configure_concurrent_tests(config) -> None:
+    """Register the plugin that runs ``@concurrent`` tests; its browser starts
+    when the first of them runs.
+    """
+
+    # Consent is clicked by the page's locator handler: capturing the shared
+    # consent state needs the sync browser these tests never start
+    scheduler = ConcurrentScheduler(
+        limit=config.getoption("--concurrent-tests"),
+        context_args={"viewport": UI_VIEWPORT},
+        screenshot_path=make_screenshot_path,
+        batch_ahead=concurrent_batches(config),
+    )
+    config.stash[_CONCURRENT] = scheduler
+    config.pluginmanager.register(scheduler, "concurrent_tests")
+
+
+def concurrent_batches(config) -> bool:
+    """Whether ``@concurrent`` tests run in batches: a worker gets them all at
+    once only under ``--dist loadgroup`` and ``--dist-by-duration``; elsewhere
+    each one runs on its own.
+    """
+
+    if is_xdist_worker(config):
+        # Decided by the controller: xdist resets a worker's --dist
+        return config.workerinput.get("concurrent_batches", False)
+    dist = config.getoption("dist", "no")
+    if dist == "load" and config.getoption("--dist-by-duration"):
+        return True
+    return dist in ("no", "loadgroup")
+
+
+def close_concurrent_tests(config) -> None:
+    """Stop the scheduler's browser."""
+
+    scheduler = config.stash.get(_CONCURRENT, None)
+    if scheduler is None:
+        return
+    scheduler.close()
+
+
+_TEST_FAILED = StashKey[bool]()
+
+
+def record_test_outcome(item, report) -> None:
+    """Remember that a phase of ``item`` failed, for fixtures tearing down."""
+
+    if report.failed:
+        item.stash[_TEST_FAILED] = True
+
+
+def item_failed(item) -> bool:
+    return item.stash.get(_TEST_FAILED, False)
+
+
+# pytest-playwright options whose artifacts need a context per test
+_ARTIFACT_OPTIONS = ("--tracing", "--video", "--screenshot")
+
+
+def open_context_pool(config, browser, context_args) -> ContextPool | None:
+    """This worker's pool of warm contexts, or None when ``--context-pool`` is
+    off, UI traffic is recorded/replayed, or pytest-playwright records traces,
+    videos or screenshots (all of these need a context per test).
+    """
+
+    size = config.getoption("--context-pool")
+    if not size or config.getoption("--ui-record") or config.getoption("--ui-replay"):
+        return None
+    if any(config.getoption(name, "off") != "off" for name in _ARTIFACT_OPTIONS):
+        return None
+    pool = ContextPool(
+        browser,
+        context_args,
+        os.environ["ADDRESS"],
+        size=size,
+        max_uses=config.getoption("--context-max-uses"),
+        ready=FeaturesItems.READY,
+    )
+    pool.warm()
+    return pool
+
+
+_NETWORK_ROWS: list[dict] = []
+# Markers that say nothing about what a test loads
+_NON_GROUPING_MARKERS = {"parametrize", "xfail", "skip", "skipif", "usefixtures"}
+
+
+def network_profile_name(request) -> str:
+    """Profile from the test's ``network_profile`` marker or ``--network-profile``."""
+
+    marker = request.node.get_closest_marker("network_profile")
+    if marker is not None:
+        return marker.args[0]
+    return request.config.getoption("--network-profile")
+
+
+@contextmanager
+def network_profile(context, request):
+    """Route ``context`` through the test's blocking profile and record what it
+    blocked, per test, for the end-of-run summary.
+    """
+
+    recorder = NetworkRecorder(
+        context, network_profile_name(request), os.environ["ADDRESS"]
+    )
+    started = time.perf_counter()
+    yield recorder
+    recorder.detach()
+    markers = {m.name for m in request.node.iter_markers()} - _NON_GROUPING_MARKERS
+    _NETWORK_ROWS.append(
+        {
+            "nodeid": request.node.nodeid,
+            "markers": sorted(markers - {"network_profile"}),
+            "profile": recorder.profile_name,
+            "seconds": time.perf_counter() - started,
+            **recorder.stats.as_dict(),
+        }
+    )
+
+
+_HAR_INDEXES: dict[Path, HarIndex] = {}
+_HAR_ROWS: list[dict] = []
+
+
+def configure_ui_har(config) -> None:
+    """Validate ``--ui-record``/``--ui-replay``."""
+
+    if config.getoption("--ui-record") and config.getoption("--ui-replay"):
+        raise UsageError("--ui-record and --ui-replay are exclusive")
+
+
+@contextmanager
+def har_session(context, request):
+    """Record the context's traffic for its module archive (``--ui-record``)
+    or serve it from that archive (``--ui-replay``).
+    """
+
+    config = request.config
+    if config.getoption("--ui-record"):
+        module = request.node.module.__name__
+        name = re.sub(r"[^\w.-]+", "_", request.node.name)
+        path = run_dir(config) / "har" / module / f"{worker_id()}-{name}.har"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written by Playwright when the context closes
+        context.route_from_har(path, update=True, update_content="embed")
+        yield
+    elif config.getoption("--ui-replay"):
+        har_dir = Path(config.getoption("--har-dir"))
+        archive = har_path(request.node.module.__name__, har_dir)
+        if archive not in _HAR_INDEXES:
+            _HAR_INDEXES[archive] = HarIndex.load(archive)
+        replay = HarReplay(_HAR_INDEXES[archive], load_catalog(har_dir))
+        replay.attach(context)
+        yield
+        _HAR_ROWS.append(
+            {
+                "nodeid": request.node.nodeid,
+                "served": replay.served,
+                "missed": replay.missed,
+            }
+        )
+    else:
+        yield
+
+
+def save_recorded_har(config) -> None:
+    """Controller: merge per-test HARs into one archive per test module and
+    save the product catalog the cart emulator needs, as shown in the recorded
+    pages (no extra request to the site).
+    """
+
+    if is_xdist_worker(config) or not config.getoption("--ui-record"):
+        return
+    har_dir = Path(config.getoption("--har-dir"))
+    recorded = run_dir(config) / "har"
+    written = {}
+    for module_dir in sorted(recorded.iterdir()) if recorded.exists() else []:
+        target = har_path(module_dir.name, har_dir)
+        if count := merge_har_files(module_dir.glob("*.har"), target):
+            written[target.name] = count
+    if written:
+        save_catalog(products_from_har(har_dir / name for name in written), har_dir)
+    config.stash[_HAR_REPORT] = written
+
+
+# ---- local stand-in server ------------------------------------------------
+
+_STANDIN = StashKey[StandinServer]()
+
+
+def configure_standin(config) -> None:
+    """Point ``ADDRESS`` at the local stand-in server for ``--standin`` runs.
+
+    The controller (or the only process without xdist) owns the server, so
+    accounts and carts are shared by every worker; workers receive its address
+    through ``workerinput``.
+    """
+
+    if not config.getoption("--standin"):
+        return
+    if is_xdist_worker(config):
+        address = config.workerinput["standin_address"]
+    else:
+        server = StandinServer().start()
+        config.stash[_STANDIN] = server
+        address = server.address
+    os.environ["ADDRESS"] = address
+
+
+def standin_address(config) -> str | None:
+    """Address of the run-wide stand-in server, if ``--standin`` is active."""
+
+    if not config.getoption("--standin"):
+        return None
+    return os.environ["ADDRESS"]
+
+
+def stop_standin(config) -> None:
+    """Stop the stand-in server owned by this process, if any."""
+
+    server = config.stash.get(_STANDIN, None)
+    if server is not None:
+        server.stop()
+
+
+# ---- session reporting -----------------------------------------------------
+
+_ACCOUNT_POOL_REPORT = StashKey[tuple]()
+_CASSETTE_REPORT = StashKey[int]()
+_HAR_REPORT = StashKey[dict]()
+_API_LATENCY_REPORT = StashKey[tuple]()
+
+
+def configure_cassette(config) -> None:
+    """Activate the API cassette selected by ``--api-record``/``--api-replay``."""
+
+    record = config.getoption("--api-record")
+    strict = config.getoption("--api-replay-strict")
+    replay = config.getoption("--api-replay") or strict
+    if record and replay:
+        raise UsageError("--api-record and --api-replay are exclusive")
+    if record or replay:
+        path = config.getoption("--api-cassette")
+        activate(Cassette(path, RECORD if record else REPLAY, strict=strict))
+
+
+def configure_api_retries(config) -> None:
+    """Apply ``--api-retries`` to the default ``Request`` retry policy."""
+
+    retries = config.getoption("--api-retries")
+    if retries is not None:
+        set_default_retry_policy(
+            replace(get_default_retry_policy(), max_retries=retries)
+        )
+
+
+def configure_response_cache(config) -> None:
+    """Activate the catalog response cache selected by ``--api-cache``."""
+
+    mode = config.getoption("--api-cache")
+    if mode == "off":
+        return
+    disk_dir = run_dir(config) / "response_cache" if mode == "shared" else None
+    response_cache.activate(
+        ResponseCache(ttl=config.getoption("--api-cache-ttl"), disk_dir=disk_dir)
+    )
+
+
+def _response_cache_stats(config) -> CacheStats | None:
+    cache = response_cache.active_cache()
+    return cache.stats() if cache is not None else None
+
+
+def _concurrent_stats(config) -> ConcurrencyStats:
+    scheduler = config.stash.get(_CONCURRENT, None)
+    return scheduler.stats if scheduler is not None else ConcurrencyStats()
+
+
+# Worker output key -> this process's ``SummedStats``, None when the feature is
+# off; printed by write_stats_summaries in this order
+_STATS_SOURCES = {
+    "consent": lambda config: get_consent_stats(),
+    "context_pool": lambda config: get_context_pool_stats(),
+    "navigation": lambda config: get_navigation_stats(),
+    "concurrent": _concurrent_stats,
+    "response_cache": _response_cache_stats,
+    "http_pool": lambda config: get_session_pool().stats(),
+}
+
+
+def publish_stats(config) -> None:
+    """Ship this worker's counters to the controller."""
+
+    for key, source in _STATS_SOURCES.items():
+        stats = source(config)
+        if stats is not None:
+            publish_worker_output(config, key, stats.as_dict())
+
+
+def write_stats_summaries(terminalreporter, config) -> None:
+    """One section per set of counters, summed over the controller and all
+    workers."""
+
+    for key, source in _STATS_SOURCES.items():
+        stats = source(config)
+        if stats is None:
+            continue
+        for data in worker_outputs(config, key):
+            stats = stats.merge(type(stats).from_dict(data))
+        line = stats.summary()
+        if line is not None:
+            terminalreporter.write_sep("-", stats.title)
+            terminalreporter.write_line(line)
+
+
+def publish_network_rows(config) -> None:
+    """Ship this worker's per-test blocking stats to the controller."""
+
+    publish_worker_output(config, "network", _NETWORK_ROWS)
+
+
+def publish_har_rows(config) -> None:
+    """Ship this worker's replay hit/miss counts to the controller."""
+
+    publish_worker_output(config, "har", _HAR_ROWS)
+
+
+def save_recorded_cassette(config) -> None:
+    """Ship recorded interactions to the controller, which writes one file."""
+
+    cassette = active_cassette()
+    if cassette is None or cassette.mode != RECORD:
+        return
+    publish_worker_output(config, "cassette", cassette.interactions())
+    if not is_xdist_worker(config):
+        parts = [*worker_outputs(config, "cassette"), cassette.interactions()]
+        config.stash[_CASSETTE_REPORT] = save_interactions(cassette.path, *parts)
+
+
+def store_account_pool_report(config, stats: dict, sweep) -> None:
+    """Keep the final account pool state for the terminal summary."""
+
+    config.stash[_ACCOUNT_POOL_REPORT] = (stats, sweep)
+
+
+def write_account_pool_summary(terminalreporter, config) -> None:
+    """Print provisioned/leased/swept account counts."""
+
+    pool_stats, sweep = config.stash.get(_ACCOUNT_POOL_REPORT, (None, None))
+    if not pool_stats or not pool_stats["provisioned"]:
+        return
+    terminalreporter.write_sep("-", "Account pool")
+    terminalreporter.write_line(
+        f"{pool_stats['provisioned']} accounts provisioned, "
+        f"{pool_stats['leases']} leases, {sweep.deleted} deleted in final sweep"
+    )
+    if sweep.failed:
+        terminalreporter.write_line(
+            f"Still able to log in after delete (run failed): "
+            f"{', '.join(sweep.failed)}",
+            red=True,
+        )
+
+
+def write_cassette_summary(terminalreporter, config) -> None:
+    """Print how many responses were recorded and where to."""
+
+    if _CASSETTE_REPORT not in config.stash:
+        return
+    terminalreporter.write_sep("-", "API cassette")
+    terminalreporter.write_line(
+        f"{config.stash[_CASSETTE_REPORT]} responses recorded to "
+        f"{active_cassette().path}"
+    )
+
+
+def save_api_latency_report(config) -> None:
+    """Merge per-worker API timings and write them next to the HTML report."""
+
+    metrics = get_api_metrics()
+    publish_worker_output(config, "api_metrics", metrics.as_dicts())
+    if is_xdist_worker(config):
+        return
+    for endpoints in worker_outputs(config, "api_metrics"):
+        metrics.merge(endpoints)
+    if not metrics.endpoints():
+        return
+    rows = summarize(metrics.endpoints())
+    html_path = config.getoption("htmlpath", None)
+    report_dir = (
+        Path(html_path).parent if html_path else config.rootpath / "tests/artifacts"
+    )
+    report_dir.mkdir(parents=True, exist_ok=True)
+    path = report_dir / "api_latency.json"
+    path.write_text(json.dumps({"endpoints": rows}, indent=2))
+    config.stash[_API_LATENCY_REPORT] = (rows, path)
+
+
+def write_api_latency_summary(terminalreporter, config) -> None:
+    """Print the per-endpoint latency table (milliseconds)."""
+
+    if _API_LATENCY_REPORT not in config.stash:
+        return
+    rows, path = config.stash[_API_LATENCY_REPORT]
+    terminalreporter.write_sep("-", "API latency (ms)")
+    for line in format_table(rows):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"Saved to {path}")
+
+
+def write_duration_schedule_summary(terminalreporter, config) -> None:
+    """Print the makespan the duration-based scheduler predicted and the one
+    the workers actually took.
+    """
+
+    recorder = config.stash.get(_DURATIONS, None)
+    if recorder is None or not recorder.durations:
+        return
+    scheduler = config.stash.get(_DURATION_SCHEDULER, None)
+    history = _duration_history(config)
+    terminalreporter.write_sep("-", f"Duration-based distribution ({history.profile})")
+    if scheduler is None:
+        line = "no xdist load distribution: tests ran in their usual order"
+    elif scheduler.estimates is None:
+        line = "no duration history yet: xdist's default order was used"
+    else:
+        collected = len(scheduler.estimates)
+        finished = scheduler.finished.values()
+        line = (
+            f"{collected} tests on {len(scheduler.finished)} workers, longest first "
+            f"({scheduler.from_history} from history, "
+            f"{collected - scheduler.from_history} estimated): makespan predicted "
+            f"{scheduler.predicted:.1f}s, actual {scheduler.makespan:.1f}s "
+            f"(workers done after {min(finished, default=0):.1f}-"
+            f"{max(finished, default=0):.1f}s)"
+        )
+    terminalreporter.write_line(line)
+    terminalreporter.write_line(
+        f"{len(recorder.durations)} test durations recorded in {history.path}"
+    )
+
+
+def write_network_profile_summary(terminalreporter, config) -> None:
+    """Per marker and profile: requests blocked/allowed, bytes saved and the
+    average time a test held its context, to pick the fastest safe profile.
+    """
+
+    rows = list(_NETWORK_ROWS)
+    for worker_rows in worker_outputs(config, "network"):
+        rows.extend(worker_rows)
+    if not any(row["blocked"] for row in rows):
+        return
+    groups = defaultdict(list)
+    for row in rows:
+        for marker in row["markers"] or ["(none)"]:
+            groups[(marker, row["profile"])].append(row)
+    terminalreporter.write_sep("-", "Network profiles")
+    terminalreporter.write_line(
+        f"{'marker':<16} {'profile':<17} {'tests':>5} {'blocked':>8} "
+        f"{'allowed':>8} {'saved KB':>9} {'avg s':>6}"
+    )
+    for (marker, profile), items in sorted(groups.items()):
+        terminalreporter.write_line(
+            f"{marker:<16} {profile:<17} {len(items):>5} "
+            f"{sum(r['blocked'] for r in items):>8} "
+            f"{sum(r['allowed'] for r in items):>8} "
+            f"{sum(r['bytes_saved'] for r in items) / 1024:>9.0f} "
+            f"{sum(r['seconds'] for r in items) / len(items):>6.2f}"
+        )
+
+
+def write_har_summary(terminalreporter, config) -> None:
+    """Print archives written (record) or requests served/missed (replay)."""
+
+    written = config.stash.get(_HAR_REPORT, None)
+    if written:
+        terminalreporter.write_sep("-", "UI HAR archives")
+        for name, entries in written.items():
+            terminalreporter.write_line(f"{name}: {entries} responses")
+        return
+    rows = list(_HAR_ROWS)
+    for worker_rows in worker_outputs(config, "har"):
+        rows.extend(worker_rows)
+    if not rows:
+        return
+    missed = [url for row in rows for url in row["missed"]]
+    terminalreporter.write_sep("-", "UI HAR replay")
+    terminalreporter.write_line(
+        f"{sum(row['served'] for row in rows)} requests served from archives, "
+        f"{len(missed)} not archived (aborted)"
+    )
+    for url in sorted(set(missed))[:10]:
+        terminalreporter.write_line(f"  missing: {url}")
@@ -0,0 +1,29 @@
+import asyncio
+
+from pages.async_pages import FeaturesItems, ProductDetailsPage
+from utils.markers import product_details, ui
+
+PAGES = 3
+
+
+@ui
+@product_details
+def test_product_details_match_catalog_concurrently(async_ui):
+    """Open several product pages at once and compare them with the home page
+    catalog, each page in its own context, all driven by one worker.
+    """
+
+    async def read_details(index):
+        page = await async_ui.new_page()
+        features = FeaturesItems(page)
+        await features.load()
+        card = (await features.catalog()).by_index(index)
+        await features.view_product(index)
+        return card, await ProductDetailsPage(page).info()
+
+    async def flow():
+        return await asyncio.gather(*(read_details(i) for i in range(PAGES)))
+
+    for card, info in async_ui.run(flow()):
+        assert (info.name, info.price) == (card.name, card.price)
+        assert info.get("Brand"), f"{card.name} shows no brand"
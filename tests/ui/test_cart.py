@@ -163,3 +163,13 @@ def test_cart_product_image_redirects_to_details(page_on_address):
     # image.click()
     # details = ProductDetailsPage(page_on_address)
     # expect(details.get_name()).to_equal(prod.name)
+
+
+@ui
+@cart
+def test_cart_lists_seeded_products(page_on_address, seeded_cart):
+    """Products put in the cart by request show up like ones added in the UI."""
+
+    products = seeded_cart([(0, 2), (3, 1)])
+    cart = open_cart(page_on_address)
+    assert_cart_all(cart, [(prod.name, prod.qty, prod.price) for prod in products])
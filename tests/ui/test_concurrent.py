@@ -0,0 +1,35 @@
+import pytest
+
+from pages.async_pages import CartPage, FeaturesItems, ProductDetailsPage
+from pages.cart import normalize_name
+from utils.markers import cart, concurrent, product_details, ui
+
+
+@ui
+@product_details
+@concurrent
+@pytest.mark.parametrize("index", range(4))
+async def test_product_details_match_card(async_page, index):
+    """The details page of a card shows the card's name and price."""
+
+    features = FeaturesItems(async_page)
+    await features.load()
+    card = (await features.catalog()).by_index(index)
+    await features.view_product(index)
+    info = await ProductDetailsPage(async_page).info()
+    assert (info.name, info.price) == (card.name, card.price)
+
+
+@ui
+@cart
+@concurrent
+@pytest.mark.parametrize("index", range(3))
+async def test_cart_holds_only_own_product(async_page, index):
+    """Tests running at the same time do not see each other's carts."""
+
+    features = FeaturesItems(async_page)
+    await features.load()
+    name = await features.get_product_name(index)
+    await features.add_to_cart_and_view_cart(index)
+    snapshot = await CartPage(async_page).snapshot()
+    assert [normalize_name(line.name) for line in snapshot] == [normalize_name(name)]
@@ -0,0 +1,66 @@
+from dataclasses import replace
+
+import pytest
+
+from components.consent_popup import (
+    ConsentPopup,
+    capture_consent_state,
+    get_consent_stats,
+)
+from utils.markers import ui
+
+
+@pytest.fixture
+def fresh_page(browser, standin_server):
+    """A page without the suite's pre-accepted consent, on the stand-in site."""
+    context = browser.new_context()
+    page = context.new_page()
+    page.goto(standin_server)
+    yield page
+    context.close()
+
+
+def popup(page):
+    return page.locator(ConsentPopup._CONSENT_BTN)
+
+
+@ui
+def test_captured_state_starts_without_popup(browser, standin_server, tmp_path):
+    """The saved state carries the consent cookie, so the popup never shows."""
+
+    before = replace(get_consent_stats())
+    path = capture_consent_state(browser, standin_server, tmp_path / "consent.json")
+    assert get_consent_stats().captured == before.captured + 1
+
+    context = browser.new_context(storage_state=path)
+    try:
+        page = context.new_page()
+        page.goto(standin_server)
+        assert popup(page).count() == 0
+    finally:
+        context.close()
+
+
+@ui
+def test_handler_dismisses_the_popup(fresh_page):
+    """An action blocked by the popup clicks consent first, then goes on."""
+
+    before = replace(get_consent_stats())
+    assert popup(fresh_page).is_visible()
+    ConsentPopup(fresh_page).dismiss_when_shown()
+    fresh_page.get_by_role("link", name="Cart").click()
+    fresh_page.wait_for_url("**/view_cart")
+    assert get_consent_stats().handled == before.handled + 1
+
+
+@ui
+def test_accept_waits_only_when_asked(fresh_page):
+    consent = ConsentPopup(fresh_page)
+    before = replace(get_consent_stats())
+    consent.accept()
+    assert not popup(fresh_page).is_visible()
+
+    consent.accept(timeout=200)  # nothing left to click: gives up quietly
+    consent.accept()
+    stats = get_consent_stats()
+    assert (stats.checks, stats.clicked) == (before.checks + 3, before.clicked + 1)
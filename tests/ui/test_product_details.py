@@ -1,8 +1,25 @@
+import time
+
 import pytest
 
 from pages.main_page import FeaturesItems
 from pages.product_details_page import ProductDetailsPage
 from utils.markers import product_details, ui
+from utils.standin_data import PRODUCTS
+from utils.standin_pages import render_product_details
+
+LABELS = ("Category", "Availability", "Condition", "Brand")
+ROUNDS = 5  # timings of info() vs per-field reads, the best one is printed
+
+
+def best_of(read):
+    """Value of ``read()`` and its fastest time over ``ROUNDS`` runs."""
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        value = read()
+        timings.append(time.perf_counter() - started)
+    return value, min(timings)
 
 
 @ui
@@ -51,3 +68,37 @@ def test_quantity_non_integer_input_rejected(page_on_address, qty):
     ) or val == "", (
         f"Input '{qty}' should not be accepted as quantity, but got: '{val}'"
     )
+
+
+@ui
+@product_details
+def test_info_matches_per_field_reads(page):
+    """info() reads the same fields as the per-field locators.
+
+    The stand-in's product page is set as the page content, so the expected
+    values are known and the timings printed for both ways only measure
+    browser round-trips; the ``page`` fixture still needs ``ADDRESS`` for the
+    consent state of its context. The timings are not compared: they are a
+    benchmark to read in the report, not a pass/fail criterion.
+    """
+    product = PRODUCTS[0]
+    page.set_content(render_product_details(product))
+    details = ProductDetailsPage(page)
+
+    def per_field():
+        return (
+            {label: details._get_info_field(label) for label in LABELS},
+            details.name_locator.inner_text().strip(),
+            details._parse_price(details.price_locator.inner_text()),
+        )
+
+    (scanned, name, price), scan_elapsed = best_of(per_field)
+    info, info_elapsed = best_of(details.info)
+
+    assert (info.name, info.price, info.quantity) == (name, price, 1)
+    assert {label: info.get(label) for label in LABELS} == scanned
+    assert scanned["Brand"] == product.brand
+    print(
+        f"per-field reads {scan_elapsed * 1000:.1f} ms, "
+        f"info() {info_elapsed * 1000:.1f} ms (best of {ROUNDS})"
+    )
@@ -0,0 +1,101 @@
+import json
+import random
+from statistics import fmean
+
+from utils.api_metrics import (
+    MAX_SAMPLES,
+    ApiMetrics,
+    EndpointMetrics,
+    format_table,
+    percentile,
+    response_code,
+    summarize,
+)
+from utils.markers import unit
+from utils.response_codec import response_from_dict
+
+
+def answer(body, status=200):
+    text = body if isinstance(body, str) else json.dumps(body)
+    return response_from_dict({"status": status, "body": text})
+
+
+@unit
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert [percentile(values, pct) for pct in (50, 90, 99, 100)] == [50, 90, 99, 100]
+    assert percentile([0.2], 99) == 0.2
+    assert percentile([1, 2, 3], 0) == 1
+    assert percentile([], 50) == 0.0
+
+
+@unit
+def test_errors_are_counted_by_response_code():
+    """The site answers HTTP 200 with the real status in ``responseCode``."""
+
+    assert response_code(answer({"responseCode": 404, "message": "no"})) == 404
+    assert response_code(answer({"responseCode": "404"})) == 200  # not a code
+    assert response_code(answer("<html>Bad Gateway</html>", 502)) == 502
+    assert response_code(answer([1, 2])) == 200
+
+    metrics = ApiMetrics()
+    for response in (
+        answer({"responseCode": 200}),
+        answer({"responseCode": 404}),
+        answer("<html>Bad Gateway</html>", 502),
+        answer("<html>ok</html>"),
+    ):
+        metrics.record("POST", "/api/verifyLogin", response, 0.01)
+    metrics.add("POST /api/verifyLogin", 201, 0.01, 0.0, error=True)
+
+    endpoint = metrics.endpoints()["POST /api/verifyLogin"]
+    assert (endpoint.calls, endpoint.errors) == (5, 3)
+    assert endpoint.statuses == {"200": 2, "404": 1, "502": 1, "201": 1}
+
+
+@unit
+def test_reservoir_keeps_a_bounded_uniform_sample():
+    """Totals stay exact; the sample is capped but covers the whole run."""
+
+    calls = 10 * MAX_SAMPLES
+    metrics = ApiMetrics()
+    for index in range(calls):
+        metrics.add("GET /api/productsList", 200, index, index / 2, size=10)
+
+    endpoint = metrics.endpoints()["GET /api/productsList"]
+    assert endpoint.calls == calls and len(endpoint.samples) == MAX_SAMPLES
+    assert endpoint.total_max == calls - 1 and endpoint.bytes == 10 * calls
+    assert endpoint.total_sum == sum(range(calls))
+    totals = [total for total, _ in endpoint.samples]
+    # Mostly late calls, in proportion: not the first MAX_SAMPLES kept forever
+    assert sum(total >= MAX_SAMPLES for total in totals) > 0.8 * MAX_SAMPLES
+    assert abs(fmean(totals) - (calls - 1) / 2) < 0.05 * calls
+
+
+@unit
+def test_merge_keeps_each_side_share_of_the_sample():
+    busy = EndpointMetrics(calls=3000, samples=[(1.0, 0.0)] * MAX_SAMPLES)
+    quiet = EndpointMetrics(calls=1000, samples=[(2.0, 0.0)] * MAX_SAMPLES)
+    merged = busy.merge(quiet, random.Random(0))
+    assert merged.calls == 4000 and len(merged.samples) == MAX_SAMPLES
+    assert sum(total == 1.0 for total, _ in merged.samples) == 750
+
+    workers = ApiMetrics()
+    workers.merge({"GET /a": busy.as_dict()})
+    workers.merge({"GET /a": quiet.as_dict()})
+    assert workers.endpoints()["GET /a"].calls == 4000
+
+
+@unit
+def test_summary_rows_slowest_first():
+    metrics = ApiMetrics()
+    for total in (0.1, 0.2, 0.3):
+        metrics.add("GET /fast", 200, total, total / 2, size=2048)
+    metrics.add("POST /slow", 500, 2.0, 1.0, retries=2)
+
+    slow, fast = summarize(metrics.endpoints())
+    assert (slow["endpoint"], slow["errors"], slow["retries"]) == ("POST /slow", 1, 2)
+    assert fast["total_ms"]["p50"] == 200 and fast["total_ms"]["max"] == 300
+    assert fast["avg_bytes"] == 2048
+    header, _, *lines = format_table([slow, fast])
+    assert header.startswith("endpoint") and lines[1].startswith("GET /fast ")
@@ -0,0 +1,86 @@
+import pytest
+
+from pages.cart import CartPage, CartPageBase, CartSnapshot, ProductRow, normalize_name
+from utils.markers import unit
+
+RAW_ROWS = [
+    {
+        "id": "product-1",
+        "name": " Blue  Top\n",
+        "category": "Women > Tops",
+        "price": "Rs. 500",
+        "quantity": "2",
+        "total": "Rs. 1,000",
+    },
+    {
+        "id": "product-28",
+        "name": "Pure Cotton V-Neck T-Shirt",
+        "category": "Men > Tshirts",
+        "price": "Rs. 1,299",
+        "quantity": " 1 ",
+        "total": "Rs. 1,299",
+    },
+]
+
+
+class NoBrowser:
+    """Page/locator stand-in: building locators is free (as in Playwright),
+    any read fails, so values must come from the snapshot line."""
+
+    def locator(self, selector):
+        return self
+
+    def __getattr__(self, name):
+        raise AssertionError(f"browser round-trip: {name}")
+
+
+@pytest.fixture
+def snapshot() -> CartSnapshot:
+    return CartPageBase._parse_snapshot(RAW_ROWS)
+
+
+@unit
+def test_snapshot_parses_rows(snapshot):
+    first, second = snapshot
+    assert (first.id, first.name, first.price, first.quantity, first.total) == (
+        1,
+        "Blue  Top",
+        500,
+        2,
+        1000,
+    )
+    assert second.price == second.total == 1299 and second.quantity == 1
+    assert snapshot.ids == [1, 28] and len(snapshot) == 2
+    assert snapshot.total == 2299
+    with pytest.raises(AttributeError):
+        first.quantity = 3
+
+
+@unit
+def test_snapshot_indexes_by_id_and_normalized_name(snapshot):
+    assert snapshot.by_id(28).name == "Pure Cotton V-Neck T-Shirt"
+    assert snapshot.by_id(2) is None
+    assert snapshot.by_name("Blue Top") is snapshot.by_id(1)
+    assert snapshot.by_name("  blue top") is None  # case still matters
+    assert snapshot.by_name("Blue\n  Top ").id == 1
+    assert normalize_name("  a\tb \n c ") == "a b c"
+    assert normalize_name(42) == "42"
+    assert not CartSnapshot([])
+
+
+@unit
+def test_rows_read_from_a_snapshot(snapshot):
+    """Rows built from a snapshot answer without touching the page."""
+
+    cart = CartPage(NoBrowser())
+    row = cart.get_product_row(1, snapshot)
+    assert (row.id, row.name, row.category) == (1, "Blue  Top", "Women > Tops")
+    assert (row.price, row.quantity, row.total) == (500, 2, 1000)
+
+    rows = cart.get_all_rows(snapshot)
+    assert [r.id for r in rows] == [1, 28]
+    assert rows[1].total == 1299
+
+    live = ProductRow(NoBrowser())
+    with pytest.raises(AssertionError, match="round-trip"):
+        live.name
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from utils.cassette import RECORD, REPLAY, Cassette, cassette_key, save_interactions
+from utils.data_factory import get_user_factory, set_user_namespace
+from utils.markers import unit
+from utils.payloads import seed_payloads, user_create_payload
+from utils.response_codec import response_from_dict
+
+SEED = 1234
+
+
+@pytest.fixture(autouse=True)
+def own_namespace():
+    """Give the process-wide factory its run namespace back afterwards."""
+    namespace = get_user_factory().namespace
+    yield
+    set_user_namespace(namespace)
+
+
+def record_user(cassette: Cassette, namespace: str) -> tuple[str, dict]:
+    """Create one seeded user the way a recording test run would."""
+    set_user_namespace(namespace)
+    seed_payloads(SEED, replay=cassette.mode == REPLAY)
+    user = user_create_payload()
+    key = cassette_key("POST", "/api/createAccount", data=user)
+    body = json.dumps({"responseCode": 200, "user": {"email": user["email"]}})
+    cassette.record(key, response_from_dict({"status": 200, "body": body}))
+    return key, user
+
+
+@unit
+def test_recordings_keep_run_unique_emails(tmp_path):
+    """Two recordings of the same test create different accounts, yet index
+    them under the same key."""
+
+    first_key, first = record_user(Cassette(tmp_path / "a.json", RECORD), "run1.gw0")
+    second_key, second = record_user(Cassette(tmp_path / "b.json", RECORD), "run2.gw0")
+    assert first["email"].startswith("qa.run1.gw0.")
+    assert second["email"].startswith("qa.run2.gw0.")
+    assert {**first, "email": ""} == {**second, "email": ""}
+    assert first_key == second_key
+    assert "{namespace}" in first_key and "run1" not in first_key
+
+
+@unit
+def test_replay_fills_in_its_own_namespace(tmp_path):
+    path = tmp_path / "api.json"
+    recording = Cassette(path, RECORD)
+    key, recorded = record_user(recording, "run1.gw0")
+    save_interactions(path, recording.interactions())
+    assert "run1" not in path.read_text()
+
+    replaying = Cassette(path, REPLAY)
+    set_user_namespace("run2.gw1")
+    seed_payloads(SEED, replay=True)
+    user = user_create_payload()
+    assert get_user_factory().namespace == f"s{SEED:08x}"
+    assert {**user, "email": ""} == {**recorded, "email": ""}
+
+    answer = replaying.replay(cassette_key("POST", "/api/createAccount", data=user))
+    assert answer.json()["user"]["email"] == user["email"]
+    assert replaying.replay("GET /api/other {}") is None
@@ -0,0 +1,219 @@
+import pytest
+
+from utils.concurrent_tests import ConcurrentScheduler
+from utils.markers import unit
+
+pytest_plugins = ["pytester"]
+
+# The inner runs happen in this process: no second pytest-playwright
+OPTIONS = (
+    "-p",
+    "no:playwright",
+    "-p",
+    "no:cacheprovider",
+    "-W",
+    "ignore::pytest.PytestUnknownMarkWarning",
+)
+
+
+class FakePage:
+    def locator(self, selector):
+        return selector
+
+    async def add_locator_handler(self, locator, handler):
+        pass
+
+    async def screenshot(self, path):
+        with open(path, "wb") as file:
+            file.write(b"png")
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    """``AsyncBrowser`` without Playwright: contexts of fake pages."""
+
+    def __init__(self):
+        self.browser = self
+        self.contexts = 0
+
+    async def new_context(self, **kwargs):
+        self.contexts += 1
+        return FakeContext()
+
+    def close(self):
+        pass
+
+
+class Scheduler(ConcurrentScheduler):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.fake = FakeBrowser()
+
+    def _launch(self, loop):
+        return self.fake
+
+
+@pytest.fixture
+def run(pytester, tmp_path):
+    """Run a test module with the plugin on fake browsers; returns the run's
+    result and the plugin."""
+
+    def run(source, *args, limit=2, batch_ahead=True):
+        pytester.makepyfile(test_module=source)
+        plugin = Scheduler(
+            limit, {}, lambda item: tmp_path / f"{item.name}.png", batch_ahead
+        )
+        try:
+            result = pytester.runpytest(*OPTIONS, *args, plugins=[plugin])
+        finally:
+            plugin.close()
+        return result, plugin
+
+    return run
+
+
+TIMED = """
+import asyncio
+import time
+
+import pytest
+
+STARTED = []
+
+
+async def body(name, seconds=0.05):
+    STARTED.append((name, time.perf_counter()))
+    await asyncio.sleep(seconds)
+"""
+
+
+@unit
+def test_batches_run_at_most_limit_at_once(run):
+    """Five tests run as one batch, two at a time; each is reported on its own
+    with the duration its body took."""
+
+    result, plugin = run(TIMED + """
+@pytest.mark.concurrent
+@pytest.mark.parametrize("index", range(5))
+async def test_card(async_page, async_context, index):
+    assert async_page is not None and async_context is not None
+    await body(index)
+""")
+    result.assert_outcomes(passed=5)
+    stats = plugin.stats
+    assert (stats.tests, stats.batches, stats.peak) == (5, 1, 2)
+    assert plugin.fake.contexts == 5  # the fixtures open none of their own
+    assert stats.wall_seconds < stats.test_seconds
+    calls = [
+        report
+        for report in result.reprec.getreports("pytest_runtest_logreport")
+        if report.when == "call"
+    ]
+    assert len(calls) == 5 and all(report.duration >= 0.05 for report in calls)
+
+
+@unit
+def test_other_tests_fall_back_to_running_alone(run):
+    """A regular test between concurrent ones, other fixtures and skip marks
+    do not stop the run: those tests run on their own, like any test."""
+
+    source = TIMED + """
+@pytest.mark.concurrent
+async def test_batched(async_page):
+    await body("batched")
+
+
+def test_regular():
+    assert not STARTED or STARTED[-1][0] == "batched"
+
+
+@pytest.mark.concurrent
+async def test_with_fixture(async_page, tmp_path):
+    assert async_page is not None and tmp_path.is_dir()
+    await body("alone")
+
+
+@pytest.mark.concurrent
+@pytest.mark.skipif(True, reason="not here")
+async def test_skipped(async_page):
+    raise AssertionError("must not run")
+"""
+    result, plugin = run(source)
+    result.assert_outcomes(passed=3, skipped=1)
+    assert (plugin.stats.tests, plugin.stats.batches) == (2, 2)
+
+    result, plugin = run(source, batch_ahead=False)
+    result.assert_outcomes(passed=3, skipped=1)
+    assert (plugin.stats.tests, plugin.stats.batches) == (2, 2)
+    assert plugin.fake.contexts == 2
+
+
+@unit
+def test_failures_are_reported_with_a_screenshot(run, tmp_path):
+    result, plugin = run(TIMED + """
+@pytest.mark.concurrent
+async def test_fails(async_page):
+    await body("fails")
+    assert 1 + 1 == 3, "bad math"
+
+
+@pytest.mark.concurrent
+@pytest.mark.xfail(reason="known")
+async def test_known_bug(async_page):
+    raise ValueError("known")
+
+
+@pytest.mark.concurrent
+def test_not_async(async_page):
+    pass
+""")
+    result.assert_outcomes(failed=2, xfailed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*AssertionError: bad math*",
+            "*TypeError: @concurrent tests must be 'async def'*",
+        ]
+    )
+    assert (tmp_path / "test_fails.png").read_bytes() == b"png"
+    # The sync test is left out of the batch and then refused
+    assert (plugin.stats.tests, plugin.stats.batches) == (2, 1)
+
+
+FLAKY = """
+import pytest
+
+ATTEMPTS = []
+
+
+@pytest.mark.concurrent
+async def test_flaky(async_page):
+    ATTEMPTS.append(async_page)
+    if len(ATTEMPTS) == 1:
+        raise {error}("first attempt")
+"""
+
+
+@unit
+def test_failed_batched_test_is_rerun_alone(run):
+    """pytest-rerunfailures reruns the test through the protocol; the rerun
+    does not reuse the batch's outcome but runs again on its own."""
+
+    result, plugin = run(FLAKY.format(error="ConnectionError"), "--reruns", "1")
+    assert result.parseoutcomes() == {"passed": 1, "rerun": 1}
+    assert (plugin.stats.tests, plugin.stats.batches) == (2, 2)
+
+    result, plugin = run(
+        FLAKY.format(error="AssertionError"),
+        "--reruns",
+        "1",
+        "--only-rerun",
+        "ConnectionError",
+    )
+    assert result.parseoutcomes() == {"failed": 1}
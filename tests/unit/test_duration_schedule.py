@@ -0,0 +1,127 @@
+import pytest
+
+from utils.duration_schedule import (
+    DurationHistory,
+    DurationScheduling,
+    lpt_makespan,
+    write_test_markers,
+)
+from utils.markers import unit
+
+PROFILE = "chromium/local"
+CART = "tests/ui/test_cart.py"
+MODAL = "tests/ui/test_shopping_modal.py"
+
+
+class Config:
+    """What ``LoadScheduling`` reads from the config: ``-n 2``."""
+
+    def getvalue(self, name):
+        return ["2*popen"]
+
+    def getoption(self, name):
+        return None
+
+
+class Worker:
+    """Stands in for xdist's WorkerController."""
+
+    def __init__(self, name):
+        self.gateway = type("Gateway", (), {"id": name})
+        self.sent = []
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def scheduler(tmp_path, history, collection, markers=None):
+    markers_path = tmp_path / "markers.json"
+    write_test_markers(markers_path, markers or {})
+    sched = DurationScheduling(Config(), None, history, markers_path)
+    workers = [Worker("gw0"), Worker("gw1")]
+    for worker in workers:
+        sched.add_node(worker)
+        sched.add_node_collection(worker, collection)
+    sched.schedule()
+    return sched, workers
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = DurationHistory(tmp_path / "durations.json", PROFILE)
+    history.record(
+        {f"{CART}::test_one": 8.0, f"{CART}::test_two": 4.0, f"{MODAL}::test": 1.0},
+        {f"{CART}::test_one": ["cart", "ui"], f"{MODAL}::test": ["ui"]},
+    )
+    return history
+
+
+@unit
+def test_record_smooths_and_keeps_profiles_apart(tmp_path):
+    path = tmp_path / "durations.json"
+    history = DurationHistory(path, PROFILE)
+    history.record({"t": 2.0}, {})
+    history.record({"t": 4.0}, {"t": ["api"]})
+    assert history.tests == {"t": {"seconds": 3.0, "runs": 2, "markers": ["api"]}}
+    history.save()
+
+    assert DurationHistory(path, PROFILE).tests["t"]["seconds"] == 3.0
+    assert DurationHistory(path, "firefox/local").tests == {}
+    path.write_text("{broken")
+    assert DurationHistory(path, PROFILE).tests == {}
+
+
+@unit
+def test_estimate_falls_back_to_markers_module_and_run(tmp_path, history):
+    """Known tests keep their own time; new ones take the slowest average of
+    their markers, else their module's average, else the overall one."""
+
+    new_cart = f"{CART}::test_new"
+    estimates = history.estimate(
+        [f"{CART}::test_one", new_cart, f"{MODAL}::test_new", "tests/api/x.py::t"],
+        {f"{MODAL}::test_new": ["cart", "ui"]},
+    )
+    assert estimates == {
+        f"{CART}::test_one": 8.0,
+        new_cart: 6.0,  # module average
+        f"{MODAL}::test_new": 8.0,  # cart average beats ui's 4.5
+        "tests/api/x.py::t": pytest.approx(13 / 3),
+    }
+    assert DurationHistory(tmp_path / "none.json", PROFILE).estimate(["t"], {}) is None
+
+
+@unit
+def test_lpt_makespan():
+    assert lpt_makespan([3, 3, 2, 2, 2], 2) == 7
+    assert lpt_makespan([5, 1, 1], 4) == 5
+    assert lpt_makespan([1, 2], 0) == 3  # no workers counts as one
+    assert lpt_makespan([], 2) == 0
+
+
+@unit
+def test_schedule_without_history_keeps_xdist_order(tmp_path):
+    empty = DurationHistory(tmp_path / "durations.json", PROFILE)
+    sched, (first, second) = scheduler(tmp_path, empty, ["a", "b", "c", "d"])
+    assert sched.estimates is None and sched.predicted == 0.0
+    assert (first.sent, second.sent) == ([0, 1], [2, 3])
+
+
+@unit
+def test_schedule_sends_longest_first_and_concurrent_last(tmp_path, history):
+    collection = [
+        f"{MODAL}::test",
+        f"{CART}::test_two",
+        "tests/ui/test_concurrent.py::test_a",
+        f"{CART}::test_one",
+    ]
+    markers = {"tests/ui/test_concurrent.py::test_a": ["concurrent"]}
+    sched, (first, second) = scheduler(tmp_path, history, collection, markers)
+
+    assert sched.from_history == 3
+    assert sched.predicted == lpt_makespan(sched.estimates, 2)
+    # Round-robin from the longest; the concurrent test waits at the end
+    assert (first.sent, second.sent) == ([3, 0], [1, 2])
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+
+from utils import api_requests, async_api_requests
+from utils.endpoints import API, REGISTRY, ResponseSchemaError
+from utils.markers import unit
+from utils.request_builder import Request
+from utils.response_codec import response_from_dict
+
+SITE = "https://shop.test"
+
+
+def answer(body, status=200):
+    text = body if isinstance(body, str) else json.dumps(body)
+    return response_from_dict({"status": status, "body": text})
+
+
+@unit
+def test_every_endpoint_is_exposed():
+    """Each registry entry is a sync and an async call with its own name and
+    the arguments of its fields."""
+
+    assert set(API) == set(REGISTRY)
+    for name, compiled in API.items():
+        assert getattr(api_requests, name) is compiled.call
+        assert getattr(async_api_requests, name) is compiled.call_async
+        assert compiled.call.__name__ == name
+        assert compiled.call.endpoint is compiled
+    assert list(API["verify_login_valid"].signature.parameters) == [
+        "email",
+        "password",
+    ]
+    assert list(API["create_account"].signature.parameters) == ["user"]
+    assert not API["get_all_brands"].signature.parameters
+
+
+@unit
+def test_request_carries_url_and_payload(monkeypatch):
+    """The URL is joined once per ADDRESS; arguments land in the endpoint's
+    body kind, positional or by name."""
+
+    monkeypatch.setenv("ADDRESS", SITE)
+    login = API["verify_login_valid"].request(Request, "a@b.c", password="pw")
+    assert login._prepare_url() == f"{SITE}/api/verifyLogin"
+    assert login._data == {"email": "a@b.c", "password": "pw"}
+
+    detail = API["get_user_detail_by_email"].request(Request, "a@b.c")
+    assert detail._params == {"email": "a@b.c"}
+    assert detail._data is None
+
+    user = {"name": "Ann"}
+    assert API["create_account"].request(Request, user)._data is user
+    assert API["get_all_products"].request(Request)._cacheable
+
+    monkeypatch.setenv("ADDRESS", "http://127.0.0.1:8000")
+    brands = API["get_all_brands"].request(Request)
+    assert brands._prepare_url() == "http://127.0.0.1:8000/api/brandsList"
+
+
+@unit
+def test_missing_keys():
+    """Success answers need the whole schema, error answers only responseCode;
+    anything but a JSON object misses every key."""
+
+    brands = API["get_all_brands"]
+    assert brands.missing_keys(answer({"responseCode": 200, "brands": []})) == []
+    assert brands.missing_keys(answer({"responseCode": 200})) == ["brands"]
+    assert brands.missing_keys(answer({"responseCode": 405, "message": "no"})) == []
+    assert brands.missing_keys(answer({"message": "no"})) == [
+        "responseCode",
+        "brands",
+    ]
+    assert brands.missing_keys(answer("<html>Server Error</html>", 500)) == [
+        "responseCode",
+        "brands",
+    ]
+    assert brands.missing_keys(answer([1, 2])) == ["responseCode", "brands"]
+
+
+@unit
+def test_check_is_opt_in(monkeypatch):
+    """The plain calls hand back whatever came; checked() raises on an answer
+    without the schema's keys."""
+
+    brands = API["get_all_brands"]
+    good = answer({"responseCode": 200, "brands": []})
+    bad = answer("<html>Bad Gateway</html>", 502)
+    assert brands.check(good) is good
+    with pytest.raises(ResponseSchemaError, match="get_all_brands: .*brands"):
+        brands.check(bad)
+
+    sent = []
+
+    def call():
+        sent.append(True)
+        return bad
+
+    async def call_async():
+        return bad
+
+    monkeypatch.setattr(brands, "call", call)
+    monkeypatch.setattr(brands, "call_async", call_async)
+    with pytest.raises(ResponseSchemaError):
+        brands.checked()
+    with pytest.raises(ResponseSchemaError):
+        asyncio.run(brands.checked_async())
+    assert sent == [True]
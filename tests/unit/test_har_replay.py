@@ -0,0 +1,181 @@
+import json
+
+from utils.har_replay import (
+    CartEmulator,
+    HarIndex,
+    HarReplay,
+    products_from_har,
+    save_catalog,
+)
+from utils.markers import unit
+from utils.standin_data import PRODUCTS
+from utils.standin_pages import render_cart, render_product_details
+
+SITE = "https://shop.test"
+CATALOG = {product.id: product for product in PRODUCTS}
+
+
+def entry(method, url, body="", status=200, content_type="text/html"):
+    return {
+        "request": {"method": method, "url": url},
+        "response": {
+            "status": status,
+            "headers": [
+                {"name": "Content-Type", "value": content_type},
+                {"name": "Content-Length", "value": str(len(body))},
+            ],
+            "content": {"text": body},
+        },
+    }
+
+
+def write_har(path, entries):
+    path.write_text(json.dumps({"log": {"entries": entries}}))
+    return path
+
+
+class FakeRoute:
+    """Just enough of ``playwright.sync_api.Route`` for ``HarReplay``."""
+
+    class Request:
+        def __init__(self, method, url):
+            self.method = method
+            self.url = url
+
+    def __init__(self, method, url):
+        self.request = self.Request(method, url)
+        self.fulfilled = None
+        self.aborted = None
+
+    def fulfill(self, status, body, headers=None, content_type=None):
+        self.fulfilled = {"status": status, "headers": headers or {}, "body": body}
+
+    def abort(self, error_code):
+        self.aborted = error_code
+
+
+class FakeContext:
+    """Keeps the handler ``HarReplay.attach`` routes every request to."""
+
+    def route(self, pattern, handler):
+        assert pattern == "**/*"
+        self.handler = handler
+
+
+def attached(index) -> tuple[HarReplay, FakeContext]:
+    context = FakeContext()
+    return HarReplay(index, CATALOG).attach(context), context
+
+
+def served(context, method, url) -> FakeRoute:
+    route = FakeRoute(method, url)
+    context.handler(route)
+    return route
+
+
+@unit
+def test_har_index_lookup(tmp_path):
+    """Exact method+URL first, then the URL without its query; the last
+    recorded answer wins; unknown requests are misses."""
+
+    index = HarIndex(
+        [
+            entry("GET", f"{SITE}/", "old home"),
+            entry("GET", f"{SITE}/", "home"),
+            entry("GET", f"{SITE}/style.css?v=1", "css v1"),
+            entry("POST", f"{SITE}/login", "logged in"),
+        ]
+    )
+    assert len(index) == 3
+    assert index.lookup("GET", f"{SITE}/#top")["response"]["content"]["text"] == "home"
+    assert index.lookup("GET", f"{SITE}/style.css?v=2")["request"]["url"].endswith(
+        "?v=1"
+    )
+    assert index.lookup("GET", f"{SITE}/login") is None
+    assert index.lookup("GET", f"{SITE}/nope") is None
+    assert len(HarIndex.load(tmp_path / "missing.har")) == 0
+
+
+@unit
+def test_cart_emulator_renders_rows():
+    """Adds accumulate, removes drop the product, unknown ids are ignored and
+    only the cart table of the archived page changes."""
+
+    cart = CartEmulator(CATALOG)
+    cart.add(1, 2)
+    cart.add(1, 1)
+    cart.add(2, 1)
+    cart.add(99999, 1)
+    cart.remove(2)
+
+    archived = render_cart([(CATALOG[3], 5)])
+    html = cart.render_into(archived)
+    assert 'id="product-1"' in html
+    assert 'id="product-3"' not in html and 'id="product-2"' not in html
+    assert '<button class="disabled">3</button>' in html
+    assert f"Rs. {CATALOG[1].price * 3}" in html
+    assert (
+        html.split('id="cart_info_table"')[0]
+        == archived.split('id="cart_info_table"')[0]
+    )
+
+
+@unit
+def test_replay_serves_archive_and_emulates_cart():
+    """Archived answers are served, unknown requests aborted, cart updates
+    answered even when never recorded and shown on /view_cart."""
+
+    index = HarIndex(
+        [
+            entry("GET", f"{SITE}/", "home"),
+            entry("GET", f"{SITE}/view_cart", render_cart([(CATALOG[4], 1)])),
+        ]
+    )
+    replay, context = attached(index)
+
+    home = served(context, "GET", f"{SITE}/")
+    assert home.fulfilled["body"] == b"home"
+    assert "Content-Length" not in home.fulfilled["headers"]
+
+    assert served(context, "GET", f"{SITE}/add_to_cart/2?quantity=4").fulfilled
+    cart = served(context, "GET", f"{SITE}/view_cart").fulfilled["body"].decode()
+    assert 'id="product-2"' in cart and 'id="product-4"' not in cart
+    assert '<button class="disabled">4</button>' in cart
+
+    served(context, "GET", f"{SITE}/delete_cart/2")
+    cart = served(context, "GET", f"{SITE}/view_cart").fulfilled["body"].decode()
+    assert 'id="product-2"' not in cart
+
+    missed = served(context, "GET", f"{SITE}/products")
+    assert missed.aborted == "internetdisconnected" and missed.fulfilled is None
+    assert replay.served == 5
+    assert replay.missed == [f"GET {SITE}/products"]
+
+
+@unit
+def test_catalog_comes_from_the_archive(tmp_path):
+    """Products are read from recorded details pages and cart rows, and added
+    to the catalog of earlier recordings."""
+
+    details, carted, earlier = CATALOG[2], CATALOG[3], CATALOG[1]
+    har = write_har(
+        tmp_path / "test_cart.har",
+        [
+            entry("GET", f"{SITE}/product_details/2", render_product_details(details)),
+            entry("GET", f"{SITE}/view_cart", render_cart([(carted, 2)])),
+            entry("GET", f"{SITE}/view_cart", "Server Error", status=500),
+        ],
+    )
+    products = products_from_har([har])
+    assert products[0] == details  # brand "H&M" unescaped
+    assert (products[1].id, products[1].name, products[1].price) == (
+        carted.id,
+        carted.name,
+        carted.price,
+    )
+    assert products[1].category_text == carted.category_text
+
+    save_catalog([earlier], tmp_path)
+    save_catalog(products, tmp_path)
+    saved = json.loads((tmp_path / "catalog.json").read_text())
+    assert [p["id"] for p in saved] == [1, 2, 3]
@@ -0,0 +1,86 @@
+import json
+
+from utils.markers import unit
+from utils.response_cache import ResponseCache, cache_key, storable
+from utils.response_codec import response_from_dict
+
+URL = "https://shop.test/api/productsList"
+
+
+def answer(body, status=200, **headers):
+    text = body if isinstance(body, str) else json.dumps(body)
+    return response_from_dict({"status": status, "body": text, "headers": headers})
+
+
+PRODUCTS = answer({"responseCode": 200, "products": []}, ETag='"v1"')
+
+
+@unit
+def test_only_successful_answers_are_storable():
+    """An error is HTTP 200 with a 4xx/5xx responseCode on this site."""
+
+    assert storable(PRODUCTS)
+    assert storable(answer("<html>catalog</html>"))
+    assert not storable(answer({"responseCode": 503, "message": "busy"}))
+    assert not storable(answer({"responseCode": 200}, status=500))
+
+
+@unit
+def test_entries_expire_after_their_ttl():
+    cache = ResponseCache(ttl=60)
+    cache.store("fresh", PRODUCTS)
+    cache.store("stale", PRODUCTS, ttl=0)
+
+    assert cache.get("fresh").fresh
+    stale = cache.get("stale")
+    assert stale is not None and not stale.fresh  # kept for revalidation
+    assert cache.get("unknown") is None
+    assert cache.stats().hits == 1
+    assert cache_key(URL, {"b": 1, "a": 2}) == cache_key(URL, {"a": 2, "b": 1})
+
+
+@unit
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.store("a", PRODUCTS)
+    cache.store("b", PRODUCTS)
+    cache.get("a")
+    cache.store("c", PRODUCTS)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+@unit
+def test_disk_tier_is_shared(tmp_path):
+    """What one worker stored is a (disk) hit for another."""
+
+    first = ResponseCache(disk_dir=tmp_path)
+    second = ResponseCache(disk_dir=tmp_path)
+    first.store("products", PRODUCTS)
+
+    entry = second.get("products")
+    assert entry.fresh and entry.response["body"] == PRODUCTS.text
+    second.get("products")  # now from its own memory
+    stats = second.stats()
+    assert (stats.hits, stats.disk_hits) == (2, 1)
+
+    (tmp_path / "junk.json").write_text("{")
+    assert ResponseCache(disk_dir=tmp_path).get("other") is None
+
+
+@unit
+def test_not_modified_renews_the_entry(tmp_path):
+    """A stale entry asks with its validators; a 304 makes it fresh again,
+    also for the other workers."""
+
+    cache = ResponseCache(disk_dir=tmp_path)
+    cache.store("products", PRODUCTS, ttl=0)
+    entry = cache.get("products")
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    served = cache.renew("products", entry, ttl=60)
+    assert served.json() == PRODUCTS.json()
+    assert cache.get("products").fresh
+    assert ResponseCache(disk_dir=tmp_path).get("products").fresh
+    assert cache.stats().revalidated == 1
@@ -0,0 +1,146 @@
+import json
+from dataclasses import replace
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from tests.conftest_helpers import configure_api_retries
+from utils import request_builder
+from utils.markers import unit
+from utils.request_builder import Request, RequestMethod
+from utils.response_codec import response_from_dict
+from utils.retry import RetryPolicy, get_default_retry_policy, set_default_retry_policy
+
+SITE = "https://shop.test"
+
+
+def answer(status, **headers):
+    body = json.dumps({"responseCode": status})
+    return response_from_dict({"status": status, "body": body, "headers": headers})
+
+
+class Session:
+    """Answers ``request()`` from a script of responses and exceptions."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        step = self.script.pop(0) if len(self.script) > 1 else self.script[0]
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+class Pool:
+    def __init__(self, session):
+        self.session = session
+
+    def session_for(self, url):
+        return self.session
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff waits of ``Request.send``, recorded instead of slept."""
+    waits = []
+    monkeypatch.setattr(request_builder.time, "sleep", waits.append)
+    return waits
+
+
+def send(session, method=RequestMethod.GET, policy=None, idempotent=False):
+    request = Request(method, SITE, Pool(session)).path("/api/brandsList")
+    if policy is not None or idempotent:
+        request.retry(policy, idempotent)
+    return request.send()
+
+
+@unit
+def test_transient_failures_are_retried(sleeps):
+    """503s and connection errors are retried until an answer sticks."""
+
+    session = Session(answer(503), ConnectionError("reset"), answer(200))
+    assert send(session).status_code == 200
+    assert session.calls == 3 and len(sleeps) == 2
+
+
+@unit
+def test_retries_stop_at_max_retries(sleeps):
+    policy = RetryPolicy(max_retries=2)
+    unavailable = Session(answer(503))
+    assert send(unavailable, policy=policy).status_code == 503
+    assert unavailable.calls == 3
+
+    down = Session(ConnectionError("refused"))
+    with pytest.raises(ConnectionError):
+        send(down, policy=policy)
+    assert down.calls == 3
+
+    not_found = Session(answer(404))
+    assert send(not_found, policy=policy).status_code == 404
+    assert not_found.calls == 1
+
+
+@unit
+def test_only_idempotent_requests_are_retried(sleeps):
+    """POST is sent once unless the call opts in."""
+
+    post = Session(answer(503), answer(200))
+    assert send(post, RequestMethod.POST).status_code == 503
+    assert post.calls == 1
+
+    opted_in = Session(answer(503), answer(200))
+    assert send(opted_in, RequestMethod.POST, idempotent=True).status_code == 200
+    assert opted_in.calls == 2
+
+    policy = RetryPolicy()
+    assert policy.allowed_retries("delete") == policy.allowed_retries("PUT") == 3
+    assert policy.allowed_retries(RequestMethod.PATCH) == 0
+
+
+@unit
+def test_backoff_is_capped_jitter_or_retry_after(monkeypatch):
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, retry_after_max=10.0)
+    monkeypatch.setattr("utils.retry.random.uniform", lambda low, high: high)
+    assert [policy.delay(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+
+    assert policy.delay(1, answer(429, **{"Retry-After": "7"})) == 7.0
+    assert policy.delay(1, answer(429, **{"Retry-After": "120"})) == 10.0
+    http_date = "Wed, 21 Oct 2015 07:28:00 GMT"  # in the past: no wait
+    assert policy.delay(1, answer(503, **{"Retry-After": http_date})) == 0.0
+    assert policy.delay(2, answer(503, **{"Retry-After": "soon"})) == 1.0
+
+
+@unit
+def test_send_waits_the_policy_delay(sleeps):
+    session = Session(answer(429, **{"Retry-After": "2"}), answer(200))
+    send(session)
+    assert sleeps == [2.0]
+
+
+@unit
+def test_api_retries_option_sets_the_default_policy(sleeps):
+    class Config:
+        def __init__(self, retries):
+            self.retries = retries
+
+        def getoption(self, name):
+            assert name == "--api-retries"
+            return self.retries
+
+    default = get_default_retry_policy()
+    try:
+        configure_api_retries(Config(None))
+        assert get_default_retry_policy() is default
+
+        configure_api_retries(Config(0))
+        assert get_default_retry_policy() == replace(default, max_retries=0)
+        session = Session(answer(503), answer(200))
+        assert send(session).status_code == 503 and session.calls == 1
+
+        configure_api_retries(Config(1))
+        assert get_default_retry_policy().max_retries == 1
+    finally:
+        set_default_retry_policy(default)
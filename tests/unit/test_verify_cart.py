@@ -0,0 +1,70 @@
+import pytest
+
+from helper_functions_for_tests.cart_tests_helpers import (
+    CartMismatch,
+    assert_cart_all,
+    verify_cart,
+)
+from pages.cart import CartPageBase
+from utils.markers import unit
+
+BLUE_TOP = ("Blue Top", 2, 500)
+V_NECK = ("Pure Cotton V-Neck T-Shirt", 1, 1299)
+
+
+def cart(*rows):
+    """Snapshot of a cart holding ``(name, qty, price, total)`` rows."""
+    return CartPageBase._parse_snapshot(
+        [
+            {
+                "id": f"product-{index}",
+                "name": name,
+                "category": "Women > Tops",
+                "price": f"Rs. {price}",
+                "quantity": str(qty),
+                "total": f"Rs. {total}",
+            }
+            for index, (name, qty, price, total) in enumerate(rows, 1)
+        ]
+    )
+
+
+@unit
+def test_matching_cart_has_no_mismatch():
+    snapshot = cart(
+        ("Blue  Top\n", 2, 500, 1000), ("Pure Cotton V-Neck T-Shirt", 1, 1299, 1299)
+    )
+    assert verify_cart(snapshot, [BLUE_TOP, V_NECK]) == []
+    assert_cart_all(snapshot, [V_NECK, BLUE_TOP])  # order does not matter
+
+
+@unit
+def test_every_mismatch_is_reported():
+    """One pass finds the wrong quantity, price, line total, missing product
+    and cart total together."""
+
+    snapshot = cart(("Blue Top", 3, 400, 1000))
+    assert verify_cart(snapshot, [BLUE_TOP, V_NECK]) == [
+        CartMismatch("quantity", "Blue Top", 2, 3),
+        CartMismatch("price", "Blue Top", 500, 400),
+        CartMismatch("missing", V_NECK[0], V_NECK[0], None),
+        CartMismatch("total", "cart", 2299, 1000),
+    ]
+
+
+@unit
+def test_line_total_and_messages():
+    snapshot = cart(("Blue Top", 2, 500, 900))
+    line_total, total = verify_cart(snapshot, [BLUE_TOP])
+    assert str(line_total) == "line_total of Blue Top: expected 1000, got 900"
+    assert str(total) == "total of cart: expected 1000, got 900"
+    assert str(CartMismatch("missing", "Men Tshirt", "Men Tshirt", None)) == (
+        "Product Men Tshirt not found in cart"
+    )
+
+    with pytest.raises(AssertionError) as failure:
+        assert_cart_all(snapshot, [BLUE_TOP])
+    assert str(failure.value).startswith(
+        "Cart mismatch:\nline_total of Blue Top: expected 1000, got 900\n"
+        "total of cart: expected 1000, got 900"
+    )
@@ -0,0 +1,168 @@
+"""Cross-worker pool of pre-provisioned API accounts.
+
+Accounts live in a JSON lease table inside the run directory shared by all
+xdist workers. Every read-modify-write of the table happens under an
+exclusive ``flock``, so whichever process needs accounts first provisions a
+whole batch (concurrently) while the others wait, and the controller deletes
+every pooled account in a single batch when the run is over.
+"""
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+
+from utils.data_factory import get_user_factory
+from utils.endpoints import API
+from utils.payloads import User, user_from_payload
+
+FREE = "free"
+LEASED = "leased"
+# Deleted by the test itself (e.g. through the UI), never lease it again
+CONSUMED = "consumed"
+
+DEFAULT_BATCH_SIZE = 4
+
+
+@dataclass
+class SweepResult:
+    deleted: int
+    failed: list
+
+
+class AccountPool:
+    """
+    Lease table of ready-to-use accounts shared by every worker of one run.
+
+    Args:
+        directory: Run directory shared by the controller and all workers.
+        batch_size: Accounts created at once when no free account is left.
+    """
+
+    def __init__(self, directory: Path, batch_size: int = DEFAULT_BATCH_SIZE):
+        self._table_path = Path(directory, "account_pool.json")
+        self._lock_path = Path(directory, "account_pool.lock")
+        self._batch_size = batch_size
+
+    @contextmanager
+    def _locked_table(self):
+        with open(self._lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                table = self._read()
+                try:
+                    yield table
+                finally:
+                    # Also after an error: accounts created so far must stay
+                    # in the table, or the final sweep would never delete them
+                    tmp = self._table_path.with_suffix(".tmp")
+                    tmp.write_text(json.dumps(table))
+                    os.replace(tmp, self._table_path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        if not self._table_path.exists():
+            return {"accounts": {}, "provisioned": 0, "leases": 0}
+        return json.loads(self._table_path.read_text())
+
+    def provision(self, count: int) -> None:
+        """Create ``count`` accounts concurrently and add them to the pool."""
+        with self._locked_table() as table:
+            self._provision(table, count)
+
+    @staticmethod
+    def _provision(table: dict, count: int) -> None:
+        payloads = get_user_factory().take_many(count)
+        responses = API["create_account"].batch((p,) for p in payloads)
+        errors = []
+        for payload, resp in zip(payloads, responses):
+            code = resp.json().get("responseCode")
+            if code != HTTPStatus.CREATED:
+                errors.append(f"creating {payload['email']} returned {code}")
+                continue
+            table["accounts"][payload["email"]] = {
+                "payload": payload,
+                "state": FREE,
+                "holder": None,
+            }
+            table["provisioned"] += 1
+        if errors:
+            raise RuntimeError(f"Account pool: {'; '.join(errors)}")
+
+    def lease(self, holder: str) -> User:
+        """Hand out a free account, provisioning a new batch if none is left."""
+        with self._locked_table() as table:
+            entry = next(
+                (e for e in table["accounts"].values() if e["state"] == FREE), None
+            )
+            if entry is None:
+                self._provision(table, self._batch_size)
+                entry = next(
+                    e for e in table["accounts"].values() if e["state"] == FREE
+                )
+            entry["state"] = LEASED
+            entry["holder"] = holder
+            table["leases"] += 1
+            return user_from_payload(entry["payload"])
+
+    def release(self, user: User) -> None:
+        """Return a still existing account so another test can reuse it."""
+        self._set_state(user, FREE)
+
+    def consume(self, user: User) -> None:
+        """Mark an account the test deleted on its own; it is never re-leased."""
+        self._set_state(user, CONSUMED)
+
+    def _set_state(self, user: User, state: str) -> None:
+        with self._locked_table() as table:
+            entry = table["accounts"][user.email]
+            entry["state"] = state
+            entry["holder"] = None
+
+    def stats(self) -> dict:
+        with self._locked_table() as table:
+            states = [e["state"] for e in table["accounts"].values()]
+            return {
+                "provisioned": table["provisioned"],
+                "leases": table["leases"],
+                **{state: states.count(state) for state in (FREE, LEASED, CONSUMED)},
+            }
+
+    def sweep(self) -> SweepResult:
+        """
+        Delete every pooled account in one concurrent batch, then verify the
+        logins are gone. Consumed accounts are included in case the test that
+        owned them failed before deleting. Returns emails that still log in,
+        or whose check failed; a call that raised does not stop the sweep.
+        """
+        with self._locked_table() as table:
+            users = [
+                user_from_payload(e["payload"]) for e in table["accounts"].values()
+            ]
+            if not users:
+                return SweepResult(deleted=0, failed=[])
+            credentials = [(u.email, u.password) for u in users]
+            API["delete_account"].batch(credentials, return_exceptions=True)
+            verified = API["verify_login_valid"].batch(
+                credentials, return_exceptions=True
+            )
+            failed = [
+                u.email for u, resp in zip(users, verified) if not _login_gone(resp)
+            ]
+            table["accounts"].clear()
+            return SweepResult(deleted=len(users), failed=failed)
+
+
+def _login_gone(resp) -> bool:
+    """verifyLogin answered that the account no longer exists."""
+    if isinstance(resp, BaseException):
+        return False
+    try:
+        body = resp.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("responseCode") == HTTPStatus.NOT_FOUND
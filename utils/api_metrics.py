@@ -0,0 +1,213 @@
+"""Per-endpoint timings of every request sent through ``Request.send``.
+
+Recording a call costs two ``perf_counter()`` reads and a few counter updates,
+so the collector stays on for every run. ``requests`` does not expose DNS or
+connect timings; what it does expose is ``Response.elapsed`` (request sent ->
+response headers parsed), reported here as TTFB next to the total time that
+also includes downloading the body. When ``Request`` retried a call, the
+timings are those of the final attempt and the retry count is kept alongside.
+
+The site's API answers HTTP 200 to everything and puts the real status in the
+body's ``responseCode``, so that is the status recorded and counted as an
+error from 400 up. Calls, errors, sums and maxima are exact; percentiles come
+from a uniform sample of at most ``MAX_SAMPLES`` calls per endpoint, so a long
+run keeps a bounded amount of memory.
+"""
+
+import math
+import random
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+
+MAX_SAMPLES = 1000  # per endpoint, for the percentiles
+
+
+def response_code(response) -> int:
+    """``responseCode`` of a JSON API body, else the HTTP status."""
+    try:
+        body = response.json()
+    except ValueError:
+        return response.status_code
+    code = body.get("responseCode") if isinstance(body, dict) else None
+    return code if isinstance(code, int) else response.status_code
+
+
+@dataclass
+class EndpointMetrics:
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    total_sum: float = 0.0
+    total_max: float = 0.0
+    ttfb_max: float = 0.0
+    statuses: dict = field(default_factory=dict)  # str(status) -> calls
+    # (total, ttfb) of a uniform sample of the calls (reservoir sampling)
+    samples: list = field(default_factory=list)
+
+    def add(
+        self, rng, status: int, total: float, ttfb: float, size, retries, error
+    ) -> None:
+        self.calls += 1
+        self.errors += bool(error)
+        self.retries += retries
+        self.bytes += size
+        self.total_sum += total
+        self.total_max = max(self.total_max, total)
+        self.ttfb_max = max(self.ttfb_max, ttfb)
+        self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append((total, ttfb))
+        else:
+            slot = rng.randrange(self.calls)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = (total, ttfb)
+
+    def merge(self, other: "EndpointMetrics", rng=random) -> "EndpointMetrics":
+        statuses = dict(self.statuses)
+        for status, calls in other.statuses.items():
+            statuses[status] = statuses.get(status, 0) + calls
+        samples = self.samples + other.samples
+        if len(samples) > MAX_SAMPLES:
+            # Keep each side's share of the calls, so the sample stays uniform
+            mine = round(MAX_SAMPLES * self.calls / (self.calls + other.calls))
+            mine = min(mine, len(self.samples))
+            samples = rng.sample(self.samples, mine) + rng.sample(
+                other.samples, min(MAX_SAMPLES - mine, len(other.samples))
+            )
+        return EndpointMetrics(
+            calls=self.calls + other.calls,
+            errors=self.errors + other.errors,
+            retries=self.retries + other.retries,
+            bytes=self.bytes + other.bytes,
+            total_sum=self.total_sum + other.total_sum,
+            total_max=max(self.total_max, other.total_max),
+            ttfb_max=max(self.ttfb_max, other.ttfb_max),
+            statuses=statuses,
+            samples=samples,
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class ApiMetrics:
+    def __init__(self):
+        self._endpoints: dict[str, EndpointMetrics] = defaultdict(EndpointMetrics)
+        self._rng = random.Random(0)
+        self._lock = threading.Lock()  # batches and the load runner use threads
+
+    def record(
+        self, method, path: str, response, total: float, retries: int = 0
+    ) -> None:
+        status = response_code(response)
+        self.add(
+            f"{getattr(method, 'value', method)} {path}",
+            status,
+            total,
+            response.elapsed.total_seconds(),
+            len(response.content),
+            retries,
+        )
+
+    def add(
+        self,
+        endpoint: str,
+        status: int,
+        total: float,
+        ttfb: float,
+        size: int = 0,
+        retries: int = 0,
+        error: bool = None,
+    ) -> None:
+        """Count one call; ``error`` defaults to ``status >= 400``."""
+        if error is None:
+            error = status >= 400
+        with self._lock:
+            self._endpoints[endpoint].add(
+                self._rng, status, total, ttfb, size, retries, error
+            )
+
+    def merge(self, endpoints: dict) -> None:
+        """Add ``as_dicts()`` of another process (an xdist worker)."""
+        with self._lock:
+            for endpoint, data in endpoints.items():
+                self._endpoints[endpoint] = self._endpoints[endpoint].merge(
+                    EndpointMetrics(**data), self._rng
+                )
+
+    def endpoints(self) -> dict[str, EndpointMetrics]:
+        with self._lock:
+            return dict(self._endpoints)
+
+    def as_dicts(self) -> dict:
+        return {name: m.as_dict() for name, m in self.endpoints().items()}
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(endpoints: dict[str, EndpointMetrics]) -> list[dict]:
+    """One row per endpoint, slowest total time first."""
+    rows = []
+    for endpoint, metrics in endpoints.items():
+        totals = sorted(total for total, _ in metrics.samples)
+        ttfbs = sorted(ttfb for _, ttfb in metrics.samples)
+        rows.append(
+            {
+                "endpoint": endpoint,
+                "calls": metrics.calls,
+                "errors": metrics.errors,
+                "retries": metrics.retries,
+                "statuses": dict(metrics.statuses),
+                "total_ms": {
+                    "p50": percentile(totals, 50) * 1000,
+                    "p90": percentile(totals, 90) * 1000,
+                    "p99": percentile(totals, 99) * 1000,
+                    "max": metrics.total_max * 1000,
+                    "sum": metrics.total_sum * 1000,
+                },
+                "ttfb_ms": {
+                    "p50": percentile(ttfbs, 50) * 1000,
+                    "p90": percentile(ttfbs, 90) * 1000,
+                    "p99": percentile(ttfbs, 99) * 1000,
+                    "max": metrics.ttfb_max * 1000,
+                },
+                "avg_bytes": metrics.bytes / metrics.calls if metrics.calls else 0.0,
+            }
+        )
+    return sorted(rows, key=lambda row: row["total_ms"]["sum"], reverse=True)
+
+
+def format_table(rows: list[dict]) -> list[str]:
+    """Render ``summarize()`` rows as fixed-width lines for the terminal."""
+    width = max([len("endpoint")] + [len(row["endpoint"]) for row in rows])
+    header = (
+        f"{'endpoint':<{width}}  {'calls':>5}  {'err':>3}  {'retry':>5}  "
+        f"{'p50':>7}  {'p90':>7}  {'p99':>7}  {'max':>7}  {'ttfb50':>7}  "
+        f"{'avg KB':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        total, ttfb = row["total_ms"], row["ttfb_ms"]
+        lines.append(
+            f"{row['endpoint']:<{width}}  {row['calls']:>5}  {row['errors']:>3}  "
+            f"{row['retries']:>5}  {total['p50']:>7.1f}  {total['p90']:>7.1f}  {total['p99']:>7.1f}  "
+            f"{total['max']:>7.1f}  {ttfb['p50']:>7.1f}  "
+            f"{row['avg_bytes'] / 1024:>6.1f}"
+        )
+    return lines
+
+
+_metrics = ApiMetrics()
+
+
+def get_api_metrics() -> ApiMetrics:
+    """Return the process-wide (i.e. per xdist worker) collector."""
+    return _metrics
@@ -0,0 +1,19 @@
+from utils.endpoints import API
+
+# Async API wrapper for "automationexercise.com", mirrors utils/api_requests.py.
+# Combine calls with utils.async_request_builder.gather_limited / run_batch.
+
+get_all_products = API["get_all_products"].call_async
+post_to_products_list = API["post_to_products_list"].call_async
+get_all_brands = API["get_all_brands"].call_async
+put_to_brands_list = API["put_to_brands_list"].call_async
+search_product = API["search_product"].call_async
+search_product_no_param = API["search_product_no_param"].call_async
+verify_login_valid = API["verify_login_valid"].call_async
+verify_login_no_email = API["verify_login_no_email"].call_async
+verify_login_delete = API["verify_login_delete"].call_async
+verify_login_invalid = API["verify_login_invalid"].call_async
+create_account = API["create_account"].call_async
+delete_account = API["delete_account"].call_async
+update_account = API["update_account"].call_async
+get_user_detail_by_email = API["get_user_detail_by_email"].call_async
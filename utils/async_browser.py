@@ -0,0 +1,95 @@
+"""Drive several pages at once with ``playwright.async_api`` inside pytest.
+
+The sync Playwright that pytest-playwright starts keeps an event loop of its
+own on the main thread, and a second loop cannot run there while it exists.
+``LoopThread`` therefore owns an event loop on a background thread; test code
+hands it coroutines with ``run()`` and blocks until they finish, so test
+functions stay plain (no pytest-asyncio needed).
+
+``AsyncBrowser`` launches its own browser on that loop and opens one context
+per page, so concurrent pages share nothing but the browser process. Being
+outside pytest-playwright, those contexts get none of its ``--tracing``,
+``--video`` or ``--screenshot`` artifacts.
+"""
+
+import asyncio
+import threading
+
+from playwright.async_api import async_playwright
+
+from components.async_components import ConsentPopup
+
+
+class LoopThread:
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="async-ui-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro, timeout: float = None):
+        """Run ``coro`` on the loop and return its result (or raise its error)."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class AsyncBrowser:
+    """
+    Args:
+        loop: Loop every Playwright call of this browser runs on.
+        browser_name: ``chromium``, ``firefox`` or ``webkit``.
+        launch_args: ``browser_type.launch`` arguments.
+    """
+
+    def __init__(self, loop: LoopThread, browser_name: str, launch_args: dict):
+        self.loop = loop
+        self._playwright = loop.run(async_playwright().start())
+        browser_type = getattr(self._playwright, browser_name)
+        self.browser = loop.run(browser_type.launch(**launch_args))
+
+    def close(self) -> None:
+        self.loop.run(self.browser.close())
+        self.loop.run(self._playwright.stop())
+
+
+class AsyncPages:
+    """Pages of one test; every page gets its own context.
+
+    Usage::
+
+        async def flow():
+            pages = await asyncio.gather(*(async_ui.new_page() for _ in range(3)))
+            ...
+
+        async_ui.run(flow())
+    """
+
+    def __init__(self, browser: AsyncBrowser, context_args: dict):
+        self._browser = browser
+        self._context_args = context_args
+        self._contexts = []
+        self.pages = []
+
+    def run(self, coro, timeout: float = None):
+        return self._browser.loop.run(coro, timeout)
+
+    async def new_page(self):
+        context = await self._browser.browser.new_context(**self._context_args)
+        self._contexts.append(context)
+        page = await context.new_page()
+        await ConsentPopup(page).dismiss_when_shown()
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(context.close() for context in self._contexts),
+            return_exceptions=True,
+        )
+        self._contexts.clear()
+        self.pages.clear()
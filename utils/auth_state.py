@@ -0,0 +1,113 @@
+"""Cache of logged-in Playwright storage states, one per user and environment.
+
+``AuthStateCache.state_for`` logs a user in once by replaying the login form
+POST through ``context.request`` (no page, no rendering), falling back to the
+UI form if that does not end up logged in, and saves the context's storage
+state. Later contexts are created with that file and start logged in.
+
+A state is dropped when its session cookie has expired and when the account
+is deleted (``invalidate``). The files live in the run directory, so they are
+shared by all xdist workers of the run and never outlive the pooled accounts.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from playwright.sync_api import Browser
+
+from utils.payloads import User
+
+SESSION_COOKIE = "sessionid"
+# Re-login if the session would expire during the test
+EXPIRY_MARGIN_S = 300
+LOGGED_IN_MARKER = "Logged in as"
+
+_CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken"\s+value="([^"]+)"')
+
+
+class AuthStateCache:
+    def __init__(self, directory: Path):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def state_for(self, browser: Browser, user: User, context_args: dict = None) -> str:
+        """
+        Path of a storage state in which ``user`` is logged in.
+
+        Args:
+            browser: Used to log in when there is no valid state yet.
+            user: Account to log in.
+            context_args: ``browser.new_context`` arguments of the login
+                context, e.g. the pre-accepted consent ``storage_state``.
+        """
+        address = os.environ["ADDRESS"].rstrip("/")
+        path = self._path(user, address)
+        with open(path.with_suffix(".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if not self._valid(path):
+                    self._login(browser, user, address, path, context_args or {})
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        return str(path)
+
+    def invalidate(self, user: User) -> None:
+        """Forget the state of a deleted (or logged out) account."""
+        self._path(user, os.environ["ADDRESS"].rstrip("/")).unlink(missing_ok=True)
+
+    def _path(self, user: User, address: str) -> Path:
+        key = hashlib.sha1(f"{address}|{user.email}".encode()).hexdigest()
+        return self._dir / f"auth_{key}.json"
+
+    @staticmethod
+    def _valid(path: Path) -> bool:
+        try:
+            cookies = json.loads(path.read_text())["cookies"]
+        except (OSError, ValueError, KeyError):
+            return False
+        session = [c for c in cookies if c["name"] == SESSION_COOKIE]
+        if not session:
+            return False
+        # -1 marks a browser-session cookie: valid for the whole run
+        expires = session[0].get("expires", -1)
+        return expires < 0 or expires > time.time() + EXPIRY_MARGIN_S
+
+    def _login(self, browser, user: User, address: str, path: Path, context_args):
+        context = browser.new_context(**context_args)
+        try:
+            if not self._login_by_request(context, user, address):
+                # LoginPage.URL reads ADDRESS at import, which --standin sets late
+                from pages.login_page import LoginPage
+
+                page = context.new_page()
+                login_page = LoginPage(page)
+                login_page.load()
+                login_page.login(user.email, user.password)
+            context.storage_state(path=path)
+        finally:
+            context.close()
+
+    @staticmethod
+    def _login_by_request(context, user: User, address: str) -> bool:
+        """Replay the login form POST; the context's cookie jar keeps the session."""
+        login_url = f"{address}/login"
+        form_page = context.request.get(login_url)
+        match = _CSRF_INPUT.search(form_page.text())
+        if not form_page.ok or match is None:
+            return False
+        response = context.request.post(
+            login_url,
+            form={
+                "csrfmiddlewaretoken": match.group(1),
+                "email": user.email,
+                "password": user.password,
+            },
+            # Django checks the Referer of HTTPS form posts
+            headers={"Referer": login_url},
+        )
+        return response.ok and LOGGED_IN_MARKER in response.text()
@@ -0,0 +1,135 @@
+"""Record/replay of API traffic sent through ``Request.send``.
+
+A cassette maps ``"METHOD path body"`` keys to the list of responses recorded
+for that request, in the order they were seen, so lookups are a single dict
+access no matter how many interactions a cassette holds. Replaying the same
+request several times walks through its recorded responses (e.g. verifyLogin
+before and after deleteAccount) and then keeps returning the last one.
+
+Generated user emails carry the run's namespace (see ``utils.data_factory``),
+so keys and recorded bodies store them as ``qa.{namespace}.<n>@...`` and the
+replaying run puts its own namespace back. Recording keeps run-unique emails,
+and user payloads only have to be seeded alike to match on replay.
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+
+from requests import Response
+
+from utils.data_factory import EMAIL_DOMAIN, get_user_factory
+from utils.response_codec import response_from_dict, response_to_dict
+
+RECORD = "record"
+REPLAY = "replay"
+
+DEFAULT_CASSETTE = Path(__file__).parent.parent / "tests" / "cassettes" / "api.json"
+
+NAMESPACE = "{namespace}"
+_USER_EMAIL = re.compile(rf"qa\.[\w.]+?\.(\d+)@{re.escape(EMAIL_DOMAIN)}")
+
+
+class CassetteMiss(RuntimeError):
+    """Raised in strict replay mode for a request that was never recorded."""
+
+
+def cassette_key(method, path: str, params=None, data=None, json_body=None) -> str:
+    """Build the lookup key; the body is normalized so dict order never matters."""
+    body = json.dumps(
+        {"params": params, "data": data, "json": json_body},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return f"{str(getattr(method, 'value', method)).upper()} {path} {normalize(body)}"
+
+
+def normalize(text: str) -> str:
+    """Replace the namespace of generated user emails with ``NAMESPACE``."""
+    return _USER_EMAIL.sub(rf"qa.{NAMESPACE}.\1@{EMAIL_DOMAIN}", text)
+
+
+class Cassette:
+    """
+    Args:
+        path: JSON file the interactions are loaded from / saved to.
+        mode: ``RECORD`` or ``REPLAY``.
+        strict: In replay mode, raise ``CassetteMiss`` instead of falling back
+            to the network for unknown requests.
+    """
+
+    def __init__(self, path: Path, mode: str, strict: bool = False):
+        self.path = Path(path)
+        self.mode = mode
+        self.strict = strict
+        self._interactions: dict[str, list[dict]] = {}
+        self._cursors: dict[str, int] = {}
+        self._lock = threading.Lock()
+        if mode == REPLAY:
+            self._interactions = load_interactions(self.path)
+
+    def replay(self, key: str) -> Response | None:
+        """Return the next recorded response for ``key`` (None on a miss)."""
+        if self.mode != REPLAY:
+            return None
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                if self.strict:
+                    raise CassetteMiss(f"No recorded response for: {key}")
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            data = recorded[min(cursor, len(recorded) - 1)]
+        if data.get("body_encoding", "utf-8") == "utf-8":
+            namespace = f"qa.{get_user_factory().namespace}."
+            body = data["body"].replace(f"qa.{NAMESPACE}.", namespace)
+            data = {**data, "body": body}
+        return response_from_dict(data)
+
+    def record(self, key: str, response: Response) -> None:
+        if self.mode != RECORD:
+            return
+        data = response_to_dict(response)
+        if data["body_encoding"] == "utf-8":
+            data["body"] = normalize(data["body"])
+        with self._lock:
+            self._interactions.setdefault(key, []).append(data)
+
+    def interactions(self) -> dict:
+        with self._lock:
+            return {key: list(value) for key, value in self._interactions.items()}
+
+
+def load_interactions(path: Path) -> dict:
+    if not Path(path).exists():
+        return {}
+    return json.loads(Path(path).read_text())["interactions"]
+
+
+def save_interactions(path: Path, *parts: dict) -> int:
+    """Merge interaction dicts (e.g. one per xdist worker) into one cassette file.
+    Returns the number of recorded responses written."""
+    merged: dict[str, list[dict]] = {}
+    for part in parts:
+        for key, responses in part.items():
+            merged.setdefault(key, []).extend(responses)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"interactions": merged}, indent=1, sort_keys=True))
+    return sum(len(responses) for responses in merged.values())
+
+
+_active: Cassette | None = None
+
+
+def activate(cassette: Cassette | None) -> None:
+    """Route every ``Request.send`` in this process through ``cassette``."""
+    global _active
+    _active = cassette
+
+
+def active_cassette() -> Cassette | None:
+    return _active
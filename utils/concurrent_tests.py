@@ -0,0 +1,319 @@
+"""Run ``@concurrent`` async UI tests several at a time inside one worker.
+
+``ConcurrentScheduler`` is a pytest plugin (registered by tests/conftest.py)
+for ``async def`` tests marked ``concurrent``. It provides their
+``async_page`` and ``async_context`` fixtures (``playwright.async_api``
+objects, see pages/async_pages.py) on a browser of its own, one fresh
+``BrowserContext`` per test, and awaits the tests in their call phase.
+
+Every test still goes through pytest's own ``pytest_runtest_protocol``, so
+fixtures, skip/xfail marks, pytest-rerunfailures (with ``--only-rerun`` and
+``--rerun-except``), xdist and the HTML report behave as for any other test.
+Batching only moves work forward: when pytest reaches a concurrent test, the
+plugin first runs its body together with the concurrent tests right after it,
+at most ``limit`` at once, and each of them then reports that outcome from its
+call phase, with the duration its body took.
+
+Limits: a test only joins a batch when it takes nothing but ``async_page``,
+``async_context`` and parametrized arguments and has no ``skip``/``skipif``
+mark, because its body runs before pytest sets the test up. Other concurrent
+tests, reruns, and every test when batching is off, run on their own in the
+call phase, with their fixtures set up as usual.
+
+An xdist worker only knows which tests it will run when all concurrent tests
+are sent to it together: under ``--dist loadgroup``, where they form one
+group, and under ``--dist-by-duration`` (utils/duration_schedule.py). With
+the other modes batching is off.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+
+import pytest
+from pytest import StashKey
+
+from components.async_components import ConsentPopup
+from utils.async_browser import AsyncBrowser, LoopThread
+from utils.stats import SummedStats
+
+MARKER = "concurrent"
+DEFAULT_LIMIT = 3
+FIXTURES = ("async_page", "async_context")
+# Screenshot of a failed concurrent test, taken before its context closed
+SCREENSHOT = StashKey[str]()
+# Seconds the body of a batched test took, reported as its call duration
+_DURATION = StashKey[float]()
+
+
+@dataclass
+class ConcurrencyStats(SummedStats):
+    TITLE = "Concurrent tests"
+    MAX_FIELDS = ("peak",)
+
+    tests: int = 0
+    batches: int = 0  # a test that ran on its own is a batch of one
+    peak: int = 0  # tests running at the same time
+    wall_seconds: float = 0.0  # batches start to end
+    test_seconds: float = 0.0  # sum of the tests' own durations
+
+    def summary(self) -> str | None:
+        if not self.tests:
+            return None
+        return (
+            f"{self.tests} tests in {self.batches} batches, up to {self.peak} at "
+            f"once: {self.wall_seconds:.1f}s wall for {self.test_seconds:.1f}s of "
+            f"test time"
+        )
+
+
+def is_concurrent(item) -> bool:
+    return item is not None and item.get_closest_marker(MARKER) is not None
+
+
+def batchable(item) -> bool:
+    """Whether ``item`` can run in a batch, i.e. before pytest sets it up."""
+    if not inspect.iscoroutinefunction(item.obj):
+        return False
+    if any(item.get_closest_marker(name) for name in ("skip", "skipif")):
+        return False
+    allowed = {*FIXTURES, *_params(item)}
+    return set(inspect.signature(item.obj).parameters) <= allowed
+
+
+def _params(item) -> dict:
+    """Arguments of ``@pytest.mark.parametrize`` for this item."""
+    callspec = getattr(item, "callspec", None)
+    return dict(callspec.params) if callspec is not None else {}
+
+
+class ConcurrentScheduler:
+    """
+    Args:
+        limit: Tests running at the same time.
+        context_args: ``browser.new_context`` arguments of every test.
+        screenshot_path: ``item -> Path`` for screenshots of failed tests.
+        batch_ahead: Run the bodies of the following concurrent tests in
+            batches; off, each test runs on its own.
+
+    Browser options come from pytest-playwright's ``--browser``/``--headed``/
+    ``--browser-channel``/``--slowmo``.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        context_args: dict,
+        screenshot_path,
+        batch_ahead: bool = True,
+    ):
+        self.config = None
+        self.limit = max(limit, 1)
+        self.stats = ConcurrencyStats()
+        self._context_args = context_args
+        self._screenshot_path = screenshot_path
+        self._batch_ahead = batch_ahead
+        self._outcomes = {}  # nodeid -> error (None: passed) of a batched run
+        self._loop = None
+        self._browser = None
+
+    def close(self) -> None:
+        if self._browser is not None:
+            self._browser.close()
+        if self._loop is not None:
+            self._loop.stop()
+        self._browser = self._loop = None
+
+    # ---- hooks ----------------------------------------------------------
+
+    def pytest_configure(self, config) -> None:
+        self.config = config
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem) -> None:
+        # Only runs the batch ahead; pytest (or rerunfailures) then runs the
+        # protocol of every test as usual
+        if not self._batch_ahead or not is_concurrent(item):
+            return None
+        if item.nodeid in self._outcomes or not batchable(item):
+            return None
+        self._run_batch(self._batch(item))
+        return None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        item = pyfuncitem
+        if not is_concurrent(item):
+            return None
+        if item.nodeid in self._outcomes:
+            error = self._outcomes.pop(item.nodeid)
+        else:
+            error = self._run_alone(item)
+        if error is not None:
+            raise error
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = (yield).get_result()
+        if call.when == "call" and _DURATION in item.stash:
+            report.duration = item.stash[_DURATION]
+            del item.stash[_DURATION]
+
+    def pytest_runtest_logfinish(self, nodeid, location) -> None:
+        # A batched test that was skipped or failed in setup never got to
+        # report its outcome; a rerun runs on its own
+        self._outcomes.pop(nodeid, None)
+
+    # ---- fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def async_context(self, request):
+        """Fresh context of a ``@concurrent`` test; None for a test its batch
+        already ran (in a context of its own)."""
+        if request.node.nodeid in self._outcomes:
+            yield None
+            return
+        loop = self._start()
+        context = loop.run(self._new_context())
+        yield context
+        loop.run(context.close())
+
+    @pytest.fixture
+    def async_page(self, async_context):
+        """Page of ``async_context`` with the consent popup handled."""
+        if async_context is None:
+            return None
+        return self._loop.run(self._new_page(async_context))
+
+    # ---- running --------------------------------------------------------
+
+    def _batch(self, item) -> list:
+        items = item.session.items
+        start = items.index(item)
+        batch = []
+        for candidate in items[start:]:
+            if not is_concurrent(candidate):
+                break
+            if batchable(candidate) and candidate.nodeid not in self._outcomes:
+                batch.append(candidate)
+        return batch
+
+    def _run_batch(self, items) -> None:
+        started = time.perf_counter()
+        try:
+            errors = self._start().run(self._run_all(items))
+        except Exception as error:  # e.g. the browser cannot be launched
+            errors = {item: error for item in items}
+        self.stats.batches += 1
+        self.stats.tests += len(items)
+        self.stats.wall_seconds += time.perf_counter() - started
+        for item in items:
+            self._outcomes[item.nodeid] = errors[item]
+
+    async def _run_all(self, items) -> dict:
+        semaphore = asyncio.Semaphore(self.limit)
+        running = 0
+
+        async def run(item):
+            nonlocal running
+            async with semaphore:
+                running += 1
+                self.stats.peak = max(self.stats.peak, running)
+                try:
+                    return item, await self._run_in_new_context(item)
+                finally:
+                    running -= 1
+
+        return dict(await asyncio.gather(*(run(item) for item in items)))
+
+    async def _run_in_new_context(self, item) -> BaseException | None:
+        started = time.perf_counter()
+        context = error = None
+        try:
+            context = await self._new_context()
+            page = await self._new_page(context)
+            available = {"async_page": page, "async_context": context, **_params(item)}
+            kwargs = {
+                name: available[name] for name in inspect.signature(item.obj).parameters
+            }
+            error = await self._call(item, kwargs, page)
+        except Exception as setup_error:  # Reported as the test's failure
+            error = setup_error
+        finally:
+            item.stash[_DURATION] = time.perf_counter() - started
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as close_error:
+                    error = error or close_error
+        return error
+
+    def _run_alone(self, item) -> BaseException | None:
+        if not inspect.iscoroutinefunction(item.obj):
+            return TypeError(f"@{MARKER} tests must be 'async def': {item.name}")
+        kwargs = {
+            name: item.funcargs[name] for name in inspect.signature(item.obj).parameters
+        }
+        started = time.perf_counter()
+        error = self._start().run(self._call(item, kwargs, kwargs.get("async_page")))
+        self.stats.batches += 1
+        self.stats.tests += 1
+        self.stats.peak = max(self.stats.peak, 1)
+        self.stats.wall_seconds += time.perf_counter() - started
+        return error
+
+    async def _call(self, item, kwargs: dict, page) -> BaseException | None:
+        """Await the test; a failure is returned (and its page screenshotted)."""
+        started = time.perf_counter()
+        try:
+            await item.obj(**kwargs)
+            return None
+        except BaseException as error:  # Raised again in the test's call phase
+            try:
+                if page is not None:
+                    path = str(self._screenshot_path(item))
+                    await page.screenshot(path=path)
+                    item.stash[SCREENSHOT] = path
+            except Exception:
+                pass  # A page that broke the test may not render any more
+            return error
+        finally:
+            self.stats.test_seconds += time.perf_counter() - started
+
+    # ---- browser --------------------------------------------------------
+
+    def _start(self) -> LoopThread:
+        """Loop of the plugin's browser, launched on first use."""
+        if self._loop is None:
+            self._loop = LoopThread()
+        if self._browser is None:
+            self._browser = self._launch(self._loop)
+        return self._loop
+
+    def _launch(self, loop: LoopThread):
+        return AsyncBrowser(loop, self._browser_name(), self._launch_args())
+
+    async def _new_context(self):
+        return await self._browser.browser.new_context(**self._context_args)
+
+    @staticmethod
+    async def _new_page(context):
+        page = await context.new_page()
+        await ConsentPopup(page).dismiss_when_shown()
+        return page
+
+    def _browser_name(self) -> str:
+        names = self.config.getoption("--browser", None) or ["chromium"]
+        return names[0]
+
+    def _launch_args(self) -> dict:
+        args = {"headless": not self.config.getoption("--headed", False)}
+        channel = self.config.getoption("--browser-channel", None)
+        if channel:
+            args["channel"] = channel
+        slowmo = self.config.getoption("--slowmo", 0)
+        if slowmo:
+            args["slow_mo"] = slowmo
+        return args
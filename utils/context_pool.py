@@ -0,0 +1,200 @@
+"""Per-worker pool of warm browser contexts for ``page_on_address``.
+
+A fresh context costs a ``browser.new_context``, a new page, a cold HTTP cache
+and a first ``goto(ADDRESS)``. ``ContextPool`` keeps contexts that are already
+on the home page with consent given, and hands one page out per test. When the
+test is done the context is reset instead of closed: cookies go back to the
+pre-accepted consent state (which also drops the session, and with it the
+cart and any login), local/session storage is restored the same way and the
+page reloads the home page. The HTTP cache survives, which is most of the win.
+
+A context is closed and replaced after ``max_uses`` tests, when its test
+failed, or when resetting it fails, so a broken or dirty context never reaches
+the next test.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from components.consent_popup import ConsentPopup
+from utils.readiness import navigate
+from utils.stats import SummedStats
+
+DEFAULT_MAX_USES = 20
+
+_RESET_STORAGE_JS = """(items) => {
+    localStorage.clear();
+    sessionStorage.clear();
+    for (const {name, value} of items) localStorage.setItem(name, value);
+}"""
+
+
+@dataclass
+class ContextPoolStats(SummedStats):
+    TITLE = "Browser context pool"
+
+    created: int = 0
+    leases: int = 0
+    reused: int = 0  # leases served by an already used context
+    recycled: int = 0  # contexts closed after max_uses or a failure
+    failures: int = 0  # of which because the test or the reset failed
+    resets: int = 0
+    reset_seconds: float = 0.0
+    peak_size: int = 0  # contexts open at once; summed over workers
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.leases if self.leases else 0.0
+
+    @property
+    def avg_reset_ms(self) -> float:
+        return self.reset_seconds / self.resets * 1000 if self.resets else 0.0
+
+    def summary(self) -> str | None:
+        if not self.leases:
+            return None
+        return (
+            f"{self.leases} leases, {self.reuse_rate:.0%} reused; "
+            f"{self.created} contexts created (peak {self.peak_size} open), "
+            f"{self.recycled} recycled ({self.failures} after failures); "
+            f"reset avg {self.avg_reset_ms:.0f} ms"
+        )
+
+
+_stats = ContextPoolStats()
+
+
+def get_context_pool_stats() -> ContextPoolStats:
+    return _stats
+
+
+class PooledContext:
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+
+class ContextPool:
+    """
+    Args:
+        browser: Browser the contexts are created in.
+        context_args: ``browser.new_context`` arguments; their
+            ``storage_state`` (the pre-accepted consent) is what a reset
+            restores.
+        address: Home page every pooled page is left on.
+        size: Idle contexts kept warm.
+        max_uses: Tests served by one context before it is replaced.
+        ready: Selector the home page is ready with (see utils/readiness.py).
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: dict,
+        address: str,
+        size: int = 1,
+        max_uses: int = DEFAULT_MAX_USES,
+        ready: str = None,
+    ):
+        self._browser = browser
+        self._context_args = context_args
+        self._address = address
+        self._origin = self._origin_of(address)
+        self._size = size
+        self._max_uses = max_uses
+        self._ready = ready
+        self._idle: list[PooledContext] = []
+        self._open = 0
+        self._cookies, self._local_storage = self._baseline(context_args)
+
+    def warm(self) -> None:
+        while len(self._idle) < self._size:
+            self._idle.append(self._create())
+
+    def acquire(self) -> PooledContext:
+        pooled = self._idle.pop() if self._idle else self._create()
+        _stats.leases += 1
+        if pooled.uses:
+            _stats.reused += 1
+        pooled.uses += 1
+        return pooled
+
+    def release(self, pooled: PooledContext, failed: bool = False) -> None:
+        """Reset ``pooled`` for the next test, or replace it."""
+        if failed or pooled.uses >= self._max_uses:
+            self._recycle(pooled, failed)
+            return
+        started = time.perf_counter()
+        try:
+            self._reset(pooled)
+        except Exception:
+            self._recycle(pooled, failed=True)
+            return
+        _stats.resets += 1
+        _stats.reset_seconds += time.perf_counter() - started
+        self._idle.append(pooled)
+
+    def close(self) -> None:
+        for pooled in self._idle:
+            pooled.context.close()
+        self._open -= len(self._idle)
+        self._idle.clear()
+
+    def _create(self) -> PooledContext:
+        context = self._browser.new_context(**self._context_args)
+        page = context.new_page()
+        ConsentPopup(page).dismiss_when_shown()
+        navigate(page, self._address, ready=self._ready)
+        ConsentPopup(page).accept()
+        self._open += 1
+        _stats.created += 1
+        _stats.peak_size = max(_stats.peak_size, self._open)
+        return PooledContext(context, page)
+
+    def _recycle(self, pooled: PooledContext, failed: bool) -> None:
+        _stats.recycled += 1
+        _stats.failures += failed
+        self._open -= 1
+        try:
+            pooled.context.close()
+        except Exception:
+            pass  # Already gone with the browser; nothing left to free
+
+    def _reset(self, pooled: PooledContext) -> None:
+        context, page = pooled.context, pooled.page
+        for other in context.pages:
+            if other != page:
+                other.close()  # Popups and tabs the test opened
+        context.clear_cookies()
+        if self._cookies:
+            context.add_cookies(self._cookies)
+        if self._origin_of(page.url) != self._origin:
+            page.goto(self._address, wait_until="commit")
+        page.evaluate(_RESET_STORAGE_JS, self._local_storage)
+        navigate(page, self._address, ready=self._ready)
+
+    def _baseline(self, context_args: dict) -> tuple[list, list]:
+        """Cookies and home-origin localStorage of the context's storage state."""
+        state = context_args.get("storage_state")
+        if not state:
+            return [], []
+        if not isinstance(state, dict):
+            with open(state) as f:
+                state = json.load(f)
+        local_storage = [
+            item
+            for origin in state.get("origins", [])
+            if origin["origin"] == self._origin
+            for item in origin.get("localStorage", [])
+        ]
+        return state.get("cookies", []), local_storage
+
+    @staticmethod
+    def _origin_of(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
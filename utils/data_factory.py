@@ -0,0 +1,206 @@
+"""Bulk, seedable generator of ``user_create_payload()`` dicts.
+
+Calling ~15 Faker providers per user is slow, and ``fake.unique`` only keeps
+emails unique inside one process while growing forever. ``UserFactory``
+instead asks Faker once for small tables of names, streets, cities and
+companies, then builds users by picking from those tables with one seeded
+``random.Random``. Users wait in a pool as compact tuples of table indexes and
+are only turned into dicts when taken; when the pool runs low a background
+thread generates the next batch.
+
+Emails are ``qa.<namespace>.<n>@example.com`` where the namespace is the run id
+and the xdist worker id (or the seed when replaying a cassette; a random token outside
+pytest) and ``n`` is a plain counter, so they never collide across workers or
+runs without remembering anything.
+
+Run ``python -m utils.data_factory`` to compare the per-payload cost with the
+Faker based ``faker_user_payload()``.
+"""
+
+import random
+import secrets
+import string
+import threading
+import time
+from collections import deque
+from datetime import date
+from itertools import count
+
+from faker import Faker
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_TABLE_SIZE = 128
+EMAIL_DOMAIN = "example.com"
+TITLES = ("Mr", "Mrs", "Miss")
+PASSWORD_LENGTH = 12
+TABLE_SEED = 0
+
+
+class UserFactory:
+    """
+    Args:
+        namespace: Part of every email that is unique to this process and run
+            (default: a random token).
+        seed: Makes the generated users reproducible.
+        batch_size: Users generated per refill; a refill starts in the
+            background once fewer than a quarter of a batch is left.
+    """
+
+    def __init__(
+        self,
+        namespace: str = None,
+        seed: int = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self._batch_size = batch_size
+        self._low_water = max(batch_size // 4, 1)
+        self._lock = threading.Lock()
+        self._refilling = False
+        self._tables = None
+        self.reset(namespace, seed)
+
+    def reset(self, namespace: str = None, seed: int = None) -> None:
+        """Drop pooled users and restart generation (e.g. seeding per test)."""
+        with self._lock:
+            self.namespace = namespace or secrets.token_hex(4)
+            self._rng = random.Random(seed)
+            self._pool = deque()
+            self._counter = count(1)
+            if self._tables is None:
+                self._tables = self._build_tables()
+
+    def take(self) -> dict:
+        """Return a new ``user_create_payload()`` compatible dict."""
+        with self._lock:
+            if not self._pool:
+                self._fill()
+            row = self._pool.popleft()
+            serial = next(self._counter)
+            refill = len(self._pool) < self._low_water and not self._refilling
+            if refill:
+                self._refilling = True
+        if refill:
+            threading.Thread(target=self._refill, daemon=True).start()
+        return self._materialize(row, serial)
+
+    def take_many(self, size: int) -> list[dict]:
+        return [self.take() for _ in range(size)]
+
+    def _refill(self) -> None:
+        with self._lock:
+            self._fill()
+            self._refilling = False
+
+    def _fill(self) -> None:
+        # Called with the lock held, so the sequence only depends on the seed
+        rng, tables = self._rng, self._tables
+        sizes = [len(table) for table in tables.values()]
+        for _ in range(self._batch_size):
+            self._pool.append(
+                (
+                    *(rng.randrange(size) for size in sizes),
+                    rng.randrange(len(TITLES)),
+                    rng.randint(1, 28),
+                    rng.randint(1, 12),
+                    rng.randint(18, 70),
+                    rng.randint(1, 50),
+                    rng.randrange(100000),
+                    rng.randrange(100000000, 1000000000),
+                    self._password(rng),
+                )
+            )
+
+    def _materialize(self, row: tuple, serial: int) -> dict:
+        t = self._tables
+        first, last, street, city, company = (
+            table[index] for table, index in zip(t.values(), row)
+        )
+        title, day, month, age, flat, zipcode, phone, password = row[5:]
+        return {
+            "name": first,
+            "email": f"qa.{self.namespace}.{serial}@{EMAIL_DOMAIN}",
+            "password": password,
+            "title": TITLES[title],
+            "birth_date": day,
+            "birth_month": month,
+            "birth_year": date.today().year - age,
+            "firstname": first,
+            "lastname": last,
+            "company": company,
+            "address1": street,
+            "address2": f"{street} / {flat}",
+            "country": "Poland",
+            "zipcode": f"{zipcode // 1000:02d}-{zipcode % 1000:03d}",
+            "state": city,
+            "city": city,
+            "mobile_number": f"+48 {phone // 1000000} {phone // 1000 % 1000:03d} "
+            f"{phone % 1000:03d}",
+        }
+
+    @staticmethod
+    def _password(rng: random.Random) -> str:
+        # Same character classes Faker's password() guarantees
+        chars = [
+            rng.choice(string.ascii_lowercase),
+            rng.choice(string.ascii_uppercase),
+            rng.choice(string.digits),
+            rng.choice("!@#$%^&*()_+"),
+        ]
+        chars += rng.choices(
+            string.ascii_letters + string.digits, k=PASSWORD_LENGTH - len(chars)
+        )
+        rng.shuffle(chars)
+        return "".join(chars)
+
+    @staticmethod
+    def _build_tables() -> dict[str, list[str]]:
+        # Fixed seed: the tables are only vocabulary, the pool's RNG decides
+        # which entries a user gets
+        fake = Faker("pl_PL")
+        fake.seed_instance(TABLE_SEED)
+        size = DEFAULT_TABLE_SIZE
+        return {
+            "first": [fake.first_name() for _ in range(size)],
+            "last": [fake.last_name() for _ in range(size)],
+            "street": [fake.street_address() for _ in range(size)],
+            "city": [fake.city() for _ in range(size)],
+            "company": [fake.company() for _ in range(size)],
+        }
+
+
+_factory = None
+
+
+def set_user_namespace(namespace: str, seed: int = None) -> None:
+    """Namespace (and optionally seed) the emails of this process's users."""
+    get_user_factory().reset(namespace, seed)
+
+
+def get_user_factory() -> UserFactory:
+    """Return the process-wide factory used by ``user_create_payload()``."""
+    global _factory
+    if _factory is None:
+        _factory = UserFactory()
+    return _factory
+
+
+def benchmark(iterations: int = 2000) -> dict:
+    """Microseconds per payload: Faker providers vs. a warm ``UserFactory``."""
+    from utils.payloads import faker_user_payload
+
+    factory = UserFactory(namespace="bench", seed=1)
+    results = {}
+    for label, build in (("faker", faker_user_payload), ("factory", factory.take)):
+        build()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            build()
+        results[label] = (time.perf_counter() - started) / iterations * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    timings = benchmark()
+    for label, micros in timings.items():
+        print(f"{label:<8} {micros:8.1f} us/payload")
+    print(f"speed-up {timings['faker'] / timings['factory']:8.1f}x")
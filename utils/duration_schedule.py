@@ -0,0 +1,242 @@
+"""Hand out tests to xdist workers longest first, by durations of earlier runs.
+
+xdist's ``load`` scheduling sends tests in collection order, so slow tests that
+sit next to each other (the cart module) often land on one worker at the end
+of the run. ``DurationScheduling`` sorts the tests by expected duration
+instead (longest processing time first) and tops a worker up with the longest
+remaining test whenever it finishes one.
+
+Expected durations come from ``DurationHistory``: a JSON file with a smoothed
+duration per test, kept apart per browser and environment (the profile, e.g.
+``chromium/local``). A test without history is estimated from the tests
+sharing its markers (the slowest of their averages), then from its module,
+then from all tests. Without any history for the profile the scheduler keeps
+xdist's own order and the run only records durations for the next one.
+
+Either way ``@concurrent`` tests are held back to the end and handed to one
+worker together, so that worker can run them in batches
+(see utils/concurrent_tests.py).
+"""
+
+import heapq
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from statistics import fmean
+
+from xdist.scheduler import LoadScheduling
+
+from utils.markers import CATEGORIES, concurrent
+
+DEFAULT_HISTORY = Path(__file__).parent.parent / "tests" / "durations.json"
+SMOOTHING = 0.5  # weight of the latest run in a stored duration
+# A worker keeps one test queued behind the running one: it needs to know the
+# next test before it can tear the current one down
+_QUEUED_PER_WORKER = 2
+
+
+class DurationHistory:
+    """
+    Args:
+        path: JSON file shared by all profiles.
+        profile: ``<browser>/<env>`` whose durations are read and recorded.
+    """
+
+    def __init__(self, path: Path, profile: str):
+        self.path = Path(path)
+        self.profile = profile
+        try:
+            self._profiles = json.loads(self.path.read_text())["profiles"]
+        except (FileNotFoundError, ValueError, KeyError):
+            self._profiles = {}
+
+    @property
+    def tests(self) -> dict:
+        """nodeid -> ``{"seconds", "runs", "markers"}`` of this profile."""
+        return self._profiles.setdefault(self.profile, {})
+
+    def record(self, durations: dict, markers: dict) -> None:
+        for nodeid, seconds in durations.items():
+            entry = self.tests.setdefault(nodeid, {"seconds": seconds, "runs": 0})
+            entry["seconds"] += SMOOTHING * (seconds - entry["seconds"])
+            entry["runs"] += 1
+            if nodeid in markers:
+                entry["markers"] = markers[nodeid]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_suffix(".partial")
+        partial.write_text(
+            json.dumps({"profiles": self._profiles}, indent=1, sort_keys=True)
+        )
+        os.replace(partial, self.path)
+
+    def estimate(self, nodeids: list, markers: dict) -> dict | None:
+        """
+        Expected seconds of each test; ``None`` without history for the profile.
+
+        Args:
+            markers: nodeid -> marker names, for tests without history.
+        """
+        if not self.tests:
+            return None
+        by_marker = defaultdict(list)
+        by_module = defaultdict(list)
+        for nodeid, entry in self.tests.items():
+            for name in entry.get("markers", ()):
+                by_marker[name].append(entry["seconds"])
+            by_module[_module(nodeid)].append(entry["seconds"])
+        overall = fmean(entry["seconds"] for entry in self.tests.values())
+
+        estimates = {}
+        for nodeid in nodeids:
+            if nodeid in self.tests:
+                estimates[nodeid] = self.tests[nodeid]["seconds"]
+                continue
+            shared = [
+                by_marker[name] for name in markers.get(nodeid, ()) if name in by_marker
+            ]
+            if shared:
+                estimates[nodeid] = max(fmean(seconds) for seconds in shared)
+            elif _module(nodeid) in by_module:
+                estimates[nodeid] = fmean(by_module[_module(nodeid)])
+            else:
+                estimates[nodeid] = overall
+        return estimates
+
+
+def _module(nodeid: str) -> str:
+    return nodeid.split("::")[0]
+
+
+def marker_names(item) -> list[str]:
+    """The item's category markers (ui, cart, ...)."""
+    categories = {marker.name for marker in CATEGORIES}
+    return sorted({mark.name for mark in item.iter_markers()} & categories)
+
+
+def write_test_markers(path: Path, markers: dict) -> None:
+    """Hand the markers of collected tests to the controller, which does not
+    collect under xdist."""
+    partial = path.with_suffix(".partial")
+    partial.write_text(json.dumps(markers))
+    os.replace(partial, path)
+
+
+def read_test_markers(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def lpt_makespan(durations, workers: int) -> float:
+    """Finish time of the last worker when the longest test always goes to the
+    worker that is free first."""
+    loads = [0.0] * max(workers, 1)
+    for seconds in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + seconds)
+    return max(loads)
+
+
+class DurationRecorder:
+    """Plugin that sums up the phases (and reruns) of every reported test."""
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        self.durations[report.nodeid] += report.duration
+
+
+class DurationScheduling(LoadScheduling):
+    """xdist ``load`` scheduling that sends the longest tests first.
+
+    Args:
+        history: Durations of earlier runs of this profile.
+        markers_path: File written by ``write_test_markers`` during collection.
+    """
+
+    def __init__(self, config, log, history: DurationHistory, markers_path: Path):
+        super().__init__(config, log)
+        self.history = history
+        self._markers_path = markers_path
+        self.estimates = None  # collection index -> seconds; None: xdist's order
+        self.from_history = 0
+        self.predicted = 0.0
+        self.finished = {}  # worker id -> seconds from scheduling to its last test
+        self._started = 0.0
+        self._concurrent = None  # collection indices of @concurrent tests
+
+    @property
+    def makespan(self) -> float:
+        return max(self.finished.values(), default=0.0)
+
+    def schedule(self) -> None:
+        if self.collection is not None:
+            return super().schedule()  # a worker joined late, or a restart
+        self._started = time.monotonic()
+        collection = next(iter(self.node2collection.values()))
+        estimates = self.history.estimate(
+            collection, read_test_markers(self._markers_path)
+        )
+        if not collection or estimates is None:
+            return super().schedule()
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = collection
+        self.estimates = [estimates[nodeid] for nodeid in collection]
+        self.from_history = sum(nodeid in self.history.tests for nodeid in collection)
+        self.predicted = lpt_makespan(self.estimates, len(self.nodes))
+        self.pending[:] = sorted(
+            range(len(collection)), key=lambda index: -self.estimates[index]
+        )
+        # Round-robin, so each worker starts with one of the longest tests
+        for _ in range(_QUEUED_PER_WORKER):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if self.estimates is None:
+            return super().check_schedule(node, duration)
+        if node.shutting_down:
+            return
+        if self.pending:
+            self._send_tests(node, _QUEUED_PER_WORKER - len(self.node2pending[node]))
+        else:
+            node.shutdown()
+
+    def _send_tests(self, node, num: int) -> None:
+        # Concurrent tests go last, in collection order, and all to the worker
+        # that reaches the first of them
+        if num <= 0:
+            return  # the worker's queue is full
+        together = self._concurrent_indices()
+        if together:
+            regular = [index for index in self.pending if index not in together]
+            self.pending[:] = regular + sorted(set(self.pending) & together)
+            if len(regular) < num:
+                num = len(self.pending)
+        super()._send_tests(node, num)
+
+    def _concurrent_indices(self) -> set:
+        if self._concurrent is None:
+            collection = self.collection or next(iter(self.node2collection.values()))
+            markers = read_test_markers(self._markers_path)
+            self._concurrent = {
+                index
+                for index, nodeid in enumerate(collection)
+                if concurrent.name in markers.get(nodeid, ())
+            }
+        return self._concurrent
+
+    def mark_test_complete(self, node, item_index: int, duration: float = 0) -> None:
+        self.finished[node.gateway.id] = time.monotonic() - self._started
+        super().mark_test_complete(node, item_index, duration)
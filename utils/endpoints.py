@@ -0,0 +1,316 @@
+"""Declarative registry of the "automationexercise.com" API endpoints.
+
+Every endpoint is described once (method, path, where its arguments go and
+which JSON keys a successful answer contains) and compiled into a
+``CompiledEndpoint``. Compiling joins the base URL and path once per
+``ADDRESS`` value and keeps a ready ``Request`` state, so a call only copies
+that state and fills in its own payload. ``utils/api_requests.py`` and
+``utils/async_api_requests.py`` expose the generated sync and async calls
+under their usual names; ``CompiledEndpoint.batch`` runs many calls at once.
+Generated calls return the ``Response`` as it came, so tests assert on it
+themselves. ``CompiledEndpoint.checked`` sends the same call and raises
+``ResponseSchemaError`` when the answer lacks a key of the endpoint's
+``schema``: ``API["get_all_brands"].checked()``.
+
+Run ``python -m utils.endpoints`` to compare the per-call overhead of the
+hand-written builder chain with the compiled templates.
+"""
+
+import inspect
+import os
+import time
+from dataclasses import dataclass, field
+
+from requests import Response
+
+from utils.async_request_builder import DEFAULT_CONCURRENCY, AsyncRequest, run_batch
+from utils.request_builder import Request, RequestMethod, resolve_url
+
+# Where the call arguments are sent
+NO_BODY = None
+DATA = "data"  # form fields
+PARAMS = "params"  # query string
+
+BENCHMARK_ADDRESS = "https://benchmark.invalid"
+
+
+class ResponseSchemaError(RuntimeError):
+    """Raised when an API answer lacks a key its endpoint's schema declares."""
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    Args:
+        method: HTTP method.
+        path: Path joined to ``ADDRESS``.
+        body: ``DATA``, ``PARAMS`` or ``NO_BODY``.
+        fields: ``{argument: payload key}`` in argument order, or the name of
+            a single argument that already is the whole payload (``"user"``).
+        schema: Keys a successful JSON answer contains; an error answer
+            (``responseCode`` 400 and up) only needs ``responseCode``.
+        cacheable: Read-only GET that may be served from ``--api-cache``.
+        doc: Docstring of the generated functions.
+    """
+
+    method: RequestMethod
+    path: str
+    body: str | None = NO_BODY
+    fields: dict | str = field(default_factory=dict)
+    schema: tuple = ("responseCode",)
+    cacheable: bool = False
+    doc: str = None
+
+
+USER_FIELDS_DOC = """
+    Params in user dict ({}):
+        name, email, password, title, birth_date, birth_month, birth_year,
+        firstname, lastname, company, address1, address2, country, zipcode,
+        state, city, mobile_number
+    """
+
+REGISTRY = {
+    "get_all_products": Endpoint(
+        RequestMethod.GET,
+        "/api/productsList",
+        schema=("responseCode", "products"),
+        cacheable=True,
+    ),
+    "post_to_products_list": Endpoint(RequestMethod.POST, "/api/productsList"),
+    "get_all_brands": Endpoint(
+        RequestMethod.GET,
+        "/api/brandsList",
+        schema=("responseCode", "brands"),
+        cacheable=True,
+    ),
+    "put_to_brands_list": Endpoint(RequestMethod.PUT, "/api/brandsList"),
+    "search_product": Endpoint(
+        RequestMethod.POST,
+        "/api/searchProduct",
+        DATA,
+        {"search_term": "search_product"},
+        schema=("responseCode", "products"),
+    ),
+    "search_product_no_param": Endpoint(RequestMethod.POST, "/api/searchProduct"),
+    "verify_login_valid": Endpoint(
+        RequestMethod.POST,
+        "/api/verifyLogin",
+        DATA,
+        {"email": "email", "password": "password"},
+        schema=("responseCode", "message"),
+    ),
+    "verify_login_no_email": Endpoint(
+        RequestMethod.POST,
+        "/api/verifyLogin",
+        DATA,
+        {"password": "password"},
+        schema=("responseCode", "message"),
+    ),
+    "verify_login_delete": Endpoint(RequestMethod.DELETE, "/api/verifyLogin"),
+    "verify_login_invalid": Endpoint(
+        RequestMethod.POST,
+        "/api/verifyLogin",
+        DATA,
+        {"email": "email", "password": "password"},
+        schema=("responseCode", "message"),
+    ),
+    "create_account": Endpoint(
+        RequestMethod.POST,
+        "/api/createAccount",
+        DATA,
+        "user",
+        schema=("responseCode", "message"),
+        doc=USER_FIELDS_DOC.format("all required"),
+    ),
+    "delete_account": Endpoint(
+        RequestMethod.DELETE,
+        "/api/deleteAccount",
+        DATA,
+        {"email": "email", "password": "password"},
+        schema=("responseCode", "message"),
+    ),
+    "update_account": Endpoint(
+        RequestMethod.PUT,
+        "/api/updateAccount",
+        DATA,
+        "user",
+        schema=("responseCode", "message"),
+        doc=USER_FIELDS_DOC.format("all same as create_account"),
+    ),
+    "get_user_detail_by_email": Endpoint(
+        RequestMethod.GET,
+        "/api/getUserDetailByEmail",
+        PARAMS,
+        {"email": "email"},
+        schema=("responseCode", "user"),
+    ),
+}
+
+
+class CompiledEndpoint:
+    """Prebuilt request template for one ``Endpoint``."""
+
+    def __init__(self, name: str, endpoint: Endpoint):
+        self.name = name
+        self.endpoint = endpoint
+        self._whole_payload = isinstance(endpoint.fields, str)
+        arguments = (
+            (endpoint.fields,) if self._whole_payload else tuple(endpoint.fields)
+        )
+        self._keys = () if self._whole_payload else tuple(endpoint.fields.values())
+        self.signature = inspect.Signature(
+            [
+                inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                for arg in arguments
+            ]
+        )
+        self._address = None
+        self._state = None
+        self.call = self._generate(sync=True)
+        self.call_async = self._generate(sync=False)
+
+    def request(self, cls=Request, *args, **kwargs) -> Request:
+        """A ``cls`` instance ready to send, with this call's payload set."""
+        address = os.environ.get("ADDRESS")
+        if address != self._address:
+            self._compile(address)
+        request = cls.__new__(cls)
+        request.__dict__.update(self._state)
+        request._headers = {}
+        if self.endpoint.body is not None:
+            if kwargs or len(args) != len(self.signature.parameters):
+                args = tuple(self.signature.bind(*args, **kwargs).arguments.values())
+            payload = args[0] if self._whole_payload else dict(zip(self._keys, args))
+            setattr(request, f"_{self.endpoint.body}", payload)
+        return request
+
+    def batch(
+        self,
+        calls,
+        limit: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list:
+        """
+        Send one request per argument tuple in ``calls`` concurrently.
+
+        Usage: API["delete_account"].batch([(u.email, u.password) for u in users])
+        """
+        return run_batch(
+            *(self.call_async(*args) for args in calls),
+            limit=limit,
+            return_exceptions=return_exceptions,
+        )
+
+    def checked(self, *args, **kwargs) -> Response:
+        """Send like ``call`` and ``check`` the answer."""
+        return self.check(self.call(*args, **kwargs))
+
+    async def checked_async(self, *args, **kwargs) -> Response:
+        """Send like ``call_async`` and ``check`` the answer."""
+        return self.check(await self.call_async(*args, **kwargs))
+
+    def missing_keys(self, response: Response) -> list[str]:
+        """Keys of ``schema`` absent from the response's JSON body."""
+        try:
+            body = response.json()
+        except ValueError:
+            return list(self.endpoint.schema)
+        if not isinstance(body, dict):
+            return list(self.endpoint.schema)
+        code = body.get("responseCode")
+        schema = self.endpoint.schema
+        if isinstance(code, int) and code >= 400:
+            schema = ("responseCode",)
+        return [key for key in schema if key not in body]
+
+    def check(self, response: Response) -> Response:
+        """Return ``response``, or raise ``ResponseSchemaError``."""
+        missing = self.missing_keys(response)
+        if missing:
+            raise ResponseSchemaError(
+                f"{self.name}: answer without {', '.join(missing)}: "
+                f"{response.text[:200]!r}"
+            )
+        return response
+
+    def _compile(self, address: str) -> None:
+        # Resolves ADDRESS once; only re-run when it changes (e.g. --standin)
+        template = Request(self.endpoint.method, domain=address)
+        template.path(self.endpoint.path)
+        template._url = resolve_url(address, self.endpoint.path)
+        if self.endpoint.cacheable:
+            template.cache()
+        self._state = dict(template.__dict__)
+        self._address = address
+
+    def _generate(self, sync: bool):
+        request = self.request
+
+        if sync:
+
+            def call(*args, **kwargs) -> Response:
+                return request(Request, *args, **kwargs).send()
+
+        else:
+
+            async def call(*args, **kwargs) -> Response:
+                return await request(AsyncRequest, *args, **kwargs).send()
+
+        call.__name__ = call.__qualname__ = self.name
+        call.__signature__ = self.signature
+        call.__doc__ = self.endpoint.doc or self._params_doc()
+        call.endpoint = self
+        return call
+
+    def _params_doc(self) -> str | None:
+        if not self.signature.parameters:
+            return None
+        lines = [f"        {arg} (str)" for arg in self.signature.parameters]
+        return "\n    Params:\n" + "\n".join(lines) + "\n    "
+
+
+API = {name: CompiledEndpoint(name, endpoint) for name, endpoint in REGISTRY.items()}
+
+
+def benchmark(iterations: int = 20000) -> dict:
+    """
+    Microseconds per call spent building a ready-to-send request (URL joined,
+    payload set) by the old hand-written chain and by the compiled template.
+    Nothing is sent.
+    """
+    previous = os.environ.get("ADDRESS")
+    os.environ.setdefault("ADDRESS", BENCHMARK_ADDRESS)
+    try:
+        compiled = API["verify_login_valid"]
+
+        def hand_written():
+            return (
+                Request(RequestMethod.POST)
+                .path("/api/verifyLogin")
+                .data({"email": "e@example.com", "password": "secret"})
+            )._prepare_url()
+
+        def from_template():
+            return compiled.request(Request, "e@example.com", "secret")._prepare_url()
+
+        results = {}
+        for label, build in (
+            ("hand_written", hand_written),
+            ("compiled", from_template),
+        ):
+            build()
+            started = time.perf_counter()
+            for _ in range(iterations):
+                build()
+            results[label] = (time.perf_counter() - started) / iterations * 1e6
+        return results
+    finally:
+        if previous is None:
+            os.environ.pop("ADDRESS", None)
+
+
+if __name__ == "__main__":
+    timings = benchmark()
+    for label, micros in timings.items():
+        print(f"{label:<13} {micros:6.2f} us/call")
+    print(f"speed-up      {timings['hand_written'] / timings['compiled']:6.1f}x")
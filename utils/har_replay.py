@@ -0,0 +1,256 @@
+"""Offline UI replay from HAR archives, one archive per test module.
+
+``--ui-record`` records each test's browser traffic with Playwright
+(``route_from_har(update=True)``); the controller merges them into
+``tests/har/<module>.har`` and saves the product catalog next to them, read
+from the recorded product pages and cart rows.
+``--ui-replay`` answers every browser request from the module's archive
+through ``context.route``: archived responses are indexed by method and URL
+(with a second index that ignores the query string, for cache busters), so a
+lookup is a dict access. Anything not archived is aborted; nothing reaches
+the network.
+
+The cart is server-side state, so replaying recorded answers would show the
+cart as it was while recording. ``CartEmulator`` keeps a cart per browser
+context instead: ``/add_to_cart/<id>?quantity=N`` and ``/delete_cart/<id>``
+update it, and the rows of the archived ``/view_cart`` page are replaced by
+rows rendered from it.
+"""
+
+import base64
+import json
+import re
+from html import unescape
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from utils.standin_data import PRODUCTS, Product
+from utils.standin_pages import render_cart_rows
+
+DEFAULT_HAR_DIR = Path(__file__).parent.parent / "tests" / "har"
+CATALOG_FILE = "catalog.json"
+
+# Recorded bodies are stored decoded; these would describe the original bytes
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+_CART_TBODY = re.compile(r'(id="cart_info_table".*?<tbody>)(.*?)(</tbody>)', re.S)
+_ADD_TO_CART = re.compile(r"^/add_to_cart/(\d+)$")
+_DELETE_CART = re.compile(r"^/delete_cart/(\d+)$")
+_PRODUCT_DETAILS = re.compile(r"^/product_details/(\d+)$")
+_CART_ROW = re.compile(r'<tr id="product-(\d+)">(.*?)</tr>', re.S)
+_ROW_NAME = re.compile(r"<h4>(.*?)</h4>", re.S)
+_ROW_CATEGORY = re.compile(r'class="cart_description">.*?<p>(.*?)</p>', re.S)
+_ROW_PRICE = re.compile(r'class="cart_price">\s*<p>(.*?)</p>', re.S)
+_INFO = re.compile(r'class="product-information">(.*)', re.S)
+_INFO_NAME = re.compile(r"<h2>(.*?)</h2>", re.S)
+_INFO_CATEGORY = re.compile(r"Category:(.*?)</p>", re.S)
+_INFO_PRICE = re.compile(r"<span>\s*<span>(.*?)</span>", re.S)
+_INFO_BRAND = re.compile(r"<b>Brand:</b>(.*?)</p>", re.S)
+_TAG = re.compile(r"<[^>]+>")
+
+
+def har_path(module_name: str, directory: Path = DEFAULT_HAR_DIR) -> Path:
+    """Archive of a test module, e.g. ``tests.ui.test_cart`` -> ``test_cart.har``."""
+    return Path(directory) / f"{module_name.rsplit('.', 1)[-1]}.har"
+
+
+def _strip(url: str, query: bool = True) -> str:
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(query=parts.query if query else "", fragment=""))
+
+
+class HarIndex:
+    def __init__(self, entries: list[dict]):
+        self._exact: dict[tuple, dict] = {}
+        self._without_query: dict[tuple, dict] = {}
+        # Later entries win: the last answer recorded for a URL is served
+        for entry in entries:
+            request = entry["request"]
+            method = request["method"]
+            self._exact[(method, _strip(request["url"]))] = entry
+            self._without_query[(method, _strip(request["url"], query=False))] = entry
+
+    @classmethod
+    def load(cls, path: Path) -> "HarIndex":
+        path = Path(path)
+        if not path.exists():
+            return cls([])
+        return cls(json.loads(path.read_text())["log"]["entries"])
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def lookup(self, method: str, url: str) -> dict | None:
+        return self._exact.get((method, _strip(url))) or self._without_query.get(
+            (method, _strip(url, query=False))
+        )
+
+
+def merge_har_files(paths, target: Path) -> int:
+    """Merge per-test HARs into one module archive; returns its entry count."""
+    merged = None
+    for path in sorted(paths):
+        har = json.loads(Path(path).read_text())
+        if merged is None:
+            merged = har
+        else:
+            merged["log"]["entries"].extend(har["log"]["entries"])
+    if merged is None:
+        return 0
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(merged))
+    return len(merged["log"]["entries"])
+
+
+def entry_body(entry: dict) -> bytes:
+    content = entry["response"].get("content", {})
+    text = content.get("text", "")
+    if content.get("encoding") == "base64":
+        return base64.b64decode(text)
+    return text.encode()
+
+
+def _text(html: str) -> str:
+    return " ".join(unescape(_TAG.sub(" ", html)).split())
+
+
+def _product(product_id, name, category_text, price_text, brand="") -> Product:
+    usertype, _, category = category_text.partition(">")
+    return Product(
+        id=int(product_id),
+        name=name,
+        price=int(re.sub(r"\D", "", price_text)),
+        brand=brand,
+        usertype=usertype.strip(),
+        category=category.strip(),
+    )
+
+
+def products_from_har(paths) -> list[Product]:
+    """Products shown in the archived ``/product_details`` pages and
+    ``/view_cart`` rows, i.e. every product a recorded test looked at or carted.
+    """
+    products: dict[int, Product] = {}
+    for path in paths:
+        for entry in json.loads(Path(path).read_text())["log"]["entries"]:
+            url_path = urlsplit(entry["request"]["url"]).path
+            if entry["response"]["status"] != 200:
+                continue
+            if url_path == "/view_cart":
+                html = entry_body(entry).decode(errors="replace")
+                for product_id, row in _CART_ROW.findall(html):
+                    fields = [_ROW_NAME, _ROW_CATEGORY, _ROW_PRICE]
+                    found = [pattern.search(row) for pattern in fields]
+                    if all(found):
+                        products.setdefault(
+                            int(product_id),
+                            _product(product_id, *(_text(m[1]) for m in found)),
+                        )
+            elif match := _PRODUCT_DETAILS.match(url_path):
+                info = _INFO.search(entry_body(entry).decode(errors="replace"))
+                fields = [_INFO_NAME, _INFO_CATEGORY, _INFO_PRICE, _INFO_BRAND]
+                found = [pattern.search(info[1]) for pattern in fields] if info else []
+                if found and all(found):
+                    # The details page also carries the brand: it wins
+                    products[int(match[1])] = _product(
+                        match[1], *(_text(m[1]) for m in found)
+                    )
+    return sorted(products.values(), key=lambda product: product.id)
+
+
+def save_catalog(products: list[Product], directory: Path = DEFAULT_HAR_DIR) -> None:
+    """Add ``products`` to the catalog the cart emulator renders rows from;
+    products of modules recorded earlier are kept."""
+    path = Path(directory) / CATALOG_FILE
+    catalog = {}
+    if path.exists():
+        catalog = {p["id"]: p for p in json.loads(path.read_text())}
+    catalog.update({product.id: product.as_api_dict() for product in products})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(sorted(catalog.values(), key=lambda p: p["id"]), indent=1)
+    )
+
+
+def load_catalog(directory: Path = DEFAULT_HAR_DIR) -> dict[int, Product]:
+    path = Path(directory) / CATALOG_FILE
+    if path.exists():
+        products = [Product.from_api_dict(p) for p in json.loads(path.read_text())]
+    else:
+        products = PRODUCTS
+    return {product.id: product for product in products}
+
+
+class CartEmulator:
+    def __init__(self, catalog: dict[int, Product]):
+        self._catalog = catalog
+        self._quantities: dict[int, int] = {}
+
+    def add(self, product_id: int, quantity: int) -> None:
+        self._quantities[product_id] = self._quantities.get(product_id, 0) + quantity
+
+    def remove(self, product_id: int) -> None:
+        self._quantities.pop(product_id, None)
+
+    def render_into(self, page_html: str) -> str:
+        """Swap the archived cart rows for the emulated cart's rows."""
+        lines = [
+            (self._catalog[pid], qty)
+            for pid, qty in self._quantities.items()
+            if pid in self._catalog
+        ]
+        return _CART_TBODY.sub(
+            lambda m: m.group(1) + render_cart_rows(lines) + m.group(3),
+            page_html,
+            count=1,
+        )
+
+
+class HarReplay:
+    """Serves one browser context from a ``HarIndex``; counts hits and misses."""
+
+    def __init__(self, index: HarIndex, catalog: dict[int, Product]):
+        self._index = index
+        self.cart = CartEmulator(catalog)
+        self.served = 0
+        self.missed: list[str] = []
+
+    def attach(self, context: BrowserContext) -> "HarReplay":
+        context.route("**/*", self._on_route)
+        return self
+
+    def _on_route(self, route: Route) -> None:
+        request = route.request
+        path = urlsplit(request.url).path
+        entry = self._index.lookup(request.method, request.url)
+        if match := _ADD_TO_CART.match(path):
+            quantity = parse_qs(urlsplit(request.url).query).get("quantity", ["1"])
+            self.cart.add(int(match.group(1)), int(quantity[0]))
+        elif match := _DELETE_CART.match(path):
+            self.cart.remove(int(match.group(1)))
+        elif entry is None:
+            self.missed.append(f"{request.method} {request.url}")
+            route.abort("internetdisconnected")
+            return
+        self.served += 1
+        if entry is None:
+            # Cart update that was never recorded with these exact arguments
+            route.fulfill(status=200, content_type="text/plain", body="")
+            return
+        status, headers = self._head(entry)
+        body = entry_body(entry)
+        if path == "/view_cart":
+            body = self.cart.render_into(body.decode()).encode()
+        route.fulfill(status=status, headers=headers, body=body)
+
+    @staticmethod
+    def _head(entry: dict) -> tuple[int, dict]:
+        response = entry["response"]
+        headers = {
+            h["name"]: h["value"]
+            for h in response["headers"]
+            if h["name"].lower() not in _DROPPED_HEADERS
+        }
+        return response["status"], headers
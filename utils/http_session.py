@@ -0,0 +1,136 @@
+"""Pooled, keep-alive HTTP sessions shared by every ``Request`` in a process.
+
+Each xdist worker is a separate process, so the module-level pool returned by
+``get_session_pool()`` gives every worker its own set of warm connections
+that live for the whole pytest session instead of one TCP/TLS handshake per
+API call.
+"""
+
+import threading
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from utils.stats import SummedStats
+
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@dataclass
+class PoolStats(SummedStats):
+    TITLE = "HTTP session pool"
+
+    session_hits: int = 0
+    session_misses: int = 0
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests served over an already open (keep-alive) connection."""
+        return max(self.requests - self.new_connections, 0)
+
+    def as_dict(self) -> dict:
+        return {**super().as_dict(), "reused_connections": self.reused_connections}
+
+    def summary(self) -> str | None:
+        if not self.requests:
+            return None
+        return (
+            f"{self.requests} requests over {self.new_connections} connections, "
+            f"{self.reused_connections} reused (handshakes saved); "
+            f"sessions: {self.session_hits} hits / {self.session_misses} misses"
+        )
+
+
+class SessionPool:
+    """Thread-safe registry of one keep-alive ``Session`` per scheme + host.
+
+    Args:
+        pool_maxsize: Connections kept open per host unless overridden.
+        host_pool_sizes: Per-host overrides, e.g. ``{"api.example.com": 32}``.
+    """
+
+    def __init__(
+        self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, host_pool_sizes: dict = None
+    ):
+        self._pool_maxsize = pool_maxsize
+        self._host_pool_sizes = dict(host_pool_sizes or {})
+        self._sessions: dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+        # Counters of sessions that were already closed, so stats survive close()
+        self._closed_stats = PoolStats()
+
+    def set_host_pool_size(self, host: str, maxsize: int) -> None:
+        """Size the pool for ``host``; applies to sessions created afterwards."""
+        with self._lock:
+            self._host_pool_sizes[host] = maxsize
+
+    def session_for(self, url: str) -> Session:
+        """Return the shared session for the scheme + host of ``url``."""
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._stats.session_hits += 1
+                return session
+            self._stats.session_misses += 1
+            session = self._new_session(parts.scheme, parts.hostname or "")
+            self._sessions[key] = session
+            return session
+
+    def _new_session(self, scheme: str, host: str) -> Session:
+        maxsize = self._host_pool_sizes.get(host, self._pool_maxsize)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+        session = Session()
+        session.mount(f"{scheme}://", adapter)
+        # Every Request used to get a fresh Session, so never carry cookies over
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def stats(self) -> PoolStats:
+        """Snapshot of session hit/miss and connection reuse counters."""
+        with self._lock:
+            live = PoolStats()
+            for session in self._sessions.values():
+                live = live.merge(self._connection_stats(session))
+            return self._stats.merge(self._closed_stats).merge(live)
+
+    def close(self) -> None:
+        """Close every pooled session and its open connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                self._closed_stats = self._closed_stats.merge(
+                    self._connection_stats(session)
+                )
+                session.close()
+            self._sessions.clear()
+
+    @staticmethod
+    def _connection_stats(session: Session) -> PoolStats:
+        stats = PoolStats()
+        for adapter in session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                stats.requests += pool.num_requests
+                stats.new_connections += pool.num_connections
+        return stats
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Return the process-wide (i.e. per xdist worker) session pool."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+        return _default_pool
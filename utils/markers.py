@@ -7,3 +7,21 @@ xfail = pytest.mark.xfail
 product_details = pytest.mark.product_details
 cart = pytest.mark.cart
 shopping_modal = pytest.mark.shopping_modal
+# Usage: @network_profile("no-images"), see utils/network_profiles.py
+network_profile = pytest.mark.network_profile
+# async def tests taking async_page, run K at a time, see utils/concurrent_tests.py
+concurrent = pytest.mark.concurrent
+# Offline tests of the suite's own helpers (tests/unit): no browser, no site
+unit = pytest.mark.unit
+
+# Markers that group tests of a similar cost, see utils/duration_schedule.py
+CATEGORIES = (
+    ui,
+    api,
+    usertests,
+    product_details,
+    cart,
+    shopping_modal,
+    concurrent,
+    unit,
+)
@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 
 from faker import Faker
 
+from utils.data_factory import get_user_factory, set_user_namespace
+
 fake = Faker("pl_PL")
 
 
@@ -13,7 +15,26 @@ class User:
     other: dict = field(default_factory=dict)
 
 
+def seed_payloads(seed: int, replay: bool = False) -> None:
+    """Make the following payloads reproducible (used by cassette record/replay).
+
+    Recording keeps the run's namespace, so emails stay unique across
+    recordings; only a replay, which never creates the accounts, gets a fixed
+    one.
+    """
+    fake.seed_instance(seed)
+    fake.unique.clear()
+    namespace = f"s{seed:08x}" if replay else get_user_factory().namespace
+    set_user_namespace(namespace, seed)
+
+
 def user_create_payload():
+    return get_user_factory().take()
+
+
+def faker_user_payload():
+    """Previous per-call Faker implementation, kept for the benchmark in
+    utils/data_factory.py."""
     birth_date = fake.date_of_birth(minimum_age=18, maximum_age=70)
     address1 = fake.street_address()
     # address2: same as address1 but with a small tweak (e.g., add apt/lokal info)
@@ -39,3 +60,9 @@ def user_create_payload():
         "city": state,
         "mobile_number": fake.phone_number(),
     }
+
+
+def user_from_payload(payload: dict) -> User:
+    """Build a ``User`` from a ``user_create_payload()`` dict."""
+    other = {k: v for k, v in payload.items() if k not in ("name", "email", "password")}
+    return User(payload["name"], payload["email"], payload["password"], other)
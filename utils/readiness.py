@@ -0,0 +1,173 @@
+"""When a navigation counts as done: the readiness strategy of ``navigate()``.
+
+``page.goto`` waits for the ``load`` event by default, i.e. for every ad and
+tracker of the page. The strategy picks what to wait for instead:
+
+* ``commit``, ``domcontentloaded``, ``load``: Playwright's own ``wait_until``.
+* ``ready``: wait for ``domcontentloaded``, i.e. the whole server-rendered
+  document is parsed, then for the page object's ready selector (e.g. the
+  product cards of the home page) to be attached. Stylesheets, images, ads
+  and trackers are not waited for. Pages without a ready selector stop at
+  ``domcontentloaded``.
+
+With ``commit`` the document may still be streaming in when ``navigate()``
+returns; page objects that read a whole list in one evaluation
+(``FeaturesItems.catalog()``) wait for ``domcontentloaded`` themselves.
+
+Fixtures and page objects navigate through ``navigate()`` (``navigate_async()``
+for the async page objects), so ``--readiness`` applies to all of them. To
+show what a strategy saves, each navigation is timed against the page's own
+load event: the next ``navigate()`` on that page (or ``settle()`` when the
+fixture is done with it) reads ``loadEventEnd`` from the Navigation Timing
+entry and compares it with the moment we stopped waiting, both on the page's
+clock.
+"""
+
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Page
+
+from utils.stats import SummedStats
+
+COMMIT = "commit"
+DOMCONTENTLOADED = "domcontentloaded"
+LOAD = "load"
+READY = "ready"
+STRATEGIES = (COMMIT, DOMCONTENTLOADED, LOAD, READY)
+
+_NAVIGATION_TIMING_JS = """() => {
+    const entry = performance.getEntriesByType("navigation")[0];
+    return {url: entry ? entry.name : "", load_end: entry ? entry.loadEventEnd : 0};
+}"""
+
+
+@dataclass
+class NavigationStats(SummedStats):
+    navigations: int = 0
+    measured: int = 0  # navigations whose page reached its load event later
+    not_loaded: int = 0  # the page left before its load event fired
+    waited_ms: float = 0.0  # navigation start -> we stopped waiting
+    saved_ms: float = 0.0  # we stopped waiting -> load event end
+
+    @property
+    def title(self) -> str:
+        return f"Navigation readiness ({_strategy})"
+
+    def summary(self) -> str | None:
+        if not self.navigations:
+            return None
+        line = (
+            f"{self.navigations} navigations, avg "
+            f"{self.waited_ms / self.navigations:.0f} ms until ready"
+        )
+        if self.measured:
+            line += (
+                f"; load event {self.saved_ms / self.measured:.0f} ms later on "
+                f"average (~{self.saved_ms / 1000:.1f}s saved over {self.measured})"
+            )
+        if self.not_loaded:
+            line += f"; {self.not_loaded} left before load"
+        return line
+
+
+_strategy = LOAD
+_stats = NavigationStats()
+# Page -> (url, ms on the page's clock when navigate() returned)
+_pending: "WeakKeyDictionary[Page, tuple[str, float]]" = WeakKeyDictionary()
+
+
+def set_readiness(strategy: str) -> None:
+    if strategy not in STRATEGIES:
+        raise ValueError(
+            f"Unknown readiness {strategy!r}, use one of {', '.join(STRATEGIES)}"
+        )
+    global _strategy
+    _strategy = strategy
+
+
+def get_readiness() -> str:
+    return _strategy
+
+
+def get_navigation_stats() -> NavigationStats:
+    return _stats
+
+
+def navigate(page: Page, url: str, ready: str = None, strategy: str = None):
+    """
+    Go to ``url`` and return once it is ready by the active strategy.
+
+    Args:
+        ready: Selector that shows the page object is usable, for ``ready``.
+        strategy: Overrides ``--readiness`` for this navigation.
+    """
+    strategy = strategy or _strategy
+    settle(page)
+    wait_until, ready = _plan(strategy, ready)
+    response = page.goto(url, wait_until=wait_until)
+    if ready:
+        page.locator(ready).first.wait_for(state="attached")
+    _record(page, page.evaluate("performance.now()"))
+    return response
+
+
+async def navigate_async(page, url: str, ready: str = None, strategy: str = None):
+    """``navigate()`` for ``playwright.async_api`` pages."""
+    strategy = strategy or _strategy
+    await settle_async(page)
+    wait_until, ready = _plan(strategy, ready)
+    response = await page.goto(url, wait_until=wait_until)
+    if ready:
+        await page.locator(ready).first.wait_for(state="attached")
+    _record(page, await page.evaluate("performance.now()"))
+    return response
+
+
+def settle(page: Page) -> None:
+    """Account the previous ``navigate()`` on ``page`` against its load event."""
+    pending = _pending.pop(page, None)
+    if pending is None or page.is_closed():
+        return
+    try:
+        timing = page.evaluate(_NAVIGATION_TIMING_JS)
+    except Exception:
+        return  # Page is navigating or crashed; nothing to compare with
+    _account(pending, timing)
+
+
+async def settle_async(page) -> None:
+    """``settle()`` for ``playwright.async_api`` pages."""
+    pending = _pending.pop(page, None)
+    if pending is None or page.is_closed():
+        return
+    try:
+        timing = await page.evaluate(_NAVIGATION_TIMING_JS)
+    except Exception:
+        return
+    _account(pending, timing)
+
+
+def _plan(strategy: str, ready: str | None) -> tuple[str, str | None]:
+    """``wait_until`` for goto and the selector to wait for afterwards."""
+    if strategy != READY:
+        return strategy, None
+    # Not COMMIT: the first card being attached says nothing about the rest
+    return DOMCONTENTLOADED, ready
+
+
+def _record(page, ready_at: float) -> None:
+    _stats.navigations += 1
+    _stats.waited_ms += ready_at
+    _pending[page] = (page.url, ready_at)
+
+
+def _account(pending: tuple[str, float], timing: dict) -> None:
+    url, ready_at = pending
+    if timing["url"] != url:
+        return  # Left by a click or redirect; the entry is another document's
+    if timing["load_end"]:
+        _stats.measured += 1
+        _stats.saved_ms += max(timing["load_end"] - ready_at, 0.0)
+    else:
+        _stats.not_loaded += 1
@@ -1,9 +1,29 @@
 import os
+import time
 from dataclasses import dataclass
 from enum import Enum
+from http import HTTPStatus
 from urllib.parse import urljoin
 
 from requests import Response, Session
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+from utils.api_metrics import get_api_metrics
+from utils.cassette import active_cassette, cassette_key
+from utils.http_session import SessionPool, get_session_pool
+from utils.response_cache import active_cache, cache_key, storable
+from utils.response_codec import response_from_dict
+from utils.retry import RetryPolicy, get_default_retry_policy
+
+
+def resolve_url(domain: str, path: str) -> str:
+    # Accept either full URL or domain only in ADDRESS
+    if domain.startswith("http://") or domain.startswith("https://"):
+        base = domain
+    else:
+        base = f"https://{domain}"
+    return urljoin(base, path)
 
 
 class RequestMethod(str, Enum):
@@ -16,7 +36,12 @@ class RequestMethod(str, Enum):
 
 @dataclass
 class Request:
-    def __init__(self, method: RequestMethod, domain: str = None):
+    def __init__(
+        self,
+        method: RequestMethod,
+        domain: str = None,
+        session_pool: SessionPool = None,
+    ):
         if domain is None:
             domain = os.environ.get("ADDRESS")
             if not domain:
@@ -24,6 +49,7 @@ class Request:
         self._domain = domain
         self._method = method
         self._path = None
+        self._url = None
         self._headers = {}
         self._default_headers = {"Content-Type": "application/json"}
         self._params = None
@@ -32,6 +58,11 @@ class Request:
         self._data = None
         self._cookies = None
         self._allow_redirects = True
+        self._session_pool = session_pool
+        self._retry_policy = None
+        self._idempotent = False
+        self._cacheable = False
+        self._cache_ttl = None
 
     def json(self, json: dict) -> "Request":
         self._json = json
@@ -67,25 +98,100 @@ class Request:
 
     def path(self, path: str) -> "Request":
         self._path = path
+        self._url = None
         return self
 
     def allow_redirects(self, allow: bool) -> "Request":
         self._allow_redirects = allow
         return self
 
+    def retry(self, policy: RetryPolicy = None, idempotent: bool = False) -> "Request":
+        """
+        Override the retry policy for this call.
+
+        Args:
+            policy: Policy to use instead of the default one.
+            idempotent: Allow retrying a method the policy does not retry by
+                default (e.g. a POST that is safe to resend).
+        """
+        self._retry_policy = policy
+        self._idempotent = idempotent
+        return self
+
+    def cache(self, ttl: float = None) -> "Request":
+        """
+        Mark a read-only GET as cacheable. It is only served from the cache
+        while one is active (``--api-cache``), otherwise this is a no-op.
+
+        Args:
+            ttl: Seconds to serve the response without asking the server
+                (default: the active cache's TTL).
+        """
+        self._cacheable = True
+        self._cache_ttl = ttl
+        return self
+
     def _prepare_url(self) -> str:
-        # Accept either full URL or domain only in ADDRESS
-        if self._domain.startswith("http://") or self._domain.startswith("https://"):
-            base = self._domain
-        else:
-            base = f"https://{self._domain}"
-        return urljoin(base, self._path)
+        # Templates from utils.endpoints carry the URL already joined
+        return self._url or resolve_url(self._domain, self._path)
 
     def send(self) -> Response:
-        response = Session().request(
+        cassette = active_cassette()
+        if cassette is not None:
+            key = cassette_key(
+                self._method, self._path, self._params, self._data, self._json
+            )
+            replayed = cassette.replay(key)
+            if replayed is not None:
+                return replayed
+        url = self._prepare_url()
+        headers = self._headers
+        cache = active_cache() if self._cacheable and self._method == "GET" else None
+        if cache is not None:
+            entry_key = cache_key(url, self._params)
+            entry = cache.get(entry_key)
+            if entry is not None and entry.fresh:
+                return response_from_dict(entry.response)
+            if entry is not None:
+                headers = {**self._headers, **entry.validators()}
+        session = (self._session_pool or get_session_pool()).session_for(url)
+        policy = self._retry_policy or get_default_retry_policy()
+        allowed_retries = policy.allowed_retries(self._method, self._idempotent)
+        retries = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self._send_once(session, url, headers)
+            except (RequestsConnectionError, Timeout):
+                if retries >= allowed_retries:
+                    raise
+                retries += 1
+                time.sleep(policy.delay(retries))
+                continue
+            if response.status_code in policy.statuses and retries < allowed_retries:
+                retries += 1
+                time.sleep(policy.delay(retries, response))
+                continue
+            break
+        get_api_metrics().record(
+            self._method, self._path, response, time.perf_counter() - started, retries
+        )
+        if cache is not None:
+            if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                response = cache.renew(entry_key, entry, self._cache_ttl)
+            else:
+                cache.count_miss()
+                if storable(response):
+                    cache.store(entry_key, response, self._cache_ttl)
+        if cassette is not None:
+            cassette.record(key, response)
+        return response
+
+    def _send_once(self, session: Session, url: str, headers: dict) -> Response:
+        return session.request(
             method=self._method,
-            url=self._prepare_url(),
-            headers=self._headers,
+            url=url,
+            headers=headers,
             params=self._params,
             cookies=self._cookies,
             json=self._json,
@@ -95,4 +201,3 @@ class Request:
             verify=False,
             allow_redirects=self._allow_redirects,
         )
-        return response
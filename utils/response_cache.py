@@ -0,0 +1,194 @@
+"""Opt-in cache for read-only GET endpoints (e.g. the product catalog).
+
+Only requests marked with ``Request.cache()`` are cached, and only while a
+cache is activated (``--api-cache``). Entries live in an in-memory LRU with a
+TTL; with a shared ``disk_dir`` every entry is also written there, so other
+xdist workers pick it up instead of downloading it again. Once an entry is
+stale it is revalidated with ``If-None-Match``/``If-Modified-Since`` when the
+server sent an ETag/Last-Modified, and a 304 simply renews it.
+
+The site answers errors with HTTP 200 and the real status in the body's
+``responseCode``, so only answers that are 200 in both are ``storable``: one
+transient error must not be served to every test for the whole TTL.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from pathlib import Path
+
+from requests import Response
+
+from utils.api_metrics import response_code
+from utils.response_codec import response_from_dict, response_to_dict
+from utils.stats import SummedStats
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass
+class CacheStats(SummedStats):
+    TITLE = "API response cache"
+
+    hits: int = 0
+    disk_hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} hits ({self.disk_hits} from the shared disk tier), "
+            f"{self.revalidated} revalidated (304), {self.misses} fetched"
+        )
+
+
+@dataclass
+class CacheEntry:
+    response: dict
+    expires_at: float
+    etag: str = None
+    last_modified: str = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict:
+        """Headers for a conditional request; empty if the server sent none."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def storable(response: Response) -> bool:
+    """HTTP 200 and, for a JSON API answer, ``responseCode`` 200 too."""
+    return (
+        response.status_code == HTTPStatus.OK
+        and response_code(response) == HTTPStatus.OK
+    )
+
+
+def cache_key(url: str, params: dict = None) -> str:
+    return f"GET {url} {json.dumps(params, sort_keys=True, default=str)}"
+
+
+class ResponseCache:
+    """
+    Args:
+        ttl: Seconds an entry is served without asking the server.
+        max_entries: In-memory LRU size.
+        disk_dir: Optional directory shared by all workers of a run.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_dir: Path = None,
+    ):
+        self.ttl = ttl
+        self._max_entries = max_entries
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        if self._disk_dir:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key`` (possibly stale), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None or not entry.fresh:
+            disk_entry = self._read_disk(key)
+            if disk_entry is not None and (entry is None or disk_entry.fresh):
+                entry = disk_entry
+                self._put_memory(key, entry)
+                if entry.fresh:
+                    # A disk hit is a hit too: disk_hits is the share of hits
+                    self._count("hits", "disk_hits")
+                    return entry
+        if entry is not None and entry.fresh:
+            self._count("hits")
+        return entry
+
+    def store(self, key: str, response: Response, ttl: float = None) -> None:
+        entry = CacheEntry(
+            response=response_to_dict(response),
+            expires_at=time.time() + (self.ttl if ttl is None else ttl),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self._put_memory(key, entry)
+        self._write_disk(key, entry)
+
+    def renew(self, key: str, entry: CacheEntry, ttl: float = None) -> Response:
+        """The server answered 304: extend the entry and serve it."""
+        entry.expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        self._put_memory(key, entry)
+        self._write_disk(key, entry)
+        self._count("revalidated")
+        return response_from_dict(entry.response)
+
+    def count_miss(self) -> None:
+        self._count("misses")
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._stats.as_dict())
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    def _put_memory(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self._disk_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _read_disk(self, key: str) -> CacheEntry | None:
+        if self._disk_dir is None:
+            return None
+        try:
+            return CacheEntry(**json.loads(self._disk_path(key).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        if self._disk_dir is None:
+            return
+        # Write + rename is atomic, so other workers never read half a file
+        path = self._disk_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(asdict(entry)))
+        os.replace(tmp, path)
+
+
+_active: ResponseCache | None = None
+
+
+def activate(cache: ResponseCache | None) -> None:
+    """Enable caching of ``Request.cache()`` calls in this process."""
+    global _active
+    _active = cache
+
+
+def active_cache() -> ResponseCache | None:
+    return _active
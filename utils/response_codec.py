@@ -0,0 +1,42 @@
+import base64
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# requests already decoded the body, so these would describe bytes we no longer have
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+
+def response_to_dict(response: Response) -> dict:
+    """Serialize a ``requests.Response`` into a JSON-friendly dict."""
+    try:
+        body, encoding = response.content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        body, encoding = base64.b64encode(response.content).decode("ascii"), "base64"
+    return {
+        "status": response.status_code,
+        "reason": response.reason,
+        "url": response.url,
+        "headers": {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in _DROPPED_HEADERS
+        },
+        "body": body,
+        "body_encoding": encoding,
+    }
+
+
+def response_from_dict(data: dict) -> Response:
+    """Rebuild a ``requests.Response`` serialized by ``response_to_dict``."""
+    response = Response()
+    response.status_code = data["status"]
+    response.reason = data.get("reason", "")
+    response.url = data.get("url", "")
+    response.headers = CaseInsensitiveDict(data.get("headers", {}))
+    if data.get("body_encoding") == "base64":
+        response._content = base64.b64decode(data["body"])
+    else:
+        response._content = data["body"].encode("utf-8")
+    response.encoding = "utf-8"
+    return response
@@ -0,0 +1,78 @@
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+# Methods that can be resent without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how ``Request.send`` retries a transient failure.
+
+    Connection errors, timeouts and ``statuses`` are retried up to
+    ``max_retries`` times for ``methods``. Other methods (POST, PATCH) are only
+    retried when the call opts in with ``Request.retry(idempotent=True)``.
+    The wait before retry ``n`` is a random value between 0 and
+    ``min(backoff_max, backoff_base * 2 ** (n - 1))`` ("full jitter"), unless
+    the server sent ``Retry-After``, which is honoured up to ``retry_after_max``.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.25
+    backoff_max: float = 4.0
+    retry_after_max: float = 30.0
+    statuses: frozenset = field(default=RETRY_STATUSES)
+    methods: frozenset = field(default=IDEMPOTENT_METHODS)
+
+    def allowed_retries(self, method, idempotent: bool = False) -> int:
+        method = str(getattr(method, "value", method)).upper()
+        return self.max_retries if idempotent or method in self.methods else 0
+
+    def delay(self, retry: int, response=None) -> float:
+        """Seconds to wait before retry number ``retry`` (1-based)."""
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def _retry_after(response) -> float | None:
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+_default_policy = RetryPolicy()
+
+
+def get_default_retry_policy() -> RetryPolicy:
+    return _default_policy
+
+
+def set_default_retry_policy(policy: RetryPolicy) -> None:
+    """Change the policy used by every ``Request`` without its own ``.retry()``."""
+    global _default_policy
+    _default_policy = policy
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+
+# Catalog served by the local stand-in server (utils/standin_server.py).
+# Names, prices and categories follow the first products of the real site.
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    name: str
+    price: int
+    brand: str
+    usertype: str
+    category: str
+    availability: str = "In Stock"
+    condition: str = "New"
+
+    @property
+    def price_text(self) -> str:
+        return f"Rs. {self.price}"
+
+    @property
+    def category_text(self) -> str:
+        return f"{self.usertype} > {self.category}"
+
+    @classmethod
+    def from_api_dict(cls, data: dict) -> "Product":
+        """Inverse of ``as_api_dict`` (e.g. a productsList item of the real API)."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            price=int(data["price"].replace("Rs.", "").replace(",", "").strip()),
+            brand=data["brand"],
+            usertype=data["category"]["usertype"]["usertype"],
+            category=data["category"]["category"],
+        )
+
+    def as_api_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "price": self.price_text,
+            "brand": self.brand,
+            "category": {
+                "usertype": {"usertype": self.usertype},
+                "category": self.category,
+            },
+        }
+
+
+PRODUCTS = [
+    Product(1, "Blue Top", 500, "Polo", "Women", "Tops"),
+    Product(2, "Men Tshirt", 400, "H&M", "Men", "Tshirts"),
+    Product(3, "Sleeveless Dress", 1000, "Madame", "Women", "Dress"),
+    Product(4, "Stylish Dress", 1500, "Madame", "Women", "Dress"),
+    Product(5, "Winter Top", 600, "Mast & Harbour", "Women", "Tops"),
+    Product(6, "Summer White Top", 400, "H&M", "Women", "Tops"),
+    Product(7, "Madame Top For Women", 1000, "Madame", "Women", "Tops"),
+    Product(8, "Fancy Green Top", 700, "Polo", "Women", "Tops"),
+    Product(11, "Sleeves Printed Top - White", 499, "Polo", "Women", "Tops"),
+    Product(
+        12, "Half Sleeves Top Schiffli Detailing - Pink", 359, "Biba", "Women", "Tops"
+    ),
+    Product(13, "Frozen Tops For Kids", 278, "Babyhug", "Kids", "Tops & Shirts"),
+    Product(14, "Full Sleeves Top Cherry - Pink", 679, "Biba", "Women", "Tops"),
+]
+
+PRODUCTS_BY_ID = {product.id: product for product in PRODUCTS}
+
+BRANDS = [
+    "Polo",
+    "H&M",
+    "Madame",
+    "Mast & Harbour",
+    "Babyhug",
+    "Allen Solly Junior",
+    "Kookie Kids",
+    "Biba",
+]
@@ -0,0 +1,294 @@
+"""Minimal HTML for the pages our page objects drive, served by the stand-in.
+
+Only the markup that ``pages/`` and ``components/`` select on is reproduced:
+the shop menu, product cards with hover overlay, the add-to-cart modal, the
+product information block, the cart table, the login/signup forms, the
+account-deleted page and the consent overlay.
+"""
+
+from html import escape
+
+from utils.standin_data import Product
+
+CONSENT_COOKIE = "standin_consent"
+
+_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+.shop-menu ul { list-style: none; display: flex; gap: 16px; }
+.features_items { display: flex; flex-wrap: wrap; }
+.col-sm-4 { width: 30%; margin: 8px; }
+.product-image-wrapper { position: relative; border: 1px solid #eee; }
+.single-products { position: relative; }
+.productinfo { text-align: center; padding: 12px; }
+.productinfo img { width: 120px; height: 120px; }
+.product-overlay { display: none; position: absolute; inset: 0;
+  background: #fe980f; text-align: center; }
+.product-image-wrapper:hover .product-overlay { display: block; }
+.modal { display: none; position: fixed; inset: 0; background: rgba(0,0,0,.4); }
+.modal.show { display: block; }
+.modal-content { background: #fff; width: 300px; margin: 100px auto; padding: 16px; }
+.fc-consent-root { position: fixed; inset: 0; background: rgba(0,0,0,.5);
+  z-index: 1000; }
+.fc-dialog { background: #fff; width: 400px; margin: 200px auto; padding: 16px; }
+"""
+
+_CONSENT = f"""
+<div class="fc-consent-root" id="consent-overlay">
+  <div class="fc-dialog">
+    <p>This site asks for consent to use your data</p>
+    <button class="fc-button fc-cta-consent fc-primary-button" aria-label="Consent"
+      onclick="document.cookie='{CONSENT_COOKIE}=1; path=/; max-age=31536000';
+               document.getElementById('consent-overlay').remove();">
+      <p class="fc-button-label">Consent</p>
+    </button>
+  </div>
+</div>
+"""
+
+_CART_MODAL = """
+<div class="modal" id="cartModal">
+  <div class="modal-dialog modal-confirm">
+    <div class="modal-content">
+      <div class="modal-header"><h4 class="modal-title w-100">Added!</h4></div>
+      <div class="modal-body">
+        <p class="text-center">Your product has been added to cart.</p>
+        <p class="text-center"><a href="/view_cart"><u>View Cart</u></a></p>
+      </div>
+      <div class="modal-footer">
+        <button class="btn btn-success close-modal btn-block" data-dismiss="modal"
+          onclick="document.getElementById('cartModal').classList.remove('show')">
+          Continue Shopping
+        </button>
+      </div>
+    </div>
+  </div>
+</div>
+<script>
+async function addToCart(productId, quantity) {
+  await fetch(`/add_to_cart/${productId}?quantity=${quantity}`);
+  document.getElementById("cartModal").classList.add("show");
+}
+</script>
+"""
+
+
+def _layout(title: str, body: str, logged_in_as: str = None, consent=False) -> str:
+    if logged_in_as:
+        account_links = (
+            '<li><a href="/logout">Logout</a></li>'
+            '<li><a href="/delete_account">Delete Account</a></li>'
+            f"<li><a>Logged in as <b>{escape(logged_in_as)}</b></a></li>"
+        )
+    else:
+        account_links = '<li><a href="/login">Signup / Login</a></li>'
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{escape(title)}</title><style>{_STYLE}</style></head>
+<body>
+<header id="header">
+  <div class="shop-menu pull-right">
+    <ul class="nav navbar-nav">
+      <li><a href="/">Home</a></li>
+      <li><a href="/products">Products</a></li>
+      <li><a href="/view_cart">Cart</a></li>
+      {account_links}
+      <li><a href="/test_cases">Test Cases</a></li>
+      <li><a href="/api_list">API Testing</a></li>
+      <li><a href="/video_tutorials">Video Tutorials</a></li>
+      <li><a href="/contact_us">Contact us</a></li>
+    </ul>
+  </div>
+</header>
+{body}
+{_CONSENT if consent else ""}
+</body>
+</html>"""
+
+
+def _product_card(product: Product) -> str:
+    name = escape(product.name)
+    button = (
+        f'<a href="#" data-product-id="{product.id}" class="btn btn-default '
+        f'add-to-cart" onclick="addToCart({product.id}, 1); return false;">'
+        "Add to cart</a>"
+    )
+    return f"""
+<div class="col-sm-4">
+  <div class="product-image-wrapper">
+    <div class="single-products">
+      <div class="productinfo text-center">
+        <img src="/get_product_picture/{product.id}" alt="ecommerce website products">
+        <h2>{product.price_text}</h2>
+        <p>{name}</p>
+        {button}
+      </div>
+      <div class="product-overlay">
+        <div class="overlay-content">
+          <h2>{product.price_text}</h2>
+          <p>{name}</p>
+          {button}
+        </div>
+      </div>
+    </div>
+    <div class="choose">
+      <ul class="nav nav-pills nav-justified">
+        <li><a href="/product_details/{product.id}">View Product</a></li>
+      </ul>
+    </div>
+  </div>
+</div>"""
+
+
+def render_home(products, logged_in_as=None, consent=False) -> str:
+    cards = "".join(_product_card(product) for product in products)
+    body = f"""
+<section>
+  <div class="features_items">
+    <h2 class="title text-center">Features Items</h2>
+    {cards}
+  </div>
+</section>
+{_CART_MODAL}"""
+    return _layout("Automation Exercise", body, logged_in_as, consent)
+
+
+def render_product_details(product: Product, logged_in_as=None, consent=False) -> str:
+    body = f"""
+<section>
+  <div class="product-details">
+    <div class="view-product">
+      <img src="/get_product_picture/{product.id}" alt="ecommerce website products">
+    </div>
+    <div class="product-information">
+      <h2>{escape(product.name)}</h2>
+      <p>Category: {escape(product.category_text)}</p>
+      <span>
+        <span>{product.price_text}</span>
+        <label>Quantity:</label>
+        <input id="quantity" name="quantity" type="number" value="1">
+        <button type="button" class="btn btn-default cart"
+          onclick="addToCart({product.id}, document.getElementById('quantity').value)">
+          Add to cart
+        </button>
+      </span>
+      <p><b>Availability:</b> {escape(product.availability)}</p>
+      <p><b>Condition:</b> {escape(product.condition)}</p>
+      <p><b>Brand:</b> {escape(product.brand)}</p>
+    </div>
+  </div>
+</section>
+{_CART_MODAL}"""
+    return _layout("Automation Exercise - Product Details", body, logged_in_as, consent)
+
+
+def _cart_row(product: Product, quantity: int) -> str:
+    return f"""
+<tr id="product-{product.id}">
+  <td class="cart_product">
+    <a href="/product_details/{product.id}">
+      <img src="/get_product_picture/{product.id}" alt="Product Image">
+    </a>
+  </td>
+  <td class="cart_description">
+    <h4><a href="/product_details/{product.id}">{escape(product.name)}</a></h4>
+    <p>{escape(product.category_text)}</p>
+  </td>
+  <td class="cart_price"><p>{product.price_text}</p></td>
+  <td class="cart_quantity"><button class="disabled">{quantity}</button></td>
+  <td class="cart_total">
+    <p class="cart_total_price">Rs. {product.price * quantity}</p>
+  </td>
+  <td class="cart_delete">
+    <a class="cart_quantity_delete" data-product-id="{product.id}"
+      onclick="fetch('/delete_cart/{product.id}')
+               .then(() => document.getElementById('product-{product.id}').remove())">
+      <i class="fa fa-times">x</i>
+    </a>
+  </td>
+</tr>"""
+
+
+def render_cart_rows(lines) -> str:
+    """Cart table rows; lines: iterable of (Product, quantity)."""
+    return "".join(_cart_row(product, quantity) for product, quantity in lines)
+
+
+def render_cart(lines, logged_in_as=None, consent=False) -> str:
+    """lines: iterable of (Product, quantity)."""
+    rows = render_cart_rows(lines)
+    body = f"""
+<section id="cart_items">
+  <div class="table-responsive cart_info">
+    <table class="table table-condensed" id="cart_info_table">
+      <thead>
+        <tr class="cart_menu">
+          <td class="image">Item</td><td class="description">Description</td>
+          <td class="price">Price</td><td class="quantity">Quantity</td>
+          <td class="total">Total</td><td></td>
+        </tr>
+      </thead>
+      <tbody>{rows}</tbody>
+    </table>
+  </div>
+</section>"""
+    return _layout("Automation Exercise - Checkout", body, logged_in_as, consent)
+
+
+def render_login(csrf_token: str, error: str = "", consent=False) -> str:
+    error_html = f'<p style="color: red;">{escape(error)}</p>' if error else ""
+    body = f"""
+<section id="form">
+  <div class="login-form">
+    <h2>Login to your account</h2>
+    <form action="/login" method="POST">
+      <input type="hidden" name="csrfmiddlewaretoken" value="{csrf_token}">
+      <input type="email" data-qa="login-email" placeholder="Email Address"
+        name="email" required>
+      <input type="password" data-qa="login-password" placeholder="Password"
+        name="password" required>
+      {error_html}
+      <button type="submit" data-qa="login-button">Login</button>
+    </form>
+  </div>
+  <div class="signup-form">
+    <h2>New User Signup!</h2>
+    <form action="/signup" method="POST">
+      <input type="hidden" name="csrfmiddlewaretoken" value="{csrf_token}">
+      <input type="text" data-qa="signup-name" placeholder="Name" name="name" required>
+      <input type="email" data-qa="signup-email" placeholder="Email Address"
+        name="email" required>
+      <button type="submit" data-qa="signup-button">Signup</button>
+    </form>
+  </div>
+</section>"""
+    return _layout("Automation Exercise - Signup / Login", body, consent=consent)
+
+
+def render_signup(name: str, email: str) -> str:
+    body = f"""
+<section id="form">
+  <h2 class="title text-center"><b>Enter Account Information</b></h2>
+  <input data-qa="name" name="name" value="{escape(name)}">
+  <input data-qa="email" name="email" value="{escape(email)}" disabled>
+</section>"""
+    return _layout("Automation Exercise - Signup", body)
+
+
+def render_account_deleted() -> str:
+    body = """
+<section>
+  <h2 class="title text-center" data-qa="account-deleted"><b>Account Deleted!</b></h2>
+  <p>Your account has been permanently deleted!</p>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return _layout("Automation Exercise - Account Deleted", body)
+
+
+def render_not_found(path: str) -> str:
+    return _layout("Not Found", f"<h2>Page not found: {escape(path)}</h2>")
+
+
+PRODUCT_PICTURE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="120" height="120">'
+    '<rect width="120" height="120" fill="#f0f0e9"/></svg>'
+)
@@ -0,0 +1,585 @@
+"""Local stand-in for automationexercise.com, built on ``asyncio`` streams.
+
+Implements the API endpoints wrapped in ``utils/api_requests.py`` (same JSON
+bodies and ``responseCode`` values as the real site, always with HTTP 200)
+and the pages driven by ``pages/`` and ``components/``. All state (accounts,
+sessions, carts) is in memory. The server runs its own event loop in a daemon
+thread, speaks HTTP/1.1 keep-alive and serves any number of concurrent
+connections, so one instance can back every xdist worker of a run.
+
+Usage:
+    server = StandinServer().start()
+    os.environ["ADDRESS"] = server.address
+    ...
+    server.stop()
+"""
+
+import asyncio
+import json
+import secrets
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qsl, urlsplit
+
+from utils.standin_data import BRANDS, PRODUCTS, PRODUCTS_BY_ID
+from utils.standin_pages import (
+    CONSENT_COOKIE,
+    PRODUCT_PICTURE,
+    render_account_deleted,
+    render_cart,
+    render_home,
+    render_login,
+    render_not_found,
+    render_product_details,
+    render_signup,
+)
+
+SESSION_COOKIE = "sessionid"
+
+ACCOUNT_FIELDS = (
+    "name",
+    "email",
+    "password",
+    "title",
+    "birth_date",
+    "birth_month",
+    "birth_year",
+    "firstname",
+    "lastname",
+    "company",
+    "address1",
+    "address2",
+    "country",
+    "zipcode",
+    "state",
+    "city",
+    "mobile_number",
+)
+
+_METHOD_NOT_SUPPORTED = {
+    "responseCode": HTTPStatus.METHOD_NOT_ALLOWED,
+    "message": "This request method is not supported.",
+}
+
+
+@dataclass
+class StandinRequest:
+    method: str
+    path: str
+    query: dict
+    headers: dict
+    body: bytes
+
+    @property
+    def cookies(self) -> dict:
+        cookie = SimpleCookie(self.headers.get("cookie", ""))
+        return {key: morsel.value for key, morsel in cookie.items()}
+
+    @property
+    def form(self) -> dict:
+        """POST/PUT/DELETE parameters, form-encoded or JSON."""
+        if not self.body:
+            return {}
+        if self.headers.get("content-type", "").startswith("application/json"):
+            return json.loads(self.body)
+        return dict(parse_qsl(self.body.decode("utf-8"), keep_blank_values=True))
+
+
+@dataclass
+class StandinResponse:
+    body: str | bytes = ""
+    status: int = HTTPStatus.OK
+    content_type: str = "text/html; charset=utf-8"
+    headers: list = field(default_factory=list)
+
+    @classmethod
+    def api(cls, payload: dict) -> "StandinResponse":
+        # The real API always answers 200 and carries the status in the body
+        return cls(json.dumps(payload), content_type="application/json")
+
+    @classmethod
+    def redirect(cls, location: str) -> "StandinResponse":
+        return cls(status=HTTPStatus.FOUND, headers=[("Location", location)])
+
+
+@dataclass
+class Session:
+    cart: dict = field(default_factory=dict)  # product id -> quantity
+    user_email: str = None
+    csrf_token: str = field(default_factory=lambda: secrets.token_hex(16))
+
+
+class StandinState:
+    """Accounts, browser sessions and carts of one stand-in instance."""
+
+    def __init__(self):
+        self.accounts: dict[str, dict] = {}
+        self.sessions: dict[str, Session] = {}
+
+    def session_for(self, request: StandinRequest) -> tuple[str, Session, bool]:
+        """Return (session id, session, is_new)."""
+        session_id = request.cookies.get(SESSION_COOKIE)
+        if session_id in self.sessions:
+            return session_id, self.sessions[session_id], False
+        session_id = secrets.token_hex(16)
+        self.sessions[session_id] = Session()
+        return session_id, self.sessions[session_id], True
+
+
+class StandinServer:
+    """
+    Args:
+        host: Interface to bind.
+        port: Port to bind; ``0`` picks a free ephemeral port.
+        consent_popup: Show the consent overlay until it is accepted.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, consent_popup=True):
+        self._host = host
+        self._port = port
+        self.consent_popup = consent_popup
+        self.state = StandinState()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._writers = set()
+        self._api_routes = {
+            "/api/productsList": self._products_list,
+            "/api/brandsList": self._brands_list,
+            "/api/searchProduct": self._search_product,
+            "/api/verifyLogin": self._verify_login,
+            "/api/createAccount": self._create_account,
+            "/api/deleteAccount": self._delete_account,
+            "/api/updateAccount": self._update_account,
+            "/api/getUserDetailByEmail": self._get_user_detail_by_email,
+        }
+        self._page_routes = {
+            "/": self._home,
+            "/products": self._home,
+            "/login": self._login,
+            "/signup": self._signup,
+            "/logout": self._logout,
+            "/delete_account": self._delete_account_page,
+            "/view_cart": self._view_cart,
+        }
+        self._prefix_routes = {
+            "/product_details/": self._product_details,
+            "/add_to_cart/": self._add_to_cart,
+            "/delete_cart/": self._delete_cart,
+            "/get_product_picture/": self._product_picture,
+        }
+
+    # ---- lifecycle ---------------------------------------------------------
+
+    @property
+    def address(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def start(self) -> "StandinServer":
+        """Start serving in a daemon thread; returns once the port is bound."""
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._serve, args=(ready,), name="standin-server", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def _serve(self, ready: threading.Event) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_connection, self._host, self._port)
+        )
+        self._port = self._server.sockets[0].getsockname()[1]
+        ready.set()
+        self._loop.run_forever()
+        # Idle keep-alive connections would block Server.wait_closed(): closing
+        # their transports makes the pending reads hit EOF and the handlers exit
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        self._loop.run_until_complete(self._server.wait_closed())
+        self._loop.close()
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop = None
+
+    # ---- HTTP/1.1 ----------------------------------------------------------
+
+    async def _handle_connection(self, reader, writer) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                # A request that could not be read leaves the stream unusable
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = (
+                        request.headers.get("connection", "").lower() != "close"
+                    )
+                    response = self.dispatch(request)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as error:
+                    # E.g. a malformed request line or a JSON body that does not
+                    # parse: answer 500 like a real server instead of hanging up
+                    response = StandinResponse(
+                        f"{type(error).__name__}: {error}",
+                        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                        content_type="text/plain; charset=utf-8",
+                    )
+                await self._write_response(writer, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader) -> StandinRequest | None:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        body = await reader.readexactly(length) if length else b""
+        url = urlsplit(target)
+        return StandinRequest(
+            method=method.upper(),
+            path=url.path,
+            query=dict(parse_qsl(url.query, keep_blank_values=True)),
+            headers=headers,
+            body=body,
+        )
+
+    @staticmethod
+    async def _write_response(writer, response: StandinResponse, keep_alive) -> None:
+        body = response.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        status = HTTPStatus(response.status)
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {response.content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+            *(f"{name}: {value}" for name, value in response.headers),
+        ]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    def dispatch(self, request: StandinRequest) -> StandinResponse:
+        handler = self._api_routes.get(request.path)
+        if handler is not None:
+            return handler(request)
+        session_id, session, is_new = self.state.session_for(request)
+        handler = self._page_routes.get(request.path)
+        arg = None
+        if handler is None:
+            for prefix, prefix_handler in self._prefix_routes.items():
+                if request.path.startswith(prefix):
+                    handler = prefix_handler
+                    arg = request.path.removeprefix(prefix)
+                    break
+        if handler is None:
+            response = StandinResponse(
+                render_not_found(request.path), status=HTTPStatus.NOT_FOUND
+            )
+        elif arg is None:
+            response = handler(request, session)
+        else:
+            response = handler(request, session, arg)
+        if is_new:
+            response.headers.append(
+                ("Set-Cookie", f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly")
+            )
+        return response
+
+    # ---- API ---------------------------------------------------------------
+
+    def _products_list(self, request):
+        if request.method != "GET":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        return StandinResponse.api(
+            {
+                "responseCode": HTTPStatus.OK,
+                "products": [p.as_api_dict() for p in PRODUCTS],
+            }
+        )
+
+    def _brands_list(self, request):
+        if request.method != "GET":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        return StandinResponse.api(
+            {
+                "responseCode": HTTPStatus.OK,
+                "brands": [
+                    {"id": i, "brand": brand} for i, brand in enumerate(BRANDS, 1)
+                ],
+            }
+        )
+
+    def _search_product(self, request):
+        if request.method != "POST":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        term = request.form.get("search_product")
+        if term is None:
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.BAD_REQUEST,
+                    "message": "Bad request, search_product parameter is missing "
+                    "in POST request.",
+                }
+            )
+        term = term.lower()
+        found = [
+            p.as_api_dict()
+            for p in PRODUCTS
+            if term in p.name.lower() or term in p.category_text.lower()
+        ]
+        return StandinResponse.api({"responseCode": HTTPStatus.OK, "products": found})
+
+    def _verify_login(self, request):
+        if request.method != "POST":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        form = request.form
+        if not form.get("email") or not form.get("password"):
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.BAD_REQUEST,
+                    "message": "Bad request, email or password parameter is "
+                    "missing in POST request.",
+                }
+            )
+        account = self.state.accounts.get(form["email"])
+        if account is None or account["password"] != form["password"]:
+            return StandinResponse.api(
+                {"responseCode": HTTPStatus.NOT_FOUND, "message": "User not found!"}
+            )
+        return StandinResponse.api(
+            {"responseCode": HTTPStatus.OK, "message": "User exists!"}
+        )
+
+    def _create_account(self, request):
+        if request.method != "POST":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        form = request.form
+        missing = [name for name in ACCOUNT_FIELDS if not form.get(name)]
+        if missing:
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.BAD_REQUEST,
+                    "message": f"Bad request, {missing[0]} parameter is missing "
+                    "in POST request.",
+                }
+            )
+        if form["email"] in self.state.accounts:
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.BAD_REQUEST,
+                    "message": "Email already exists!",
+                }
+            )
+        self.state.accounts[form["email"]] = {
+            name: form[name] for name in ACCOUNT_FIELDS
+        }
+        return StandinResponse.api(
+            {"responseCode": HTTPStatus.CREATED, "message": "User created!"}
+        )
+
+    def _delete_account(self, request):
+        if request.method != "DELETE":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        form = request.form
+        account = self.state.accounts.get(form.get("email"))
+        if account is None or account["password"] != form.get("password"):
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.NOT_FOUND,
+                    "message": "Account not found!",
+                }
+            )
+        del self.state.accounts[form["email"]]
+        return StandinResponse.api(
+            {"responseCode": HTTPStatus.OK, "message": "Account deleted!"}
+        )
+
+    def _update_account(self, request):
+        if request.method != "PUT":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        form = request.form
+        account = self.state.accounts.get(form.get("email"))
+        if account is None or account["password"] != form.get("password"):
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.NOT_FOUND,
+                    "message": "Account not found!",
+                }
+            )
+        account.update({k: v for k, v in form.items() if k in ACCOUNT_FIELDS})
+        return StandinResponse.api(
+            {"responseCode": HTTPStatus.OK, "message": "User updated!"}
+        )
+
+    def _get_user_detail_by_email(self, request):
+        if request.method != "GET":
+            return StandinResponse.api(_METHOD_NOT_SUPPORTED)
+        email = request.query.get("email")
+        if not email:
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.BAD_REQUEST,
+                    "message": "Bad request, email parameter is missing in GET "
+                    "request.",
+                }
+            )
+        account = self.state.accounts.get(email)
+        if account is None:
+            return StandinResponse.api(
+                {
+                    "responseCode": HTTPStatus.NOT_FOUND,
+                    "message": "Account not found with this email, try another "
+                    "email!",
+                }
+            )
+        emails = list(self.state.accounts)
+        user = {
+            "id": emails.index(email) + 1,
+            "name": account["name"],
+            "email": email,
+            "title": account["title"],
+            "birth_day": account["birth_date"],
+            "birth_month": account["birth_month"],
+            "birth_year": account["birth_year"],
+            "first_name": account["firstname"],
+            "last_name": account["lastname"],
+            "company": account["company"],
+            "address1": account["address1"],
+            "address2": account["address2"],
+            "country": account["country"],
+            "state": account["state"],
+            "city": account["city"],
+            "zipcode": account["zipcode"],
+        }
+        return StandinResponse.api({"responseCode": HTTPStatus.OK, "user": user})
+
+    # ---- pages -------------------------------------------------------------
+
+    def _show_consent(self, request) -> bool:
+        return self.consent_popup and CONSENT_COOKIE not in request.cookies
+
+    def _logged_in_as(self, session: Session) -> str | None:
+        account = self.state.accounts.get(session.user_email)
+        return account["name"] if account else None
+
+    def _home(self, request, session):
+        return StandinResponse(
+            render_home(
+                PRODUCTS, self._logged_in_as(session), self._show_consent(request)
+            )
+        )
+
+    def _product_details(self, request, session, product_id):
+        product = PRODUCTS_BY_ID.get(int(product_id)) if product_id.isdigit() else None
+        if product is None:
+            return StandinResponse(
+                render_not_found(request.path), status=HTTPStatus.NOT_FOUND
+            )
+        return StandinResponse(
+            render_product_details(
+                product, self._logged_in_as(session), self._show_consent(request)
+            )
+        )
+
+    def _add_to_cart(self, request, session, product_id):
+        if not product_id.isdigit() or int(product_id) not in PRODUCTS_BY_ID:
+            return StandinResponse("Product not found", status=HTTPStatus.NOT_FOUND)
+        quantity = request.query.get("quantity", "1")
+        quantity = int(quantity) if quantity.isdigit() and int(quantity) > 0 else 1
+        session.cart[int(product_id)] = session.cart.get(int(product_id), 0) + quantity
+        return StandinResponse("Added To Cart", content_type="text/plain")
+
+    def _delete_cart(self, request, session, product_id):
+        session.cart.pop(int(product_id) if product_id.isdigit() else None, None)
+        return StandinResponse("Deleted", content_type="text/plain")
+
+    def _view_cart(self, request, session):
+        lines = [(PRODUCTS_BY_ID[pid], qty) for pid, qty in session.cart.items()]
+        return StandinResponse(
+            render_cart(lines, self._logged_in_as(session), self._show_consent(request))
+        )
+
+    def _product_picture(self, request, session, product_id):
+        return StandinResponse(PRODUCT_PICTURE, content_type="image/svg+xml")
+
+    def _login(self, request, session):
+        if request.method == "POST":
+            form = request.form
+            account = self.state.accounts.get(form.get("email"))
+            if (
+                form.get("csrfmiddlewaretoken") == session.csrf_token
+                and account is not None
+                and account["password"] == form.get("password")
+            ):
+                session.user_email = form["email"]
+                return StandinResponse.redirect("/")
+            return StandinResponse(
+                render_login(
+                    session.csrf_token,
+                    "Your email or password is incorrect!",
+                    self._show_consent(request),
+                )
+            )
+        return StandinResponse(
+            render_login(session.csrf_token, consent=self._show_consent(request))
+        )
+
+    def _signup(self, request, session):
+        form = request.form
+        return StandinResponse(
+            render_signup(form.get("name", ""), form.get("email", ""))
+        )
+
+    def _logout(self, request, session):
+        session.user_email = None
+        return StandinResponse.redirect("/login")
+
+    def _delete_account_page(self, request, session):
+        if session.user_email is None:
+            return StandinResponse.redirect("/login")
+        self.state.accounts.pop(session.user_email, None)
+        session.user_email = None
+        return StandinResponse(render_account_deleted())
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Serve the local stand-in site.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = StandinServer(args.host, args.port).start()
+    print(f"Stand-in server running on {server.address} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,55 @@
+"""Counters kept per process and summed over the xdist workers.
+
+Each feature that reports at the end of a run keeps a ``@dataclass`` of
+counters deriving from ``SummedStats``. Workers ship ``as_dict()`` to the
+controller (see ``publish_stats`` in tests/conftest_helpers.py), which rebuilds
+them with ``from_dict()``, adds them up with ``merge()`` and prints
+``summary()`` under ``title``.
+"""
+
+from dataclasses import fields
+
+
+class SummedStats:
+    """Base of the counter dataclasses: numbers are summed, dicts are summed
+    per key, and the fields named in ``MAX_FIELDS`` keep the larger value.
+    """
+
+    TITLE = ""  # section of the end-of-run summary
+    MAX_FIELDS = ()
+
+    def merge(self, other):
+        merged = {}
+        for field in fields(self):
+            mine, theirs = getattr(self, field.name), getattr(other, field.name)
+            if field.name in self.MAX_FIELDS:
+                merged[field.name] = max(mine, theirs)
+            elif isinstance(mine, dict):
+                merged[field.name] = {
+                    key: mine.get(key, 0) + theirs.get(key, 0)
+                    for key in {**mine, **theirs}
+                }
+            else:
+                merged[field.name] = mine + theirs
+        return type(self)(**merged)
+
+    def as_dict(self) -> dict:
+        values = {field.name: getattr(self, field.name) for field in fields(self)}
+        return {
+            name: dict(value) if isinstance(value, dict) else value
+            for name, value in values.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Inverse of ``as_dict``; keys that are not fields are ignored."""
+        names = {field.name for field in fields(cls)}
+        return cls(**{name: value for name, value in data.items() if name in names})
+
+    @property
+    def title(self) -> str:
+        return self.TITLE
+
+    def summary(self) -> str | None:
+        """Line of the end-of-run summary; None when there is nothing to show."""
+        return None